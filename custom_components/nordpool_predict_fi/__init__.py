@@ -3,28 +3,49 @@ from __future__ import annotations
 #region setup
 
 from collections.abc import Mapping
-from datetime import timedelta
+from datetime import time, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_BASE_URL,
+    CONF_CALENDAR_DAILY_HOURS,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEADLINE_HOURS,
+    CONF_DEADLINE_TIME,
     CONF_EXTRA_FEES,
+    CONF_MAX_STALENESS,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MIRROR_URLS,
+    CONF_REQUEST_TIMEOUT,
     CONF_UPDATE_INTERVAL,
     DATA_COORDINATOR,
     DATA_UNSUB_LISTENER,
     DEFAULT_BASE_URL,
+    DEFAULT_CALENDAR_DAILY_HOURS,
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_DEADLINE_HOURS,
+    DEFAULT_DEADLINE_TIME,
     DEFAULT_EXTRA_FEES_CENTS,
+    DEFAULT_MAX_STALENESS_HOURS,
+    DEFAULT_MIN_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
     DOMAIN,
+    MAX_CALENDAR_DAILY_HOURS,
+    MAX_DEADLINE_HOURS,
     PLATFORMS,
 )
 from .coordinator import NordpoolPredictCoordinator
+from .services import async_setup_services
 
 type NordpoolConfigEntry = ConfigEntry
 
@@ -32,6 +53,7 @@ type NordpoolConfigEntry = ConfigEntry
 #region _bootstrap
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     return True
 
 
@@ -44,11 +66,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: NordpoolConfigEntry) ->
         hass=hass,
         entry_id=entry.entry_id,
         base_url=runtime_config[CONF_BASE_URL],
+        mirror_urls=runtime_config[CONF_MIRROR_URLS],
         update_interval=runtime_config[CONF_UPDATE_INTERVAL],
+        min_update_interval=runtime_config[CONF_MIN_UPDATE_INTERVAL],
+        max_staleness=runtime_config[CONF_MAX_STALENESS],
+        connect_timeout=runtime_config[CONF_CONNECT_TIMEOUT],
+        request_timeout=runtime_config[CONF_REQUEST_TIMEOUT],
         extra_fees_cents=runtime_config[CONF_EXTRA_FEES],
+        compact_attributes=runtime_config[CONF_COMPACT_ATTRIBUTES],
+        calendar_daily_hours=runtime_config[CONF_CALENDAR_DAILY_HOURS],
+        deadline_hours=runtime_config[CONF_DEADLINE_HOURS],
+        deadline_time=runtime_config[CONF_DEADLINE_TIME],
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Come up from the last good snapshot and revalidate it in the background,
+    # so a slow upstream never blocks startup.
+    if await coordinator.async_restore_snapshot():
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN}_refresh_{entry.entry_id}",
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
     coordinator.set_extra_fees_cents(runtime_config[CONF_EXTRA_FEES])
 
     unsub_options = entry.add_update_listener(async_update_entry)
@@ -109,28 +149,81 @@ async def async_update_entry(hass: HomeAssistant, entry: NordpoolConfigEntry) ->
 def _runtime_entry_config(entry: NordpoolConfigEntry) -> Mapping[str, Any]:
     result: dict[str, Any] = {
         CONF_BASE_URL: DEFAULT_BASE_URL,
+        CONF_MIRROR_URLS: [],
         CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+        CONF_MIN_UPDATE_INTERVAL: timedelta(minutes=DEFAULT_MIN_UPDATE_INTERVAL_MINUTES),
+        CONF_MAX_STALENESS: timedelta(hours=DEFAULT_MAX_STALENESS_HOURS),
+        CONF_CONNECT_TIMEOUT: timedelta(seconds=DEFAULT_CONNECT_TIMEOUT_SECONDS),
+        CONF_REQUEST_TIMEOUT: timedelta(seconds=DEFAULT_REQUEST_TIMEOUT_SECONDS),
         CONF_EXTRA_FEES: DEFAULT_EXTRA_FEES_CENTS,
+        CONF_COMPACT_ATTRIBUTES: DEFAULT_COMPACT_ATTRIBUTES,
+        CONF_CALENDAR_DAILY_HOURS: DEFAULT_CALENDAR_DAILY_HOURS,
+        CONF_DEADLINE_HOURS: DEFAULT_DEADLINE_HOURS,
+        CONF_DEADLINE_TIME: time.fromisoformat(DEFAULT_DEADLINE_TIME),
     }
 
+    def _minutes(value: Any) -> timedelta:
+        if isinstance(value, timedelta):
+            total_minutes = max(int(value.total_seconds() / 60), 1)
+        else:
+            total_minutes = max(int(value), 1)
+        return timedelta(minutes=total_minutes)
+
     def _normalize(data: Mapping[str, Any]) -> None:
         if CONF_BASE_URL in data:
             base_url = str(data[CONF_BASE_URL]).strip()
             if base_url.endswith("/"):
                 base_url = base_url[:-1]
             result[CONF_BASE_URL] = base_url or DEFAULT_BASE_URL
+        if CONF_MIRROR_URLS in data:
+            result[CONF_MIRROR_URLS] = [
+                mirror.strip().rstrip("/")
+                for mirror in str(data[CONF_MIRROR_URLS] or "").split(",")
+                if mirror.strip()
+            ]
         if CONF_UPDATE_INTERVAL in data:
-            minutes = data[CONF_UPDATE_INTERVAL]
-            if isinstance(minutes, timedelta):
-                total_minutes = max(int(minutes.total_seconds() / 60), 1)
+            result[CONF_UPDATE_INTERVAL] = _minutes(data[CONF_UPDATE_INTERVAL])
+        if CONF_MIN_UPDATE_INTERVAL in data:
+            result[CONF_MIN_UPDATE_INTERVAL] = _minutes(data[CONF_MIN_UPDATE_INTERVAL])
+        if CONF_MAX_STALENESS in data:
+            hours = data[CONF_MAX_STALENESS]
+            if isinstance(hours, timedelta):
+                result[CONF_MAX_STALENESS] = max(hours, timedelta(hours=1))
             else:
-                total_minutes = max(int(minutes), 1)
-            result[CONF_UPDATE_INTERVAL] = timedelta(minutes=total_minutes)
+                try:
+                    hours = int(hours)
+                except (TypeError, ValueError):
+                    hours = DEFAULT_MAX_STALENESS_HOURS
+                result[CONF_MAX_STALENESS] = timedelta(hours=max(hours, 1))
+        for key in (CONF_CONNECT_TIMEOUT, CONF_REQUEST_TIMEOUT):
+            if key in data:
+                seconds = data[key]
+                if isinstance(seconds, timedelta):
+                    seconds = seconds.total_seconds()
+                result[key] = timedelta(seconds=max(int(seconds), 1))
         if CONF_EXTRA_FEES in data:
             try:
                 result[CONF_EXTRA_FEES] = float(data[CONF_EXTRA_FEES])
             except (TypeError, ValueError):
                 result[CONF_EXTRA_FEES] = DEFAULT_EXTRA_FEES_CENTS
+        if CONF_COMPACT_ATTRIBUTES in data:
+            result[CONF_COMPACT_ATTRIBUTES] = bool(data[CONF_COMPACT_ATTRIBUTES])
+        if CONF_CALENDAR_DAILY_HOURS in data:
+            try:
+                hours = int(data[CONF_CALENDAR_DAILY_HOURS])
+            except (TypeError, ValueError):
+                hours = DEFAULT_CALENDAR_DAILY_HOURS
+            result[CONF_CALENDAR_DAILY_HOURS] = min(max(hours, 0), MAX_CALENDAR_DAILY_HOURS)
+        if CONF_DEADLINE_HOURS in data:
+            try:
+                hours = int(data[CONF_DEADLINE_HOURS])
+            except (TypeError, ValueError):
+                hours = DEFAULT_DEADLINE_HOURS
+            result[CONF_DEADLINE_HOURS] = min(max(hours, 0), MAX_DEADLINE_HOURS)
+        if CONF_DEADLINE_TIME in data:
+            deadline_time = dt_util.parse_time(str(data[CONF_DEADLINE_TIME]))
+            if deadline_time is not None:
+                result[CONF_DEADLINE_TIME] = deadline_time
 
     _normalize(entry.data)
     _normalize(entry.options)
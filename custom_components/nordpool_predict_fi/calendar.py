@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+#region calendar
+
+from datetime import datetime, timezone
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    CALENDAR_DAILY_KEY,
+    CUSTOM_WINDOW_KEY,
+    DATA_COORDINATOR,
+    DOMAIN,
+    SECTION_CALENDAR,
+    SECTION_CHEAPEST_WINDOWS,
+    SECTION_CLOCK,
+    SECTION_CUSTOM_WINDOW,
+    SECTION_FEES,
+    SECTION_STATUS,
+)
+from .coordinator import NordpoolPredictCoordinator, PriceWindow
+
+
+#region _setup
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: NordpoolPredictCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    async_add_entities([NordpoolCheapestWindowsCalendar(coordinator, entry)])
+
+
+#region _calendar
+class NordpoolCheapestWindowsCalendar(CoordinatorEntity[NordpoolPredictCoordinator], CalendarEntity):
+    """Cheapest windows, and optionally one cheapest block per day, as events."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = "mdi:calendar-clock"
+    _attr_translation_key = "nordpool_predict_fi__cheapest_windows"
+    _sections = (
+        SECTION_STATUS,
+        SECTION_CHEAPEST_WINDOWS,
+        SECTION_CUSTOM_WINDOW,
+        SECTION_CALENDAR,
+        SECTION_FEES,
+        SECTION_CLOCK,
+    )
+
+    def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_cheapest_windows"
+        self._attr_name = "Cheapest Windows"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Nordpool Predict FI",
+            manufacturer="Nordpool Predict",
+        )
+        self._seen_versions: tuple[int, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        versions = self.coordinator.section_versions(self._sections)
+        if versions == self._seen_versions:
+            return
+        self._seen_versions = versions
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        entry = self.coordinator.calendar_index().current_or_next(self._now())
+        return self._calendar_event(*entry) if entry else None
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        return [
+            self._calendar_event(kind, window)
+            for kind, window in self.coordinator.calendar_index().overlapping(start_date, end_date)
+        ]
+
+    def _calendar_event(self, kind: str, window: PriceWindow) -> CalendarEvent:
+        if kind == CALENDAR_DAILY_KEY:
+            summary = f"Cheapest {window.duration_hours}h block of the day"
+        elif kind == CUSTOM_WINDOW_KEY:
+            summary = "Cheapest custom window"
+        else:
+            summary = f"Cheapest {kind} window"
+        average = window.average + self.coordinator.extra_fees_cents
+        return CalendarEvent(
+            start=window.start,
+            end=window.end,
+            summary=summary,
+            description=f"Average {average:.1f} c/kWh",
+            uid=f"{self._entry.entry_id}_{kind}_{int(window.start.timestamp())}",
+        )
+
+    def _now(self) -> datetime:
+        return getattr(self.coordinator, "current_time", None) or datetime.now(timezone.utc)
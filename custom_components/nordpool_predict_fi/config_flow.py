@@ -10,8 +10,34 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
-
-from .const import CONF_BASE_URL, CONF_UPDATE_INTERVAL, DEFAULT_BASE_URL, DEFAULT_UPDATE_INTERVAL_MINUTES, DOMAIN
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_BASE_URL,
+    CONF_CALENDAR_DAILY_HOURS,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEADLINE_HOURS,
+    CONF_DEADLINE_TIME,
+    CONF_MAX_STALENESS,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_MIRROR_URLS,
+    CONF_REQUEST_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_BASE_URL,
+    DEFAULT_CALENDAR_DAILY_HOURS,
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_DEADLINE_HOURS,
+    DEFAULT_DEADLINE_TIME,
+    DEFAULT_MAX_STALENESS_HOURS,
+    DEFAULT_MIN_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+    DOMAIN,
+    MAX_CALENDAR_DAILY_HOURS,
+    MAX_DEADLINE_HOURS,
+)
 
 
 #region _flow
@@ -103,10 +129,43 @@ def _form_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
     return vol.Schema(
         {
             vol.Required(CONF_BASE_URL, default=defaults.get(CONF_BASE_URL, DEFAULT_BASE_URL)): str,
+            vol.Optional(CONF_MIRROR_URLS, default=defaults.get(CONF_MIRROR_URLS, "")): str,
             vol.Required(
                 CONF_UPDATE_INTERVAL,
                 default=defaults.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_MINUTES),
             ): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
+            vol.Optional(
+                CONF_MIN_UPDATE_INTERVAL,
+                default=defaults.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL_MINUTES),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=720)),
+            vol.Optional(
+                CONF_MAX_STALENESS,
+                default=defaults.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS_HOURS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=168)),
+            vol.Optional(
+                CONF_CONNECT_TIMEOUT,
+                default=defaults.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT_SECONDS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+            vol.Optional(
+                CONF_REQUEST_TIMEOUT,
+                default=defaults.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT_SECONDS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+            vol.Optional(
+                CONF_COMPACT_ATTRIBUTES,
+                default=defaults.get(CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES),
+            ): bool,
+            vol.Optional(
+                CONF_CALENDAR_DAILY_HOURS,
+                default=defaults.get(CONF_CALENDAR_DAILY_HOURS, DEFAULT_CALENDAR_DAILY_HOURS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_CALENDAR_DAILY_HOURS)),
+            vol.Optional(
+                CONF_DEADLINE_HOURS,
+                default=defaults.get(CONF_DEADLINE_HOURS, DEFAULT_DEADLINE_HOURS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_DEADLINE_HOURS)),
+            vol.Optional(
+                CONF_DEADLINE_TIME,
+                default=defaults.get(CONF_DEADLINE_TIME, DEFAULT_DEADLINE_TIME),
+            ): str,
         }
     )
 
@@ -117,7 +176,20 @@ def _entry_to_defaults(entry: config_entries.ConfigEntry) -> dict[str, Any]:
     combined.update(entry.options)
     return {
         CONF_BASE_URL: combined.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+        CONF_MIRROR_URLS: combined.get(CONF_MIRROR_URLS, ""),
         CONF_UPDATE_INTERVAL: combined.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_MINUTES),
+        CONF_MIN_UPDATE_INTERVAL: combined.get(
+            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL_MINUTES
+        ),
+        CONF_MAX_STALENESS: combined.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS_HOURS),
+        CONF_CONNECT_TIMEOUT: combined.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT_SECONDS),
+        CONF_REQUEST_TIMEOUT: combined.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT_SECONDS),
+        CONF_COMPACT_ATTRIBUTES: combined.get(CONF_COMPACT_ATTRIBUTES, DEFAULT_COMPACT_ATTRIBUTES),
+        CONF_CALENDAR_DAILY_HOURS: combined.get(
+            CONF_CALENDAR_DAILY_HOURS, DEFAULT_CALENDAR_DAILY_HOURS
+        ),
+        CONF_DEADLINE_HOURS: combined.get(CONF_DEADLINE_HOURS, DEFAULT_DEADLINE_HOURS),
+        CONF_DEADLINE_TIME: combined.get(CONF_DEADLINE_TIME, DEFAULT_DEADLINE_TIME),
     }
 
 
@@ -138,4 +210,25 @@ def _validate_user_input(user_input: Mapping[str, Any]) -> tuple[dict[str, Any],
         else:
             data[CONF_BASE_URL] = validated.rstrip("/")
 
+    mirrors: list[str] = []
+    for raw_mirror in str(data.get(CONF_MIRROR_URLS, "")).split(","):
+        raw_mirror = raw_mirror.strip()
+        if not raw_mirror:
+            continue
+        try:
+            mirrors.append(cv.url(raw_mirror).rstrip("/"))
+        except vol.Invalid:
+            errors[CONF_MIRROR_URLS] = "invalid_mirror_url"
+            break
+    if CONF_MIRROR_URLS not in errors:
+        data[CONF_MIRROR_URLS] = ", ".join(mirrors)
+
+    raw_deadline = str(data.get(CONF_DEADLINE_TIME, DEFAULT_DEADLINE_TIME)).strip()
+    deadline_time = dt_util.parse_time(raw_deadline)
+    if deadline_time is None:
+        errors[CONF_DEADLINE_TIME] = "invalid_deadline_time"
+        data[CONF_DEADLINE_TIME] = raw_deadline
+    else:
+        data[CONF_DEADLINE_TIME] = deadline_time.strftime("%H:%M")
+
     return data, errors
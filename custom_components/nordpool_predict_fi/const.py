@@ -6,16 +6,79 @@ from homeassistant.const import Platform
 
 #region _core
 DOMAIN = "nordpool_predict_fi"
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.NUMBER, Platform.CALENDAR]
 
 DEFAULT_BASE_URL = "https://raw.githubusercontent.com/vividfog/nordpool-predict-fi/main/deploy"
 SAHKOTIN_BASE_URL = "https://sahkotin.fi/prices.csv"
+REALIZED_STORE_VERSION = 1
+SNAPSHOT_STORE_VERSION = 1
+# Helsinki hours during which the next day's auction prices are expected to land.
+DAY_AHEAD_RESULTS_START_HOUR = 13
+DAY_AHEAD_RESULTS_END_HOUR = 16
 DEFAULT_UPDATE_INTERVAL_MINUTES = 30
 DEFAULT_UPDATE_INTERVAL = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+# Floor for the adaptive poller; the configured update interval is its ceiling.
+DEFAULT_MIN_UPDATE_INTERVAL_MINUTES = 5
+# Learned publish times kept per artifact, and how far around one to poll densely.
+# A time only counts once this many changes landed within that distance of it.
+PUBLISH_HISTORY_SIZE = 14
+PUBLISH_WINDOW_MINUTES = 30
+PUBLISH_MIN_REPEATS = 3
+# How long the last good forecast keeps being served while prediction.json fails.
+DEFAULT_MAX_STALENESS_HOURS = 24
+# Per-host resilience: retries per request with a doubling, jittered delay, and
+# how many consecutive failed requests pause a host's requests for how long. A
+# refresh allows every attempt of a request, so its deadline follows the timeout.
+FETCH_RETRIES = 2
+FETCH_RETRY_DELAY_SECONDS = 0.5
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 300
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 20
+# Mirrors: each artifact request goes to the best-scoring base URL, and a hedge
+# goes to the next one if the first has not answered within this percentile of
+# its recent latencies.
+HEDGE_PERCENTILE = 0.9
+HEDGE_DEFAULT_DELAY_SECONDS = 2.0
+HEDGE_MIN_DELAY_SECONDS = 0.1
+MIRROR_LATENCY_SAMPLES = 20
 
 CONF_BASE_URL = "base_url"
+CONF_MIRROR_URLS = "mirror_urls"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_STALENESS = "max_staleness"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_REQUEST_TIMEOUT = "request_timeout"
 CONF_EXTRA_FEES = "extra_fees"
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
+# Series attributes as {start, step, values} instead of one {timestamp, value} per point.
+DEFAULT_COMPACT_ATTRIBUTES = False
+CONF_CALENDAR_DAILY_HOURS = "calendar_daily_hours"
+# Length of the per-day cheapest block shown on the calendar; 0 leaves it off.
+DEFAULT_CALENDAR_DAILY_HOURS = 0
+MAX_CALENDAR_DAILY_HOURS = 12
+CALENDAR_DAILY_KEY = "daily"
+CONF_DEADLINE_HOURS = "deadline_hours"
+CONF_DEADLINE_TIME = "deadline_time"
+# Cheapest block finishing by a daily local time; 0 hours leaves the mode off.
+DEFAULT_DEADLINE_HOURS = 0
+DEFAULT_DEADLINE_TIME = "07:00"
+MAX_DEADLINE_HOURS = 24
+
+#region _services
+SERVICE_FIND_CHEAPEST_WINDOW = "find_cheapest_window"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+ATTR_EARLIEST_START = "earliest_start"
+ATTR_DEADLINE = "deadline"
+ATTR_START_HOUR = "start_hour"
+ATTR_END_HOUR = "end_hour"
+ATTR_LOOKAHEAD_HOURS = "lookahead_hours"
+SERVICE_FIND_DEADLINE_WINDOWS = "find_deadline_windows"
+ATTR_DEADLINE_TIME = "deadline_time"
+# Memoized on-demand window searches; older series versions simply age out.
+FIND_WINDOW_CACHE_SIZE = 64
 
 DATA_COORDINATOR = "coordinator"
 DATA_UNSUB_LISTENER = "unsub_listener"
@@ -45,6 +108,9 @@ ATTR_NARRATION_SUMMARY = "summary"
 ATTR_SOURCE_URL = "source_url"
 ATTR_TIMESTAMP = "timestamp"
 ATTR_EXTRA_FEES = "extra_fees"
+ATTR_SNAPSHOT_AGE = "snapshot_age"
+ATTR_DATA_AGE = "data_age"
+ATTR_STALE = "stale"
 ATTR_DAILY_AVERAGES = "daily_averages"
 ATTR_DAILY_AVERAGE_SPAN_START = "daily_average_span_start"
 ATTR_DAILY_AVERAGE_SPAN_END = "daily_average_span_end"
@@ -53,6 +119,26 @@ ATTR_CUSTOM_WINDOW_START_HOUR = "custom_window_start_hour"
 ATTR_CUSTOM_WINDOW_END_HOUR = "custom_window_end_hour"
 ATTR_CUSTOM_WINDOW_LOOKAHEAD_HOURS = "custom_window_lookahead_hours"
 ATTR_CUSTOM_WINDOW_LOOKAHEAD_LIMIT = "custom_window_lookahead_limit"
+ATTR_DEADLINE_WINDOWS = "deadline_windows"
+
+#region _sections
+# Parts of coordinator state that are versioned separately; entities re-render
+# only when a section they read has changed.
+SECTION_STATUS = "status"
+SECTION_CLOCK = "clock"
+SECTION_PRICE = "price"
+SECTION_DAILY_AVERAGES = "daily_averages"
+SECTION_CHEAPEST_WINDOWS = "cheapest_windows"
+SECTION_CUSTOM_WINDOW = "custom_window"
+SECTION_WINDPOWER = "windpower"
+SECTION_NARRATION = "narration"
+SECTION_FEES = "fees"
+SECTION_SETTINGS = "settings"
+SECTION_TIMESTAMPS = "timestamps"
+SECTION_CALENDAR = "calendar"
+SECTION_DEADLINE = "deadline"
+# The merged price and wind timelines alone; clock ticks leave it untouched.
+SECTION_SERIES = "series"
 
 CHEAPEST_WINDOW_HOURS: tuple[int, ...] = (3, 6, 12)
 NEXT_HOURS: tuple[int, ...] = (1, 3, 6, 12)
@@ -64,6 +150,20 @@ NARRATION_LANGUAGE_NAMES: dict[str, str] = {
 
 CUSTOM_WINDOW_KEY = "custom"
 
+#region _events
+# Fired at every cheapest window start and end, and at registered lead times
+# before them; device triggers listen for it.
+EVENT_WINDOW = f"{DOMAIN}_window"
+WINDOW_EDGE_START = "start"
+WINDOW_EDGE_END = "end"
+WINDOW_EVENT_IDS: tuple[str, ...] = (*(f"{hours}h" for hours in CHEAPEST_WINDOW_HOURS), CUSTOM_WINDOW_KEY)
+TRIGGER_WINDOW_START = "window_start"
+TRIGGER_WINDOW_END = "window_end"
+CONF_LEAD_MINUTES = "lead_minutes"
+MAX_LEAD_MINUTES = 720
+# hass.data key: per config entry, how many device triggers want each lead time.
+DATA_WINDOW_LEADS = f"{DOMAIN}_window_leads"
+
 CONF_CHEAPEST_WINDOW_LOOKAHEAD_HOURS = "cheapest_window_lookahead_hours"
 DEFAULT_CHEAPEST_WINDOW_LOOKAHEAD_HOURS = 168
 MIN_CHEAPEST_WINDOW_LOOKAHEAD_HOURS = 1
@@ -2,25 +2,44 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
 import csv
-from dataclasses import dataclass
+import hashlib
+import json
+import math
+import random
+import sys
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta, time, timezone, tzinfo
+from email.utils import parsedate_to_datetime
+from time import perf_counter
 from typing import Any, Callable
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 
-from aiohttp import ClientError, ClientResponseError, ContentTypeError
+from aiohttp import ClientError, ClientResponseError, ClientTimeout, ContentTypeError
 import async_timeout
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from .const import (
+    BREAKER_COOLDOWN_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    CALENDAR_DAILY_KEY,
     CHEAPEST_WINDOW_HOURS,
     CONF_EXTRA_FEES,
     CONF_UPDATE_INTERVAL,
     CUSTOM_WINDOW_KEY,
+    DATA_WINDOW_LEADS,
+    DAY_AHEAD_RESULTS_END_HOUR,
+    DAY_AHEAD_RESULTS_START_HOUR,
     DEFAULT_CHEAPEST_WINDOW_LOOKAHEAD_HOURS,
     DEFAULT_CHEAPEST_WINDOW_END_HOUR,
     DEFAULT_CHEAPEST_WINDOW_START_HOUR,
@@ -29,7 +48,22 @@ from .const import (
     DEFAULT_CUSTOM_WINDOW_HOURS,
     DEFAULT_CUSTOM_WINDOW_START_HOUR,
     DEFAULT_BASE_URL,
+    DEFAULT_CALENDAR_DAILY_HOURS,
+    DEFAULT_COMPACT_ATTRIBUTES,
+    DEFAULT_DEADLINE_HOURS,
+    DEFAULT_DEADLINE_TIME,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
     DEFAULT_EXTRA_FEES_CENTS,
+    DEFAULT_MAX_STALENESS_HOURS,
+    DEFAULT_MIN_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    FETCH_RETRIES,
+    FETCH_RETRY_DELAY_SECONDS,
+    FIND_WINDOW_CACHE_SIZE,
+    HEDGE_DEFAULT_DELAY_SECONDS,
+    HEDGE_MIN_DELAY_SECONDS,
+    HEDGE_PERCENTILE,
+    MIRROR_LATENCY_SAMPLES,
     MAX_CHEAPEST_WINDOW_LOOKAHEAD_HOURS,
     MAX_CHEAPEST_WINDOW_HOUR,
     MAX_CUSTOM_WINDOW_LOOKAHEAD_HOURS,
@@ -40,7 +74,30 @@ from .const import (
     MIN_CUSTOM_WINDOW_LOOKAHEAD_HOURS,
     MIN_CUSTOM_WINDOW_HOURS,
     MIN_CUSTOM_WINDOW_HOUR,
+    DOMAIN,
+    EVENT_WINDOW,
+    PUBLISH_HISTORY_SIZE,
+    PUBLISH_MIN_REPEATS,
+    PUBLISH_WINDOW_MINUTES,
+    REALIZED_STORE_VERSION,
+    SECTION_CALENDAR,
+    SECTION_CHEAPEST_WINDOWS,
+    SECTION_CLOCK,
+    SECTION_CUSTOM_WINDOW,
+    SECTION_DEADLINE,
+    SECTION_DAILY_AVERAGES,
+    SECTION_FEES,
+    SECTION_NARRATION,
+    SECTION_PRICE,
+    SECTION_SERIES,
+    SECTION_SETTINGS,
+    SECTION_STATUS,
+    SECTION_TIMESTAMPS,
+    SECTION_WINDPOWER,
     SAHKOTIN_BASE_URL,
+    SNAPSHOT_STORE_VERSION,
+    WINDOW_EDGE_END,
+    WINDOW_EDGE_START,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,13 +109,234 @@ class SeriesPoint:
     value: float
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(moment: datetime) -> int:
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+class PriceSeries(Sequence[SeriesPoint]):
+    """Time-sorted series stored column-wise.
+
+    Epoch microseconds live in an ``array('q')`` and values in an
+    ``array('d')``. Slices are views over the same arrays, and ``SeriesPoint``
+    objects are only built when items are read.
+    """
+
+    __slots__ = ("_epochs", "_values", "_start", "_stop")
+
+    def __init__(
+        self,
+        epochs: array,
+        values: array,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        self._epochs = epochs
+        self._values = values
+        self._start = start
+        self._stop = len(epochs) if stop is None else stop
+
+    @classmethod
+    def from_points(cls, points: Iterable[SeriesPoint]) -> PriceSeries:
+        epochs = array("q")
+        values = array("d")
+        for point in points:
+            epochs.append(_epoch_us(point.datetime))
+            values.append(point.value)
+        return cls(epochs, values)
+
+    @classmethod
+    def concat(cls, *parts: Sequence[SeriesPoint]) -> PriceSeries:
+        epochs = array("q")
+        values = array("d")
+        for part in parts:
+            if isinstance(part, PriceSeries):
+                epochs.extend(part._epochs[part._start : part._stop])
+                values.extend(part._values[part._start : part._stop])
+            else:
+                for point in part:
+                    epochs.append(_epoch_us(point.datetime))
+                    values.append(point.value)
+        return cls(epochs, values)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return PriceSeries(
+                self._epochs,
+                self._values,
+                self._start + start,
+                self._start + max(start, stop),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PriceSeries index out of range")
+        position = self._start + index
+        return SeriesPoint(
+            _EPOCH + timedelta(microseconds=self._epochs[position]),
+            self._values[position],
+        )
+
+    def __iter__(self) -> Iterator[SeriesPoint]:
+        epochs = self._epochs
+        values = self._values
+        for position in range(self._start, self._stop):
+            yield SeriesPoint(_EPOCH + timedelta(microseconds=epochs[position]), values[position])
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, PriceSeries):
+            return (
+                len(self) == len(other)
+                and self.epochs == other.epochs
+                and self.values == other.values
+            )
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PriceSeries(len={len(self)})"
+
+    @property
+    def epochs(self) -> memoryview:
+        """Epoch microseconds of the points, without copying."""
+        return memoryview(self._epochs)[self._start : self._stop]
+
+    @property
+    def values(self) -> memoryview:
+        """Point values, without copying."""
+        return memoryview(self._values)[self._start : self._stop]
+
+    def bisect_left(self, moment: datetime) -> int:
+        """Index of the first point at or after ``moment``."""
+        return bisect.bisect_left(self._epochs, _epoch_us(moment), self._start, self._stop) - self._start
+
+    def bisect_right(self, moment: datetime) -> int:
+        """Index of the first point after ``moment``."""
+        return bisect.bisect_right(self._epochs, _epoch_us(moment), self._start, self._stop) - self._start
+
+
+class SeriesTimeIndex:
+    """Bisect lookups over one time-sorted series.
+
+    Built once per series object handed out in coordinator data, so sensors
+    share it instead of rescanning the series on every property access.
+    """
+
+    __slots__ = ("source", "series", "_epochs", "_prefix", "_run_start", "_anchor", "_averages")
+
+    def __init__(self, source: Sequence[SeriesPoint]) -> None:
+        self.source = source
+        if isinstance(source, PriceSeries):
+            self.series: Sequence[SeriesPoint] = source
+            self._epochs: Sequence[int] = source.epochs
+        else:
+            points = [point for point in source if isinstance(point, SeriesPoint)]
+            self.series = points
+            self._epochs = array("q", (_epoch_us(point.datetime) for point in points))
+        self._prefix: array | None = None
+        self._run_start: array | None = None
+        self._anchor: int | None = None
+        self._averages: dict[int, float | None] = {}
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def at_or_before(self, moment: datetime) -> SeriesPoint | None:
+        """Latest point starting at or before ``moment``."""
+        index = bisect.bisect_right(self._epochs, _epoch_us(moment))
+        return self.series[index - 1] if index else None
+
+    def at_or_after(self, moment: datetime) -> SeriesPoint | None:
+        """First point starting at or after ``moment``."""
+        index = bisect.bisect_left(self._epochs, _epoch_us(moment))
+        return self.series[index] if index < len(self.series) else None
+
+    def contiguous_run(
+        self,
+        start: datetime,
+        count: int,
+        step: timedelta = timedelta(hours=1),
+    ) -> Sequence[SeriesPoint] | None:
+        """``count`` points spaced ``step`` apart beginning exactly at ``start``."""
+        first = _epoch_us(start)
+        index = bisect.bisect_left(self._epochs, first)
+        if count <= 0 or index + count > len(self.series):
+            return None
+        step_us = step // _MICROSECOND
+        for offset in range(count):
+            if self._epochs[index + offset] != first + offset * step_us:
+                return None
+        return self.series[index : index + count]
+
+    def hourly_average(self, start: datetime, hours: int) -> float | None:
+        """Average of ``hours`` contiguous hourly values beginning exactly at ``start``.
+
+        Answered from prefix sums in O(1). Results are memoized per start
+        anchor, so every next-hours sensor reading the same anchor shares one
+        table that resets when the anchor moves on.
+        """
+        first = _epoch_us(start)
+        if first != self._anchor:
+            self._anchor = first
+            self._averages = {}
+        elif hours in self._averages:
+            return self._averages[hours]
+        average = self._hourly_average(first, hours)
+        self._averages[hours] = average
+        return average
+
+    def _hourly_average(self, first: int, hours: int) -> float | None:
+        index = bisect.bisect_left(self._epochs, first)
+        last = index + hours - 1
+        if hours <= 0 or last >= len(self.series) or self._epochs[index] != first:
+            return None
+        if self._prefix is None or self._run_start is None:
+            self._prefix, self._run_start = self._build_prefix()
+        if self._run_start[last] > index:
+            return None
+        return (self._prefix[last + 1] - self._prefix[index]) / hours
+
+    def _build_prefix(self) -> tuple[array, array]:
+        if isinstance(self.series, PriceSeries):
+            values: Iterable[float] = self.series.values
+        else:
+            values = (point.value for point in self.series)
+        slot_us = SLOT_SECONDS * 1_000_000
+        epochs = self._epochs
+        prefix = array("d", [0.0])
+        run_start = array("q")
+        running = 0.0
+        for position, value in enumerate(values):
+            running += value
+            prefix.append(running)
+            if position and epochs[position] - epochs[position - 1] == slot_us:
+                run_start.append(run_start[position - 1])
+            else:
+                run_start.append(position)
+        return prefix, run_start
+
+
 @dataclass(slots=True)
 class PriceWindow:
     duration_hours: int
     start: datetime
     end: datetime
     average: float
-    points: list[SeriesPoint]
+    points: Sequence[SeriesPoint]
 
 
 @dataclass(slots=True)
@@ -67,13 +345,303 @@ class DailyAverage:
     start: datetime
     end: datetime
     average: float
-    points: list[SeriesPoint]
+    points: Sequence[SeriesPoint]
+
+
+@dataclass(slots=True)
+class DeadlineWindow:
+    """Cheapest window finishing by one daily deadline, after the previous one."""
+
+    deadline: datetime
+    window: PriceWindow | None
+
+
+class WindowIntervalIndex:
+    """Overlap queries over a fixed set of windows.
+
+    Windows are kept sorted by start. None is longer than the longest one, so
+    every window overlapping a range starts at most that long before the
+    range; a query bisects to that span and only checks the ends inside it.
+    """
+
+    __slots__ = ("source", "_entries", "_starts", "_longest")
+
+    def __init__(self, source: Any, entries: Iterable[tuple[str, PriceWindow]]) -> None:
+        self.source = source
+        self._entries = sorted(entries, key=lambda entry: (entry[1].start, entry[1].end))
+        self._starts = array("q", (_epoch_us(window.start) for _, window in self._entries))
+        self._longest = max(
+            ((window.end - window.start) // _MICROSECOND for _, window in self._entries),
+            default=0,
+        )
 
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[tuple[str, PriceWindow]]:
+        """Windows intersecting ``[start, end)``, in start order."""
+        first = bisect.bisect_right(self._starts, _epoch_us(start) - self._longest)
+        last = bisect.bisect_left(self._starts, _epoch_us(end))
+        return [entry for entry in self._entries[first:last] if entry[1].end > start]
+
+    def current_or_next(self, moment: datetime) -> tuple[str, PriceWindow] | None:
+        """Earliest-starting window that has not ended at ``moment``."""
+        first = bisect.bisect_right(self._starts, _epoch_us(moment) - self._longest)
+        return next((entry for entry in self._entries[first:] if entry[1].end > moment), None)
+
+
+@dataclass(slots=True)
+class _WindowSearchIndex:
+    """Prefix sums and hourly contiguity precomputed once per price series.
+
+    ``run_start[i]`` is the first index of the hourly run containing ``i``, so a
+    window ``[i, i + hours)`` is contiguous when ``run_start[i + hours - 1] <= i``.
+    """
+
+    series: Sequence[SeriesPoint]
+    length: int
+    values: list[float]
+    prefix: list[float]
+    starts: list[float]
+    run_start: list[int]
+    tolerance: float
+    local_tz: tzinfo | None = None
+    local_hours: array | None = None
+    start_masks: dict[frozenset[int], bytes] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class _StartHourMask:
+    """Allowed local start hours for a window.
+
+    Callable like any other window filter; the search engine instead compiles
+    it into a per-index bitmap so eligibility is a lookup.
+    """
+
+    hours: frozenset[int]
+    tz: tzinfo
+
+    def __call__(self, window_points: Sequence[SeriesPoint]) -> bool:
+        if not window_points:
+            return False
+        return window_points[0].datetime.astimezone(self.tz).hour in self.hours
+
+
+@dataclass(slots=True)
+class _WindowQuery:
+    """One duration and its constraints for a batched cheapest window search.
+
+    With ``fallback_without_min_end`` the query resolves to the best window
+    ignoring ``min_end`` when no candidate ends after it.
+    """
+
+    hours: int
+    earliest_start: datetime | None = None
+    min_end: datetime | None = None
+    max_end: datetime | None = None
+    window_filter: Callable[[list[SeriesPoint]], bool] | None = None
+    fallback_without_min_end: bool = False
+
+
+@dataclass(slots=True)
+class _MirrorCopy:
+    """HTTP validators and last payload of one artifact as served by one mirror."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    fingerprint: str | None = None
+    payload: Any = None
+
+
+@dataclass(slots=True)
+class _ArtifactState:
+    """Accepted payload, its validators and transfer counters for one artifact."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    fingerprint: str | None = None
+    payload: Any = None
+    parsed: Any = None
+    parsed_source: Any = None
+    last_bytes: int = 0
+    total_bytes: int = 0
+    requests: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    parse_hits: int = 0
+    # Time spent on the latest body decode and the latest parse, each on its own.
+    decode_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fingerprint": self.fingerprint,
+            "last_bytes": self.last_bytes,
+            "total_bytes": self.total_bytes,
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "parse_hits": self.parse_hits,
+            "decode_ms": round(self.decode_seconds * 1000, 3),
+            "parse_ms": round(self.parse_seconds * 1000, 3),
+        }
+
+
+@dataclass(slots=True)
+class _HostBreaker:
+    """Consecutive-failure circuit breaker and request counters for one host."""
+
+    failures: int = 0
+    opened_until: datetime | None = None
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    short_circuits: int = 0
+    last_error: str | None = None
+
+    def state(self, now: datetime) -> str:
+        if self.opened_until is None:
+            return "closed"
+        # Past the cooldown requests go through again; one more failure reopens.
+        return "open" if now < self.opened_until else "half_open"
+
+    def as_dict(self, now: datetime) -> dict[str, Any]:
+        return {
+            "state": self.state(now),
+            "consecutive_failures": self.failures,
+            "opened_until": self.opened_until.isoformat() if self.opened_until else None,
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "short_circuits": self.short_circuits,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass(slots=True)
+class _MirrorStats:
+    """Recent latencies and outcomes of artifact requests to one base URL."""
+
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=MIRROR_LATENCY_SAMPLES))
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    hedges: int = 0
+    wins: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace-smoothed so one early failure does not bury a mirror for good.
+        return (self.successes + 1) / (self.requests + 2)
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(math.ceil(fraction * len(ordered)) - 1, len(ordered) - 1)]
+
+    def cost(self) -> float:
+        """Expected seconds per good answer; untried mirrors sort after tried ones."""
+        median = self.percentile(0.5)
+        return math.inf if median is None else median / self.success_rate
+
+    def as_dict(self) -> dict[str, Any]:
+        median = self.percentile(0.5)
+        tail = self.percentile(HEDGE_PERCENTILE)
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": round(self.success_rate, 3),
+            "p50_ms": round(median * 1000, 1) if median is not None else None,
+            "p90_ms": round(tail * 1000, 1) if tail is not None else None,
+            "hedges": self.hedges,
+            "wins": self.wins,
+        }
+
+
+class _CircuitOpen(UpdateFailed):
+    """Raised instead of a request while the host's circuit is open."""
+
+
+@dataclass(slots=True)
+class _Sources:
+    """Parsed upstream inputs a data build is derived from.
+
+    The ``*_key`` fields identify the content for stage caching: the artifact
+    fingerprint when known, otherwise the parsed value itself.
+    """
+
+    forecast_key: Any
+    forecast: Sequence[SeriesPoint]
+    realized: Sequence[SeriesPoint]
+    narration_fi: str | None
+    narration_en: str | None
+    wind_key: Any
+    wind: Sequence[SeriesPoint] | None
+    # Fetch time of the oldest input, and whether any input is a cached copy
+    # because its latest fetch failed.
+    fetched_at: datetime | None = None
+    stale: bool = False
+
+
+@dataclass(slots=True)
+class _StageResult:
+    """Output of one derived update stage and the inputs it was built from."""
+
+    key: Any
+    value: Any
+
+
+class _BestStart:
+    """Running cheapest start for one query during a scan."""
+
+    __slots__ = ("start", "total", "average")
+
+    def __init__(self) -> None:
+        self.start: int | None = None
+        self.total = 0.0
+        self.average: float | None = None
+
+    def could_take(self, total: float, tolerance: float) -> bool:
+        return self.start is None or total <= self.total + tolerance
+
+    def offer(
+        self,
+        start: int,
+        total: float,
+        hours: int,
+        values: list[float],
+        tolerance: float,
+    ) -> None:
+        if self.start is None or total < self.total - tolerance:
+            self.start, self.total, self.average = start, total, None
+            return
+        # Within rounding distance of the best: settle it with exact sums.
+        if self.average is None:
+            self.average = sum(values[self.start : self.start + hours]) / hours
+        average = sum(values[start : start + hours]) / hours
+        if average < self.average:
+            self.start, self.total, self.average = start, total, average
 
 
 HELSINKI_TIMEZONE_NAME = "Europe/Helsinki"
 
 
+SLOT_SECONDS = 3600
+# Prefix-sum differences are compared with this much slack per point; candidates
+# inside the band are re-summed exactly so tie-breaking matches a direct sum().
+_PREFIX_SUM_SLACK = 8 * sys.float_info.epsilon
+
+# Source name for Sähkötin in the per-source fetch times.
+_SAHKOTIN_SOURCE = "sahkotin"
+
+# Parts of the cached data a settings flush has to re-resolve.
+_REBUILD_FIXED_WINDOWS = "fixed_windows"
+_REBUILD_CUSTOM_WINDOW = "custom_window"
+
 MAX_SUMMARY_LENGTH = 255
 SUMMARY_ELLIPSIS = "..."
 
@@ -88,21 +656,66 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         base_url: str,
         update_interval,
         extra_fees_cents: float | None = None,
+        compact_attributes: bool = DEFAULT_COMPACT_ATTRIBUTES,
+        calendar_daily_hours: int = DEFAULT_CALENDAR_DAILY_HOURS,
+        deadline_hours: int = DEFAULT_DEADLINE_HOURS,
+        deadline_time: time | None = None,
+        min_update_interval: timedelta | None = None,
+        max_staleness: timedelta | None = None,
+        connect_timeout: timedelta | None = None,
+        request_timeout: timedelta | None = None,
+        mirror_urls: Sequence[str] | None = None,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name="Nordpool Predict FI",
             update_interval=update_interval,
+            always_update=False,
         )
         self.entry_id = entry_id
         self._base_url = base_url or DEFAULT_BASE_URL
+        # Base URLs in configured order; the first is the canonical source.
+        self._mirrors: list[str] = list(dict.fromkeys([self._base_url, *(mirror_urls or ())]))
+        self._mirror_stats: dict[str, _MirrorStats] = {
+            mirror: _MirrorStats() for mirror in self._mirrors
+        }
         self._helsinki_tz: tzinfo | None = None
         self._extra_fees_cents = (
             float(extra_fees_cents)
             if extra_fees_cents is not None
             else DEFAULT_EXTRA_FEES_CENTS
         )
+        self._compact_attributes = bool(compact_attributes)
+        self._calendar_daily_hours = max(int(calendar_daily_hours), 0)
+        self._deadline_hours = max(int(deadline_hours), 0)
+        self._deadline_time = deadline_time or time.fromisoformat(DEFAULT_DEADLINE_TIME)
+        # The configured interval is the ceiling; _next_poll_interval picks the
+        # actual delay before every scheduled refresh.
+        self._poll_ceiling: timedelta | None = update_interval
+        floor = min_update_interval or timedelta(minutes=DEFAULT_MIN_UPDATE_INTERVAL_MINUTES)
+        self._poll_floor = min(floor, update_interval) if update_interval else floor
+        # Stable per-installation offset so a fleet of installs does not poll in step.
+        self._poll_phase = timedelta(
+            seconds=int.from_bytes(hashlib.blake2b(entry_id.encode(), digest_size=4).digest(), "big")
+            % max(int(self._poll_floor.total_seconds()), 1)
+        )
+        self._poll_failures = 0
+        # UTC minute-of-day of observed content changes, per artifact.
+        self._publish_minutes: dict[str, deque[int]] = {}
+        self._max_staleness = max_staleness or timedelta(hours=DEFAULT_MAX_STALENESS_HOURS)
+        # Last successful fetch per source (artifact suffix or Sähkötin).
+        self._fetched_at: dict[str, datetime] = {}
+        self._request_timeout = (
+            request_timeout or timedelta(seconds=DEFAULT_REQUEST_TIMEOUT_SECONDS)
+        ).total_seconds()
+        self._client_timeout = ClientTimeout(
+            total=self._request_timeout,
+            connect=(
+                connect_timeout or timedelta(seconds=DEFAULT_CONNECT_TIMEOUT_SECONDS)
+            ).total_seconds(),
+        )
+        self._breakers: dict[str, _HostBreaker] = {}
         self._cheapest_window_lookahead_hours = DEFAULT_CHEAPEST_WINDOW_LOOKAHEAD_HOURS
         self._cheapest_window_start_hour = DEFAULT_CHEAPEST_WINDOW_START_HOUR
         self._cheapest_window_end_hour = DEFAULT_CHEAPEST_WINDOW_END_HOUR
@@ -110,6 +723,52 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._custom_window_start_hour = DEFAULT_CUSTOM_WINDOW_START_HOUR
         self._custom_window_end_hour = DEFAULT_CUSTOM_WINDOW_END_HOUR
         self._custom_window_lookahead_hours = DEFAULT_CUSTOM_WINDOW_LOOKAHEAD_HOURS
+        self._window_index: _WindowSearchIndex | None = None
+        self._artifacts: dict[str, _ArtifactState] = {}
+        # Validators only mean something to the server that issued them.
+        self._mirror_copies: dict[tuple[str, str], _MirrorCopy] = {}
+        self._stages: dict[str, _StageResult] = {}
+        self._realized_store: Store[dict[str, Any]] = Store(
+            hass,
+            REALIZED_STORE_VERSION,
+            f"{DOMAIN}.{entry_id}.realized",
+        )
+        self._snapshot_store: Store[dict[str, Any]] = Store(
+            hass,
+            SNAPSHOT_STORE_VERSION,
+            f"{DOMAIN}.{entry_id}.snapshot",
+        )
+        # Realized prices keyed by UTC slot start (epoch seconds); None until loaded.
+        self._realized_slots: dict[int, float] | None = None
+        self._realized_series: PriceSeries | None = None
+        self._time_indexes: dict[str, SeriesTimeIndex] = {}
+        self._calendar_index: WindowIntervalIndex | None = None
+        # On-demand window searches keyed by (series version, resolved parameters).
+        self._find_cache: OrderedDict[tuple[Any, ...], PriceWindow | None] = OrderedDict()
+        self._find_series: Sequence[SeriesPoint] | None = None
+        self._find_series_version = 0
+        self._pending_rebuilds: set[str] = set()
+        self._settings_flush: asyncio.Task[None] | None = None
+        # Inputs of the last build, kept so the clock can recompute without fetching.
+        self._sources: _Sources | None = None
+        self._clock_point: datetime | None = None
+        # The next deadline's window once it has started, held until that deadline.
+        self._held_deadline_window: DeadlineWindow | None = None
+        # Window edges at or before this instant have had their events fired.
+        self._window_events_until: datetime | None = None
+        self._unsub_clock: CALLBACK_TYPE | None = None
+        self._section_tokens: dict[str, tuple[Any, ...]] = {}
+        self._section_versions: dict[str, int] = {}
+        # Attribute payloads shared across sensors; entries keep their series so
+        # identity checks stay valid, and everything drops when the series
+        # section version moves on (new prices or the day rolling over).
+        self._serialized_for: int | None = None
+        self._epoch_strings: dict[int, str] = {}
+        self._timestamp_columns: dict[int, tuple[Sequence[SeriesPoint], list[str]]] = {}
+        self._serialized_points: dict[
+            tuple[int, int | None],
+            tuple[Sequence[SeriesPoint], float, list[Mapping[str, Any]] | Mapping[str, Any]],
+        ] = {}
 
     @property
     def base_url(self) -> str:
@@ -119,6 +778,277 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def extra_fees_cents(self) -> float:
         return self._extra_fees_cents
 
+    @property
+    def stale(self) -> bool:
+        """Whether current data is served from cached inputs after failed fetches."""
+        return self._sources is not None and self._sources.stale
+
+    def data_age(self) -> int | None:
+        """Seconds since the oldest input of the current data was fetched."""
+        fetched_at = self._sources.fetched_at if self._sources is not None else None
+        if fetched_at is None:
+            return None
+        return max(int((self.current_time - fetched_at).total_seconds()), 0)
+
+    @property
+    def compact_attributes(self) -> bool:
+        return self._compact_attributes
+
+    def time_index(self, section: str) -> SeriesTimeIndex:
+        """Shared time index over the ``price`` forecast or ``windpower`` series."""
+        data = self.data if isinstance(self.data, Mapping) else {}
+        part = data.get(section)
+        series = part.get("forecast" if section == "price" else "series") if isinstance(part, Mapping) else None
+        if not isinstance(series, (list, PriceSeries)):
+            series = []
+        cached = self._time_indexes.get(section)
+        if cached is None or cached.source is not series:
+            cached = SeriesTimeIndex(series)
+            self._time_indexes[section] = cached
+        return cached
+
+    def calendar_index(self) -> WindowIntervalIndex:
+        """Shared overlap index over the chosen windows and the daily cheapest blocks."""
+        data = self.data if isinstance(self.data, Mapping) else {}
+        price = data.get("price")
+        if not isinstance(price, Mapping):
+            price = {}
+        custom = price.get(CUSTOM_WINDOW_KEY)
+        source = (
+            price.get("cheapest_windows"),
+            custom.get("window") if isinstance(custom, Mapping) else None,
+            price.get("daily_cheapest"),
+        )
+        cached = self._calendar_index
+        if cached is None or any(old is not new for old, new in zip(cached.source, source)):
+            daily = [window for window in source[2] or () if isinstance(window, PriceWindow)]
+            cached = WindowIntervalIndex(
+                source,
+                [
+                    *self._windows_by_event_id().items(),
+                    *((CALENDAR_DAILY_KEY, window) for window in daily),
+                ],
+            )
+            self._calendar_index = cached
+        return cached
+
+    @property
+    def calendar_daily_hours(self) -> int:
+        return self._calendar_daily_hours
+
+    @property
+    def deadline_hours(self) -> int:
+        return self._deadline_hours
+
+    @property
+    def deadline_time(self) -> time:
+        return self._deadline_time
+
+    @property
+    def helsinki_timezone(self) -> tzinfo:
+        """Zone the deadlines and windows are laid out in, for local attribute times."""
+        return self._get_helsinki_timezone()
+
+    def serialized_points(
+        self,
+        series: Sequence[SeriesPoint],
+        decimals: int | None = None,
+        offset: float = 0.0,
+    ) -> list[Mapping[str, Any]] | Mapping[str, Any]:
+        """``timestamp``/``value`` attribute rows for ``series``, built once per payload.
+
+        Rows are cached per (series, decimals) and handed out by identity. A new
+        ``offset`` (extra fees) rebuilds only the values; timestamp strings are kept.
+        With compact attributes enabled the series is encoded as one
+        ``{start, step, values}`` mapping instead (see ``_compact_points``).
+        """
+        version = self._section_versions.get(SECTION_SERIES, 0)
+        if self._serialized_for != version:
+            self._serialized_for = version
+            self._epoch_strings.clear()
+            self._timestamp_columns.clear()
+            self._serialized_points.clear()
+        key = (id(series), decimals)
+        cached = self._serialized_points.get(key)
+        if cached is not None and cached[0] is series and cached[1] == offset:
+            return cached[2]
+        if isinstance(series, PriceSeries):
+            values: Iterable[float] = series.values
+        else:
+            values = (point.value for point in series)
+        rows: list[Mapping[str, Any]] | Mapping[str, Any]
+        if self._compact_attributes:
+            rows = self._compact_points(
+                self._epoch_seconds(series),
+                [self._rounded_value(value + offset, decimals) for value in values],
+            )
+        else:
+            rows = [
+                {"timestamp": timestamp, "value": self._rounded_value(value + offset, decimals)}
+                for timestamp, value in zip(self._timestamp_column(series), values)
+            ]
+        self._serialized_points[key] = (series, offset, rows)
+        return rows
+
+    @staticmethod
+    def _epoch_seconds(series: Sequence[SeriesPoint]) -> list[int]:
+        if isinstance(series, PriceSeries):
+            return [epoch // 1_000_000 for epoch in series.epochs]
+        return [int(point.datetime.timestamp()) for point in series]
+
+    @staticmethod
+    def _compact_points(epochs: Sequence[int], values: Sequence[float | int]) -> dict[str, Any]:
+        """Encode a series as ``start`` (epoch seconds), ``step`` (seconds) and ``values``.
+
+        Point ``i`` starts at ``start + i * step``; hours missing from the series
+        are ``None`` in ``values`` so the grid stays regular.
+        """
+        if not epochs:
+            return {"start": None, "step": SLOT_SECONDS, "values": []}
+        start = epochs[0]
+        step = 0
+        for epoch in epochs:
+            step = math.gcd(step, epoch - start)
+        step = step or SLOT_SECONDS
+        grid: list[float | int | None] = [None] * ((epochs[-1] - start) // step + 1)
+        for epoch, value in zip(epochs, values):
+            grid[(epoch - start) // step] = value
+        return {"start": start, "step": step, "values": grid}
+
+    def _timestamp_column(self, series: Sequence[SeriesPoint]) -> list[str]:
+        cached = self._timestamp_columns.get(id(series))
+        if cached is not None and cached[0] is series:
+            return cached[1]
+        if isinstance(series, PriceSeries):
+            # Views of one series share epochs, so each hour is formatted once.
+            strings = self._epoch_strings
+            column = []
+            for epoch in series.epochs:
+                text = strings.get(epoch)
+                if text is None:
+                    text = strings[epoch] = (_EPOCH + timedelta(microseconds=epoch)).isoformat()
+                column.append(text)
+        else:
+            column = [point.datetime.isoformat() for point in series]
+        self._timestamp_columns[id(series)] = (series, column)
+        return column
+
+    @staticmethod
+    def _rounded_value(value: float, decimals: int | None) -> float | int:
+        if decimals is None:
+            return value
+        rounded = round(value, decimals)
+        if decimals == 0:
+            return int(rounded)
+        return rounded
+
+    def section_versions(self, sections: Iterable[str]) -> tuple[int, ...]:
+        """Change counters for ``sections``, bumped whenever listeners are notified."""
+        return tuple(self._section_versions.get(section, 0) for section in sections)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self._bump_section_versions()
+        super().async_update_listeners()
+        if self._listeners:
+            self._schedule_clock_tick()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        if self._poll_ceiling is not None:
+            self.update_interval = self._next_poll_interval(self._current_time())
+        super()._schedule_refresh()
+        self._schedule_clock_tick()
+
+    @callback
+    def _unschedule_refresh(self) -> None:
+        super()._unschedule_refresh()
+        self._unschedule_clock_tick()
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        self._unschedule_clock_tick()
+        if self._settings_flush is not None:
+            self._settings_flush.cancel()
+            self._settings_flush = None
+        self._pending_rebuilds.clear()
+
+    def _bump_section_versions(self) -> None:
+        # Tuples compare element-wise with an identity shortcut, so stage-cached
+        # objects cost nothing and freshly built ones are compared by value.
+        for section, token in self._section_snapshot().items():
+            if self._section_tokens.get(section) != token:
+                self._section_tokens[section] = token
+                self._section_versions[section] = self._section_versions.get(section, 0) + 1
+
+    def _section_snapshot(self) -> dict[str, tuple[Any, ...]]:
+        data = self.data if isinstance(self.data, Mapping) else {}
+        price = data.get("price")
+        if not isinstance(price, Mapping):
+            price = {}
+        wind = data.get("windpower")
+        if not isinstance(wind, Mapping):
+            wind = {}
+        return {
+            SECTION_STATUS: (self.last_update_success, self.stale),
+            SECTION_CLOCK: (self.current_time.replace(minute=0, second=0, microsecond=0),),
+            SECTION_PRICE: (
+                price.get("forecast"),
+                price.get("current"),
+                price.get("forecast_start"),
+                price.get("now"),
+                data.get("meta"),
+            ),
+            SECTION_DAILY_AVERAGES: (price.get("daily_averages"),),
+            SECTION_CHEAPEST_WINDOWS: (price.get("cheapest_windows"), price.get("cheapest_windows_meta")),
+            SECTION_CUSTOM_WINDOW: (price.get(CUSTOM_WINDOW_KEY),),
+            SECTION_WINDPOWER: (data.get("windpower"),),
+            SECTION_NARRATION: (data.get("narration"),),
+            SECTION_FEES: (self._extra_fees_cents,),
+            SECTION_SETTINGS: self._window_settings(),
+            SECTION_TIMESTAMPS: (price.get("window_edges"), price.get("next_day_boundary")),
+            SECTION_CALENDAR: (price.get("daily_cheapest"),),
+            SECTION_DEADLINE: (price.get("deadline_windows"),),
+            SECTION_SERIES: (price.get("forecast"), wind.get("series")),
+        }
+
+    def artifact_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Transfer and cache counters per deploy artifact."""
+        return {suffix: state.as_dict() for suffix, state in self._artifacts.items()}
+
+    def polling_diagnostics(self) -> dict[str, Any]:
+        """Adaptive poller bounds, learned publish times and current state."""
+        return {
+            "floor": str(self._poll_floor),
+            "ceiling": str(self._poll_ceiling),
+            "phase_seconds": int(self._poll_phase.total_seconds()),
+            "failures": self._poll_failures,
+            "next_interval": str(self.update_interval),
+            "publish_minutes_utc": {
+                suffix: list(minutes) for suffix, minutes in self._publish_minutes.items()
+            },
+        }
+
+    def mirror_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Latency, success rate and hedging counters per configured base URL."""
+        return {mirror: self._mirror_stats[mirror].as_dict() for mirror in self._ranked_mirrors()}
+
+    def host_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Circuit breaker state and failure counters per upstream host."""
+        now = self._current_time()
+        return {host: breaker.as_dict(now) for host, breaker in self._breakers.items()}
+
+    def freshness_diagnostics(self) -> dict[str, Any]:
+        """Staleness state and the last successful fetch per source."""
+        return {
+            "stale": self.stale,
+            "data_age": self.data_age(),
+            "max_staleness": str(self._max_staleness),
+            "fetched_at": {
+                source: fetched_at.isoformat() for source, fetched_at in self._fetched_at.items()
+            },
+        }
+
     def set_extra_fees_cents(self, value: float) -> None:
         try:
             normalized = float(value)
@@ -127,7 +1057,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._extra_fees_cents:
             return
         self._extra_fees_cents = normalized
-        self.async_update_listeners()
+        self._schedule_settings_update()
 
     @property
     def cheapest_window_lookahead_hours(self) -> int:
@@ -138,7 +1068,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._cheapest_window_lookahead_hours:
             return
         self._cheapest_window_lookahead_hours = normalized
-        self._rebuild_cheapest_windows_from_cached_data()
+        self._schedule_settings_update(_REBUILD_FIXED_WINDOWS)
 
     @property
     def cheapest_window_start_hour(self) -> int:
@@ -154,7 +1084,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._cheapest_window_start_hour:
             return
         self._cheapest_window_start_hour = normalized
-        self._rebuild_cheapest_windows_from_cached_data()
+        self._schedule_settings_update(_REBUILD_FIXED_WINDOWS)
 
     @property
     def cheapest_window_end_hour(self) -> int:
@@ -170,7 +1100,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._cheapest_window_end_hour:
             return
         self._cheapest_window_end_hour = normalized
-        self._rebuild_cheapest_windows_from_cached_data()
+        self._schedule_settings_update(_REBUILD_FIXED_WINDOWS)
 
     @property
     def custom_window_hours(self) -> int:
@@ -181,7 +1111,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._custom_window_hours:
             return
         self._custom_window_hours = normalized
-        self._rebuild_custom_window_from_cached_data()
+        self._schedule_settings_update(_REBUILD_CUSTOM_WINDOW)
 
     @property
     def custom_window_start_hour(self) -> int:
@@ -197,7 +1127,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._custom_window_start_hour:
             return
         self._custom_window_start_hour = normalized
-        self._rebuild_custom_window_from_cached_data()
+        self._schedule_settings_update(_REBUILD_CUSTOM_WINDOW)
 
     @property
     def custom_window_end_hour(self) -> int:
@@ -213,7 +1143,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._custom_window_end_hour:
             return
         self._custom_window_end_hour = normalized
-        self._rebuild_custom_window_from_cached_data()
+        self._schedule_settings_update(_REBUILD_CUSTOM_WINDOW)
 
     @property
     def custom_window_lookahead_hours(self) -> int:
@@ -224,7 +1154,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if normalized == self._custom_window_lookahead_hours:
             return
         self._custom_window_lookahead_hours = normalized
-        self._rebuild_custom_window_from_cached_data()
+        self._schedule_settings_update(_REBUILD_CUSTOM_WINDOW)
 
     @property
     def current_time(self) -> datetime:
@@ -237,151 +1167,758 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     #region _update
     async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            data = await self._async_fetch_update()
+        except Exception:
+            self._poll_failures += 1
+            raise
+        # Serving cached inputs counts as a failure so the poller keeps retrying.
+        self._poll_failures = self._poll_failures + 1 if self.stale else 0
+        return data
+
+    async def _async_fetch_update(self) -> dict[str, Any]:
         session = async_get_clientsession(self.hass)
         now = self._current_time()
         helsinki_tz = self._get_helsinki_timezone()
         helsinki_now = now.astimezone(helsinki_tz)
         
-        # Data cutoff: show all data from today midnight Helsinki onwards
-        today_midnight_helsinki = helsinki_now.replace(hour=0, minute=0, second=0, microsecond=0)
-        data_cutoff = today_midnight_helsinki.astimezone(timezone.utc)
-        
-
-        
-        try:
-            prediction_rows = await self._fetch_json(session, "prediction.json")
-        except FileNotFoundError as err:
-            raise UpdateFailed(f"prediction.json missing at {err}") from err
-        forecast_series = self._series_from_rows(prediction_rows)
-        
-
-        
-        # Filter forecast to show from today midnight onwards
-        forecast_from_today = [
-            point for point in forecast_series if point.datetime >= data_cutoff
-        ]
-        
 
         
         sahkotin_start_helsinki = helsinki_now.replace(hour=0, minute=0, second=0, microsecond=0)
         sahkotin_start = sahkotin_start_helsinki.astimezone(timezone.utc)
-        forecast_horizon = forecast_series[-1].datetime if forecast_series else now + timedelta(days=2)
-        sahkotin_end = max(now, forecast_horizon)
+        # Realized prices never reach past the day-ahead auction, which covers
+        # tomorrow at most; that bound is known before any response arrives.
+        sahkotin_end = self._next_helsinki_midnight(self._next_helsinki_midnight(now))
 
+        prediction_task = asyncio.create_task(self._fetch_json(session, "prediction.json"))
         sahkotin_task = asyncio.create_task(
-            self._safe_fetch_sahkotin_series(session, sahkotin_start, sahkotin_end)
+            self._async_realized_series(session, sahkotin_start, sahkotin_end, helsinki_now)
         )
-        narration_fi_task = asyncio.create_task(
-            self._safe_fetch_artifact_text(session, "narration.md")
+        artifact_tasks = {
+            suffix: asyncio.create_task(fetch(session, suffix))
+            for suffix, fetch in (
+                ("narration.md", self._safe_fetch_artifact_text),
+                ("narration_en.md", self._safe_fetch_artifact_text),
+                ("windpower.json", self._safe_fetch_artifact),
+            )
+        }
+        tasks = [prediction_task, sahkotin_task, *artifact_tasks.values()]
+        # Only prediction.json can raise; the other sources keep going when it
+        # does, so a forecast outage never holds back realized prices.
+        _, pending = await asyncio.wait(
+            tasks,
+            timeout=self._refresh_deadline(),
+            return_when=asyncio.ALL_COMPLETED,
         )
-        narration_en_task = asyncio.create_task(
-            self._safe_fetch_artifact_text(session, "narration_en.md")
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            if prediction_task.cancelled():
+                raise UpdateFailed(
+                    f"Timeout fetching {self._compose_url('prediction.json')} "
+                    f"within {self._refresh_deadline():.0f} s"
+                )
+            try:
+                prediction_rows = prediction_task.result()
+            except FileNotFoundError as err:
+                raise UpdateFailed(f"prediction.json missing at {err}") from err
+        except UpdateFailed as err:
+            forecast_key, forecast_series = self._stale_forecast(now, err)
+        else:
+            forecast_series = self._parsed_artifact(
+                "prediction.json", prediction_rows, self._series_from_rows
+            )
+            forecast_key = self._artifact_fingerprint("prediction.json", prediction_rows)
+
+        if sahkotin_task.cancelled():
+            _LOGGER.warning("Sähkötin prices missed the update deadline; using cached prices")
+            realized_series = self._cached_realized_series(sahkotin_start)
+        else:
+            realized_series = sahkotin_task.result()
+
+        artifacts: dict[str, Any] = {}
+        for suffix, task in artifact_tasks.items():
+            if task.cancelled():
+                _LOGGER.warning("Artifact %s missed the update deadline; reusing last copy", suffix)
+                artifacts[suffix] = self._stale_artifact(suffix)
+            else:
+                artifacts[suffix] = task.result()
+        narration_fi = artifacts["narration.md"]
+        narration_en = artifacts["narration_en.md"]
+        wind_rows = artifacts["windpower.json"]
+        wind_series = None
+        if wind_rows:
+            wind_series = self._parsed_artifact(
+                "windpower.json", wind_rows, self._series_from_rows
+            )
+
+        used = ["prediction.json", _SAHKOTIN_SOURCE]
+        used.extend(suffix for suffix, payload in artifacts.items() if payload is not None)
+        fetched = [self._fetched_at.get(source) for source in used]
+        known = [fetched_at for fetched_at in fetched if fetched_at is not None]
+        sources = _Sources(
+            forecast_key=forecast_key,
+            forecast=forecast_series,
+            realized=realized_series,
+            narration_fi=narration_fi,
+            narration_en=narration_en,
+            wind_key=self._artifact_fingerprint("windpower.json", wind_rows),
+            wind=wind_series,
+            fetched_at=min(known) if known else None,
+            stale=any(fetched_at is None or fetched_at < now for fetched_at in fetched),
         )
+        # The fetch start above only decides staleness; the awaits may have run
+        # past a clock tick, so derived data is built for the time it lands.
+        built_at = self._current_time()
+        data = self._build_data(built_at, sources)
+        self._sources = sources
+
+        previous = self.data
+        if self._same_content(previous, data):
+            # Nothing entities render has changed; keep the existing object so
+            # the coordinator skips notifying listeners.
+            previous["price"]["now"] = built_at
+            return previous
+        if not sources.stale:
+            await self._async_save_snapshot(built_at, sources)
+        return data
+
+    def _stale_artifact(self, suffix: str) -> Any:
+        """Last good payload of ``suffix`` while it is within the staleness limit."""
+        state = self._artifacts.get(suffix)
+        fetched_at = self._fetched_at.get(suffix)
+        if (
+            state is None
+            or state.payload is None
+            or fetched_at is None
+            or self._current_time() - fetched_at > self._max_staleness
+        ):
+            return None
+        return state.payload
+
+    def _stale_forecast(
+        self, now: datetime, err: UpdateFailed
+    ) -> tuple[Any, Sequence[SeriesPoint]]:
+        """Last good forecast while it is within the staleness limit; else re-raise."""
+        previous = self._sources
+        fetched_at = self._fetched_at.get("prediction.json")
+        if (
+            previous is None
+            or not previous.forecast
+            or fetched_at is None
+            or now - fetched_at > self._max_staleness
+        ):
+            raise err
+        # An open circuit was already reported when it opened.
+        log = _LOGGER.debug if isinstance(err, _CircuitOpen) else _LOGGER.warning
+        log("%s; serving the forecast fetched at %s until it succeeds", err, fetched_at.isoformat())
+        return previous.forecast_key, previous.forecast
+
+    def _build_data(
+        self,
+        now: datetime,
+        sources: _Sources,
+        snapshot_saved_at: datetime | None = None,
+    ) -> dict[str, Any]:
+        helsinki_tz = self._get_helsinki_timezone()
+        data_cutoff = self._data_cutoff(now)
 
-        realized_series = await sahkotin_task
-        narration_fi, narration_en = await asyncio.gather(narration_fi_task, narration_en_task)
+        # Filter forecast to show from today midnight onwards
+        forecast_from_today = self._stage(
+            "forecast",
+            (sources.forecast_key, data_cutoff),
+            lambda: self._points_since(sources.forecast, data_cutoff),
+        )
+        realized_series = sources.realized
         
 
         
-        merged_price_series = self._merge_price_series(realized_series, forecast_from_today)
+        merged_price_series, price_forecast_start = self._stage(
+            "merged",
+            (forecast_from_today, realized_series),
+            lambda: (
+                self._merge_price_series(realized_series, forecast_from_today),
+                self._forecast_start_from_segments(realized_series, forecast_from_today),
+            ),
+        )
         
 
         # Find current point from merged series
-        current_point = None
-        for point in merged_price_series:
-            if point.datetime <= now:
-                current_point = point
-            else:
-                break
-        
-        price_forecast_start = self._forecast_start_from_segments(realized_series, forecast_from_today)
-        current_hour_anchor = now.replace(minute=0, second=0, microsecond=0)
+        current_point = self._point_at_or_before(merged_price_series, now)
 
-        # Calculate cheapest windows using windows that may already be in progress
-        cheapest_windows: dict[int, PriceWindow | None] = {}
+        # Calculate cheapest windows using windows that may already be in progress.
+        # Prices are hour-aligned, so within one hour the clock only matters
+        # through its hour anchor.
         cheapest_window_lookahead_limit = self._cheapest_window_lookahead_limit(now)
-        mask_hours = self._mask_hours(
-            self._cheapest_window_start_hour,
-            self._cheapest_window_end_hour,
+        cheapest_windows, custom_window = self._stage(
+            "windows",
+            (
+                merged_price_series,
+                now.replace(minute=0, second=0, microsecond=0),
+                self._window_settings(),
+            ),
+            lambda: self._resolve_windows(merged_price_series, now, helsinki_tz),
         )
-        window_filter = self._build_start_hour_filter(mask_hours, helsinki_tz)
-        for hours in CHEAPEST_WINDOW_HOURS:
-            earliest_start = current_hour_anchor - timedelta(hours=hours - 1)
-            window = self._find_cheapest_window(
+        custom_window_entry = self._custom_window_entry(custom_window, now)
+        daily_averages = self._stage(
+            "daily_averages",
+            (merged_price_series,),
+            lambda: self._calculate_daily_averages(merged_price_series, helsinki_tz),
+        )
+        first_deadline = self._next_deadline(now, self._deadline_time)
+        deadline_windows = self._stage(
+            "deadline_windows",
+            (
                 merged_price_series,
-                hours,
-                earliest_start=earliest_start,
-                min_end=now,
-                max_end=cheapest_window_lookahead_limit,
-                window_filter=window_filter,
+                now.replace(minute=0, second=0, microsecond=0),
+                first_deadline,
+                self._deadline_hours,
+            ),
+            lambda: self._resolve_deadline_windows(
+                merged_price_series, now, self._deadline_hours, self._deadline_time
+            ),
+        )
+        deadline_windows = self._hold_started_deadline_window(deadline_windows, now)
+        daily_cheapest = self._stage(
+            "daily_cheapest",
+            (merged_price_series, daily_averages, self._calendar_daily_hours),
+            lambda: self._daily_cheapest_windows(merged_price_series, daily_averages),
+        )
+
+        data: dict[str, Any] = {
+            "price": {
+                "forecast": merged_price_series,
+                "current": current_point,
+                "cheapest_windows": cheapest_windows,
+                "cheapest_windows_meta": {
+                    "lookahead_hours": self._cheapest_window_lookahead_hours,
+                    "lookahead_limit": cheapest_window_lookahead_limit,
+                    "start_hour": self._cheapest_window_start_hour,
+                    "end_hour": self._cheapest_window_end_hour,
+                },
+                "now": now,
+                "forecast_start": price_forecast_start,
+                CUSTOM_WINDOW_KEY: custom_window_entry,
+                "daily_averages": daily_averages,
+                "window_edges": self._window_edge_times(cheapest_windows, custom_window),
+                "next_day_boundary": self._next_helsinki_midnight(now),
+                "daily_cheapest": daily_cheapest,
+                "deadline_windows": deadline_windows,
+            },
+            "windpower": None,
+            "narration": {
+                "fi": self._parsed_narration("narration.md", sources.narration_fi),
+                "en": self._parsed_narration("narration_en.md", sources.narration_en),
+            },
+            "meta": {
+                "base_url": self._base_url,
+                CONF_UPDATE_INTERVAL: self._poll_ceiling,
+                CONF_EXTRA_FEES: self._extra_fees_cents,
+                "snapshot_saved_at": snapshot_saved_at,
+                "stale": sources.stale,
+            },
+        }
+        
+
+        
+        if sources.wind:
+            wind_series = sources.wind
+            # Filter wind data to show from today midnight onwards
+            wind_from_today = self._stage(
+                "windpower",
+                (sources.wind_key, data_cutoff),
+                lambda: self._points_since(wind_series, data_cutoff),
             )
-            if window is None:
-                window = self._find_cheapest_window(
-                    merged_price_series,
-                    hours,
-                    earliest_start=earliest_start,
-                    max_end=cheapest_window_lookahead_limit,
-                    window_filter=window_filter,
+            wind_current = self._point_at_or_before(wind_from_today, now)
+            data["windpower"] = {
+                "series": wind_from_today,
+                "current": wind_current,
+            }
+
+        return data
+
+    @staticmethod
+    def _window_edge_times(
+        cheapest_windows: Mapping[int, PriceWindow | None],
+        custom_window: PriceWindow | None,
+    ) -> dict[str, dict[str, datetime | None]]:
+        """Start and end of every chosen window, keyed like the window events."""
+        windows: dict[str, PriceWindow | None] = {
+            f"{hours}h": cheapest_windows.get(hours) for hours in CHEAPEST_WINDOW_HOURS
+        }
+        windows[CUSTOM_WINDOW_KEY] = custom_window
+        return {
+            window_id: {
+                WINDOW_EDGE_START: window.start if window else None,
+                WINDOW_EDGE_END: window.end if window else None,
+            }
+            for window_id, window in windows.items()
+        }
+
+    def _next_helsinki_midnight(self, now: datetime) -> datetime:
+        helsinki_tz = self._get_helsinki_timezone()
+        local_midnight = datetime.combine(
+            now.astimezone(helsinki_tz).date() + timedelta(days=1),
+            time(0),
+            tzinfo=helsinki_tz,
+        )
+        return local_midnight.astimezone(timezone.utc)
+
+    def _data_cutoff(self, now: datetime) -> datetime:
+        """Today's Helsinki midnight in UTC; all data is shown from there on."""
+        helsinki_now = now.astimezone(self._get_helsinki_timezone())
+        today_midnight_helsinki = helsinki_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return today_midnight_helsinki.astimezone(timezone.utc)
+
+    #region _clock
+    @callback
+    def _schedule_clock_tick(self) -> None:
+        """Arm a local recompute at the next instant entity states can change."""
+        if self._sources is None:
+            return
+        now = self._current_time()
+        if self._window_events_until is None:
+            self._window_events_until = now
+        point = self._next_clock_boundary(now)
+        if point == self._clock_point and self._unsub_clock is not None:
+            return
+        self._unschedule_clock_tick()
+        self._clock_point = point
+        # A delay rather than a wall-clock point keeps this on the same clock as
+        # _current_time; a tick landing a hair early simply re-arms itself.
+        self._unsub_clock = async_call_later(
+            self.hass,
+            (point - now).total_seconds(),
+            self._async_clock_tick,
+        )
+
+    @callback
+    def _unschedule_clock_tick(self) -> None:
+        if self._unsub_clock is not None:
+            self._unsub_clock()
+        self._unsub_clock = None
+        self._clock_point = None
+
+    @callback
+    def _async_clock_tick(self, _: datetime) -> None:
+        """Re-derive time-dependent data from the cached inputs; nothing is fetched."""
+        self._unschedule_clock_tick()
+        data = self.data
+        if self._sources is not None and isinstance(data, dict):
+            now = self._current_time()
+            self._fire_window_events(now)
+            sources = self._sources
+            cutoff = self._data_cutoff(now)
+            realized = sources.realized
+            if realized and realized[0].datetime < cutoff:
+                sources = self._sources = replace(sources, realized=self._points_since(realized, cutoff))
+            meta = data.get("meta")
+            saved_at = meta.get("snapshot_saved_at") if isinstance(meta, Mapping) else None
+            rebuilt = self._build_data(now, sources, saved_at)
+            if self._same_content(data, rebuilt):
+                data["price"]["now"] = now
+            else:
+                # Assigned directly: async_set_updated_data would also push back
+                # the next network refresh.
+                self.data = rebuilt
+        self.async_update_listeners()
+
+    def _next_clock_boundary(self, now: datetime) -> datetime:
+        """Next slot boundary, window start/end or Helsinki midnight after ``now``."""
+        slot = timedelta(seconds=SLOT_SECONDS)
+        candidates = [
+            now - (now - _EPOCH) % slot + slot,
+            self._next_helsinki_midnight(now),
+        ]
+        candidates.extend(edge[0] for edge in self._window_edges() if edge[0] > now)
+        price = self.data.get("price") if isinstance(self.data, Mapping) else None
+        if isinstance(price, Mapping):
+            # The next deadline moves on as soon as the current one passes.
+            for entry in price.get("deadline_windows") or ():
+                if isinstance(entry, DeadlineWindow) and entry.deadline > now:
+                    candidates.append(entry.deadline)
+                    break
+            upcoming = self.time_index("price").at_or_after(now + timedelta(microseconds=1))
+            if upcoming is not None:
+                candidates.append(upcoming.datetime)
+        return min(candidates)
+
+    @callback
+    def async_window_leads_changed(self) -> None:
+        """Re-arm the clock after a device trigger added or dropped a lead time."""
+        self._schedule_clock_tick()
+
+    def _windows_by_event_id(self) -> dict[str, PriceWindow]:
+        price = self.data.get("price") if isinstance(self.data, Mapping) else None
+        if not isinstance(price, Mapping):
+            return {}
+        windows = {
+            f"{hours}h": window
+            for hours, window in (price.get("cheapest_windows") or {}).items()
+            if isinstance(window, PriceWindow)
+        }
+        custom = price.get(CUSTOM_WINDOW_KEY)
+        if isinstance(custom, Mapping) and isinstance(custom.get("window"), PriceWindow):
+            windows[CUSTOM_WINDOW_KEY] = custom["window"]
+        return windows
+
+    def _window_edges(self) -> list[tuple[datetime, str, str, int, PriceWindow]]:
+        """(instant, window id, edge, lead minutes, window) for every announced edge."""
+        registered = self.hass.data.get(DATA_WINDOW_LEADS, {}).get(self.entry_id) or {}
+        leads = {0, *(lead for lead, count in registered.items() if count > 0)}
+        edges: list[tuple[datetime, str, str, int, PriceWindow]] = []
+        for window_id, window in self._windows_by_event_id().items():
+            for edge, instant in ((WINDOW_EDGE_START, window.start), (WINDOW_EDGE_END, window.end)):
+                edges.extend(
+                    (instant - timedelta(minutes=lead), window_id, edge, lead, window)
+                    for lead in leads
                 )
-            cheapest_windows[hours] = window
+        return edges
+
+    def _fire_window_events(self, now: datetime) -> None:
+        """Fire the window events whose instant passed since the last check."""
+        since = self._window_events_until
+        self._window_events_until = now
+        if since is None:
+            return
+        for instant, window_id, edge, lead, window in sorted(
+            self._window_edges(), key=lambda item: item[0]
+        ):
+            if since < instant <= now:
+                self.hass.bus.async_fire(
+                    EVENT_WINDOW,
+                    {
+                        "entry_id": self.entry_id,
+                        "window": window_id,
+                        "edge": edge,
+                        "lead_minutes": lead,
+                        "start": window.start.isoformat(),
+                        "end": window.end.isoformat(),
+                        "average": round(window.average + self._extra_fees_cents, 3),
+                    },
+                )
+
+    #region _polling
+    def _next_poll_interval(self, now: datetime) -> timedelta:
+        """Delay before the next refresh, between the configured floor and ceiling.
 
-        custom_window_entry = self._build_custom_window_entry(
-            merged_price_series,
-            now,
-            helsinki_tz,
+        Failures back off exponentially with jitter. Otherwise the poller stays
+        at the floor inside an expected publish window and sleeps until the next
+        one (plus this installation's phase offset) outside of it.
+        """
+        floor = self._poll_floor
+        ceiling = self._poll_ceiling or floor
+        if self._poll_failures:
+            backoff = min(ceiling, floor * 2 ** min(self._poll_failures, 16))
+            return max(floor, backoff / 2 + backoff / 2 * random.random())
+        until_window = self._until_publish_window(now)
+        if until_window <= timedelta(0):
+            return floor
+        return max(floor, min(ceiling, until_window + self._poll_phase))
+
+    def _until_publish_window(self, now: datetime) -> timedelta:
+        """Time until the next expected publish window; zero while inside one."""
+        radius = PUBLISH_WINDOW_MINUTES
+        minute = now.hour * 60 + now.minute + now.second / 60
+        waits: list[float] = []
+        for minutes in self._publish_minutes.values():
+            for learned in self._recurring_publish_minutes(minutes):
+                distance = (minute - learned) % 1440
+                if distance <= radius or distance >= 1440 - radius:
+                    return timedelta(0)
+                waits.append((learned - radius - minute) % 1440)
+
+        helsinki_now = now.astimezone(self._get_helsinki_timezone())
+        day_ahead = helsinki_now.replace(
+            hour=DAY_AHEAD_RESULTS_START_HOUR, minute=0, second=0, microsecond=0
         )
+        if self._realized_slots and self._day_ahead_result_pending(self._realized_slots, helsinki_now):
+            return timedelta(0)
+        if day_ahead <= helsinki_now:
+            day_ahead = (day_ahead + timedelta(days=1)).replace(
+                hour=DAY_AHEAD_RESULTS_START_HOUR, minute=0, second=0, microsecond=0
+            )
+        waits.append((day_ahead - helsinki_now).total_seconds() / 60)
+        return timedelta(minutes=min(waits))
+
+    @staticmethod
+    def _recurring_publish_minutes(minutes: Iterable[int]) -> list[int]:
+        """Learned publish minutes that enough others cluster around.
+
+        Irregular or repeated daily deploys scatter across the day and never
+        gather into a cluster, so they leave the poller sparse.
+        """
+        radius = PUBLISH_WINDOW_MINUTES
+        learned = list(minutes)
+        return [
+            minute
+            for minute in learned
+            if sum(
+                1
+                for other in learned
+                if min((minute - other) % 1440, (other - minute) % 1440) <= radius
+            )
+            >= PUBLISH_MIN_REPEATS
+        ]
+
+    def _record_publish(self, suffix: str, last_modified: str | None) -> None:
+        """Remember when ``suffix`` changed, preferring the server's own timestamp."""
+        now = self._current_time()
+        published = now
+        if last_modified:
+            try:
+                parsed = parsedate_to_datetime(last_modified)
+            except (TypeError, ValueError):
+                parsed = None
+            # Only trust it when it describes this change rather than an old file.
+            if parsed is not None and parsed.tzinfo and (
+                timedelta(0) <= now - parsed <= (self._poll_ceiling or self._poll_floor)
+            ):
+                published = parsed.astimezone(timezone.utc)
+        minutes = self._publish_minutes.setdefault(suffix, deque(maxlen=PUBLISH_HISTORY_SIZE))
+        minutes.append(published.hour * 60 + published.minute)
+
+    def _restore_publish_minutes(self, stored: Any) -> None:
+        if not isinstance(stored, dict):
+            return
+        for suffix, values in stored.items():
+            if not isinstance(suffix, str) or not isinstance(values, list):
+                continue
+            minutes = deque(
+                (int(value) % 1440 for value in values if isinstance(value, int)),
+                maxlen=PUBLISH_HISTORY_SIZE,
+            )
+            if minutes:
+                self._publish_minutes[suffix] = minutes
+
+    #region _snapshot
+    async def async_restore_snapshot(self) -> bool:
+        """Serve the last good refresh from storage, if it is recent enough.
+
+        Snapshots older than the staleness limit are ignored, as a failed
+        refresh would no longer serve them either. Returns ``True`` when
+        coordinator data was populated from the snapshot; the caller is then
+        expected to revalidate it with a background refresh.
+        """
+        try:
+            stored = await self._snapshot_store.async_load()
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Could not restore last refresh snapshot: %s", err)
+            return False
+        if not isinstance(stored, dict):
+            return False
+        self._restore_publish_minutes(stored.get("publish_minutes"))
+        saved_at = self._parse_snapshot_time(stored.get("saved_at"))
+        forecast = self._series_from_snapshot(stored.get("forecast"))
+        if saved_at is None or not forecast:
+            return False
+        now = self._current_time()
+        if now - saved_at > self._max_staleness:
+            _LOGGER.debug(
+                "Ignoring refresh snapshot saved at %s; older than the staleness limit",
+                saved_at.isoformat(),
+            )
+            return False
+        narration = stored.get("narration")
+        if not isinstance(narration, dict):
+            narration = {}
+        wind = self._series_from_snapshot(stored.get("windpower")) or None
+        forecast_key = stored.get("forecast_key")
+        wind_key = stored.get("windpower_key")
+        sources = _Sources(
+            forecast_key=forecast_key if isinstance(forecast_key, str) else forecast,
+            forecast=forecast,
+            realized=self._points_since(
+                self._realized_series_from_slots(await self._async_load_realized_slots()),
+                self._data_cutoff(now),
+            ),
+            narration_fi=self._snapshot_text(narration.get("fi")),
+            narration_en=self._snapshot_text(narration.get("en")),
+            wind_key=wind_key if isinstance(wind_key, str) else wind,
+            wind=wind,
+            fetched_at=saved_at,
+            stale=True,
+        )
+        for source in ("prediction.json", "windpower.json", "narration.md", "narration_en.md"):
+            self._fetched_at.setdefault(source, saved_at)
+        self._sources = sources
+        self.async_set_updated_data(self._build_data(now, sources, saved_at))
+        _LOGGER.debug("Restored refresh snapshot saved at %s", saved_at.isoformat())
+        return True
+
+    async def _async_save_snapshot(self, now: datetime, sources: _Sources) -> None:
+        data_cutoff = self._data_cutoff(now)
+        await self._snapshot_store.async_save(
+            {
+                "saved_at": now.isoformat(),
+                "forecast_key": sources.forecast_key if isinstance(sources.forecast_key, str) else None,
+                "forecast": self._series_to_snapshot(sources.forecast, data_cutoff),
+                "windpower_key": sources.wind_key if isinstance(sources.wind_key, str) else None,
+                "windpower": self._series_to_snapshot(sources.wind or [], data_cutoff),
+                "narration": {"fi": sources.narration_fi, "en": sources.narration_en},
+                "publish_minutes": {
+                    suffix: list(minutes) for suffix, minutes in self._publish_minutes.items()
+                },
+            }
+        )
+
+    @staticmethod
+    def _series_to_snapshot(series: Sequence[SeriesPoint], since: datetime) -> list[list[float]]:
+        return [
+            [int(point.datetime.timestamp()), point.value]
+            for point in series
+            if point.datetime >= since
+        ]
+
+    @staticmethod
+    def _series_from_snapshot(rows: Any) -> PriceSeries:
+        series: list[SeriesPoint] = []
+        for row in rows if isinstance(rows, list) else []:
+            try:
+                series.append(
+                    SeriesPoint(datetime.fromtimestamp(int(row[0]), tz=timezone.utc), float(row[1]))
+                )
+            except (TypeError, ValueError, IndexError, OverflowError, OSError):
+                continue
+        series.sort(key=lambda item: item.datetime)
+        return PriceSeries.from_points(series)
+
+    @staticmethod
+    def _parse_snapshot_time(value: Any) -> datetime | None:
+        if not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _snapshot_text(value: Any) -> str | None:
+        return value if isinstance(value, str) else None
+
+    def _stage[T](self, name: str, key: Any, build: Callable[[], T]) -> T:
+        """Return the cached output of stage ``name`` unless its inputs changed."""
+        cached = self._stages.get(name)
+        if cached is not None and cached.key == key:
+            return cached.value
+        value = build()
+        self._stages[name] = _StageResult(key=key, value=value)
+        return value
+
+    def _window_settings(self) -> tuple[int, ...]:
+        return (
+            self._cheapest_window_lookahead_hours,
+            self._cheapest_window_start_hour,
+            self._cheapest_window_end_hour,
+            self._custom_window_hours,
+            self._custom_window_start_hour,
+            self._custom_window_end_hour,
+            self._custom_window_lookahead_hours,
+        )
+
+    @staticmethod
+    def _same_content(previous: Any, data: dict[str, Any]) -> bool:
+        if not isinstance(previous, dict) or not isinstance(previous.get("price"), dict):
+            return False
+        if any(previous.get(key) != value for key, value in data.items() if key != "price"):
+            return False
+        previous_price = previous["price"]
+        return all(
+            previous_price.get(key) == value
+            for key, value in data["price"].items()
+            if key != "now"
+        )
+
+    #region _realized
+    async def _async_realized_series(
+        self,
+        session,
+        day_start: datetime,
+        end: datetime,
+        helsinki_now: datetime,
+    ) -> PriceSeries:
+        """Realized prices from ``day_start`` on, fetching only what is not cached.
+
+        Past slots never change, so normally only the span after the last known
+        slot is requested. While the next day's auction result is due, the full
+        span is requested again so late revisions are picked up.
+        """
+        slots = await self._async_load_realized_slots()
+        cutoff = int(day_start.timestamp())
+        changed = False
+        for slot in [slot for slot in slots if slot < cutoff]:
+            del slots[slot]
+            changed = True
+
+        fetch_start = day_start
+        if slots and not self._day_ahead_result_pending(slots, helsinki_now):
+            fetch_start = max(
+                day_start,
+                datetime.fromtimestamp(max(slots) + SLOT_SECONDS, tz=timezone.utc),
+            )
+        if fetch_start > end:
+            # Everything up to the horizon is already known.
+            self._fetched_at[_SAHKOTIN_SOURCE] = self._current_time()
+        else:
+            fetched = await self._safe_fetch_sahkotin_series(session, fetch_start, end)
+            for point in fetched:
+                slot = int(point.datetime.timestamp())
+                if slot >= cutoff and slots.get(slot) != point.value:
+                    slots[slot] = point.value
+                    changed = True
+
+        if changed:
+            self._realized_series = None
+            await self._realized_store.async_save(
+                {"slots": [[slot, value] for slot, value in sorted(slots.items())]}
+            )
+        return self._realized_series_from_slots(slots)
 
-        data: dict[str, Any] = {
-            "price": {
-                "forecast": merged_price_series,
-                "current": current_point,
-                "cheapest_windows": cheapest_windows,
-                "cheapest_windows_meta": {
-                    "lookahead_hours": self._cheapest_window_lookahead_hours,
-                    "lookahead_limit": cheapest_window_lookahead_limit,
-                    "start_hour": self._cheapest_window_start_hour,
-                    "end_hour": self._cheapest_window_end_hour,
-                },
-                "now": now,
-                "forecast_start": price_forecast_start,
-                CUSTOM_WINDOW_KEY: custom_window_entry,
-                "daily_averages": self._calculate_daily_averages(
-                    merged_price_series,
-                    helsinki_tz,
-                ),
-            },
-            "windpower": None,
-            "narration": {
-                "fi": self._build_narration_section("narration.md", narration_fi),
-                "en": self._build_narration_section("narration_en.md", narration_en),
-            },
-            "meta": {
-                "base_url": self._base_url,
-                CONF_UPDATE_INTERVAL: self.update_interval,
-                CONF_EXTRA_FEES: self._extra_fees_cents,
-            },
-        }
-        
+    def _cached_realized_series(self, day_start: datetime) -> Sequence[SeriesPoint]:
+        """Realized prices already known, without touching the network."""
+        if self._realized_slots is None:
+            return []
+        return self._points_since(self._realized_series_from_slots(self._realized_slots), day_start)
+
+    def _realized_series_from_slots(self, slots: dict[int, float]) -> PriceSeries:
+        if self._realized_series is None:
+            ordered = sorted(slots.items())
+            self._realized_series = PriceSeries(
+                array("q", (slot * 1_000_000 for slot, _ in ordered)),
+                array("d", (value for _, value in ordered)),
+            )
+        return self._realized_series
 
-        
-        wind_rows = await self._safe_fetch_artifact(session, "windpower.json")
-        if wind_rows:
-            wind_series = self._series_from_rows(wind_rows)
-            # Filter wind data to show from today midnight onwards
-            wind_from_today = [point for point in wind_series if point.datetime >= data_cutoff]
-            wind_current = None
-            for point in wind_from_today:
-                if point.datetime <= now:
-                    wind_current = point
-                else:
-                    break
-            data["windpower"] = {
-                "series": wind_from_today,
-                "current": wind_current,
-            }
-        
+    async def _async_load_realized_slots(self) -> dict[int, float]:
+        if self._realized_slots is not None:
+            return self._realized_slots
+        slots: dict[int, float] = {}
+        try:
+            stored = await self._realized_store.async_load()
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Could not restore cached realized prices: %s", err)
+            stored = None
+        if isinstance(stored, dict):
+            for row in stored.get("slots") or []:
+                try:
+                    slots[int(row[0])] = float(row[1])
+                except (TypeError, ValueError, IndexError):
+                    continue
+        self._realized_slots = slots
+        return slots
 
-        return data
+    @staticmethod
+    def _day_ahead_result_pending(slots: dict[int, float], helsinki_now: datetime) -> bool:
+        if not DAY_AHEAD_RESULTS_START_HOUR <= helsinki_now.hour < DAY_AHEAD_RESULTS_END_HOUR:
+            return False
+        tomorrow = (helsinki_now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return max(slots) < tomorrow.timestamp()
 
     #region _fetch
     async def _safe_fetch_artifact(self, session, suffix: str) -> list[Any] | None:
@@ -390,6 +1927,8 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except FileNotFoundError:
             _LOGGER.debug("Artifact %s not present at %s", suffix, self._compose_url(suffix))
             return None
+        except _CircuitOpen as err:
+            _LOGGER.debug("Skipping artifact %s: %s", suffix, err)
         except UpdateFailed as err:
             _LOGGER.warning("Could not refresh artifact %s: %s", suffix, err)
         except ClientError as err:
@@ -398,7 +1937,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Invalid JSON for artifact %s: %s", suffix, err)
         except asyncio.TimeoutError:
             _LOGGER.warning("Timeout reaching artifact %s", suffix)
-        return None
+        return self._stale_artifact(suffix)
 
     async def _safe_fetch_artifact_text(self, session, suffix: str) -> str | None:
         try:
@@ -406,15 +1945,16 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except FileNotFoundError:
             _LOGGER.debug("Artifact %s not present at %s", suffix, self._compose_url(suffix))
             return None
+        except _CircuitOpen as err:
+            _LOGGER.debug("Skipping artifact %s: %s", suffix, err)
         except UpdateFailed as err:
             _LOGGER.warning("Could not refresh artifact %s: %s", suffix, err)
         except ClientError as err:
             _LOGGER.warning("Network error fetching artifact %s: %s", suffix, err)
         except asyncio.TimeoutError:
             _LOGGER.warning("Timeout reaching artifact %s", suffix)
-        return None
+        return self._stale_artifact(suffix)
 
-    
     async def _safe_fetch_sahkotin_series(
         self,
         session,
@@ -423,6 +1963,9 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> list[SeriesPoint]:
         try:
             csv_text = await self._fetch_sahkotin_csv(session, start, end)
+        except _CircuitOpen as err:
+            _LOGGER.debug("Skipping Sähkötin prices: %s", err)
+            return []
         except UpdateFailed as err:
             _LOGGER.warning("Could not refresh Sähkötin prices: %s", err)
             return []
@@ -433,48 +1976,239 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Timeout reaching Sähkötin prices")
             return []
 
+        self._fetched_at[_SAHKOTIN_SOURCE] = self._current_time()
         return self._parse_sahkotin_csv(csv_text, start)
 
     
     async def _fetch_json(self, session, suffix: str) -> list[Any]:
         url = self._compose_url(suffix)
         try:
-            async with async_timeout.timeout(20):
-                async with session.get(url) as response:
-                    try:
-                        response.raise_for_status()
-                    except ClientResponseError as err:
-                        if err.status == 404:
-                            raise FileNotFoundError(url) from err
-                        raise
-                    try:
-                        return await response.json(content_type=None)
-                    except ValueError as err:
-                        raise UpdateFailed(f"Invalid JSON from {url}") from err
+            body, copy = await self._fetch_artifact(session, suffix)
         except asyncio.TimeoutError as err:
             raise UpdateFailed(f"Timeout fetching {url}") from err
-        except ContentTypeError as err:
-            raise UpdateFailed(f"Non-JSON response from {url}") from err
         except ClientError as err:
             raise UpdateFailed(f"Network error fetching {url}") from err
+        if body is not None:
+            started = perf_counter()
+            try:
+                copy.payload = json.loads(body)
+            except ValueError as err:
+                # Do not let the broken body's fingerprint vouch for the old payload.
+                copy.fingerprint = None
+                copy.payload = None
+                raise UpdateFailed(f"Invalid JSON from {url}") from err
+            self._artifacts[suffix].decode_seconds = perf_counter() - started
+        self._fetched_at[suffix] = self._current_time()
+        return self._accept_copy(suffix, copy)
 
-    
     async def _fetch_text(self, session, suffix: str) -> str:
         url = self._compose_url(suffix)
         try:
-            async with async_timeout.timeout(20):
-                async with session.get(url) as response:
-                    try:
-                        response.raise_for_status()
-                    except ClientResponseError as err:
-                        if err.status == 404:
-                            raise FileNotFoundError(url) from err
-                        raise
-                    return await response.text()
+            body, copy = await self._fetch_artifact(session, suffix)
         except asyncio.TimeoutError as err:
             raise UpdateFailed(f"Timeout fetching {url}") from err
         except ClientError as err:
             raise UpdateFailed(f"Network error fetching {url}") from err
+        self._fetched_at[suffix] = self._current_time()
+        if body is not None:
+            started = perf_counter()
+            copy.payload = body.decode("utf-8", errors="replace")
+            self._artifacts[suffix].decode_seconds = perf_counter() - started
+        return self._accept_copy(suffix, copy)
+
+    def _accept_copy(self, suffix: str, copy: _MirrorCopy) -> Any:
+        """Make ``copy`` the artifact's current payload and return it."""
+        state = self._artifacts[suffix]
+        state.payload = copy.payload
+        state.fingerprint = copy.fingerprint
+        state.etag = copy.etag
+        state.last_modified = copy.last_modified
+        return copy.payload
+
+    
+    async def _fetch_artifact(self, session, suffix: str) -> tuple[bytes | None, _MirrorCopy]:
+        """Conditional GET of ``suffix`` from the best mirror, hedged to the next ones."""
+
+        async def _from(base: str) -> tuple[bytes | None, _MirrorCopy]:
+            return await self._request(
+                f"{base}/{suffix}", lambda: self._conditional_get(session, base, suffix)
+            )
+
+        return await self._hedged(_from)
+
+    async def _hedged[T](self, fetch: Callable[[str], Awaitable[T]]) -> T:
+        """First good answer of ``fetch`` across the ranked mirrors.
+
+        The best mirror is asked first. If it fails, or has not answered within
+        its hedge delay, the next one is asked as well; once one answers, the
+        requests still in flight are cancelled.
+        """
+        ranked = self._ranked_mirrors()
+        if len(ranked) == 1:
+            return await self._timed_fetch(ranked[0], fetch)
+        candidates = iter(ranked)
+        running: dict[asyncio.Task[T], str] = {}
+        last_error: BaseException | None = None
+
+        def _launch(hedge: bool) -> bool:
+            base = next(candidates, None)
+            if base is None:
+                return False
+            if hedge:
+                self._mirror_stats[base].hedges += 1
+            running[asyncio.create_task(self._timed_fetch(base, fetch))] = base
+            return True
+
+        more = _launch(hedge=False)
+        try:
+            while running:
+                first = next(iter(running.values()))
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self._hedge_delay(first) if more else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    more = _launch(hedge=True)
+                    continue
+                for task in done:
+                    base = running.pop(task)
+                    if task.exception() is None:
+                        self._mirror_stats[base].wins += 1
+                        return task.result()
+                    last_error = task.exception()
+                if not running:
+                    more = _launch(hedge=False)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        assert last_error is not None
+        raise last_error
+
+    async def _timed_fetch[T](self, base: str, fetch: Callable[[str], Awaitable[T]]) -> T:
+        stats = self._mirror_stats[base]
+        started = perf_counter()
+        try:
+            result = await fetch(base)
+        except _CircuitOpen:
+            # The host breaker already accounts for it; skipping is not slowness.
+            raise
+        except FileNotFoundError:
+            # The mirror answered; it just does not have the file.
+            stats.requests += 1
+            stats.successes += 1
+            stats.latencies.append(perf_counter() - started)
+            raise
+        except Exception:
+            stats.requests += 1
+            stats.failures += 1
+            raise
+        stats.requests += 1
+        stats.successes += 1
+        stats.latencies.append(perf_counter() - started)
+        return result
+
+    def _ranked_mirrors(self) -> list[str]:
+        """Mirrors by expected cost, open circuits last, configured order on ties."""
+        now = self._current_time()
+
+        def _key(indexed: tuple[int, str]) -> tuple[bool, float, int]:
+            index, mirror = indexed
+            breaker = self._breakers.get(urlsplit(mirror).netloc)
+            circuit_open = breaker is not None and breaker.state(now) == "open"
+            return circuit_open, self._mirror_stats[mirror].cost(), index
+
+        return [mirror for _, mirror in sorted(enumerate(self._mirrors), key=_key)]
+
+    def _hedge_delay(self, base: str) -> float:
+        """Seconds to wait on ``base`` before hedging to the next mirror."""
+        tail = self._mirror_stats[base].percentile(HEDGE_PERCENTILE)
+        if tail is None or len(self._mirror_stats[base].latencies) < 5:
+            tail = HEDGE_DEFAULT_DELAY_SECONDS
+        return min(max(tail, HEDGE_MIN_DELAY_SECONDS), self._request_timeout)
+
+    async def _conditional_get(
+        self, session, base: str, suffix: str
+    ) -> tuple[bytes | None, _MirrorCopy]:
+        """GET an artifact from ``base`` with the validators that mirror issued.
+
+        Returns ``None`` as the body when the mirror's copy is still current,
+        either because it answered 304 or the body hashes the same. Publish
+        times are only learned from a mirror's own copy changing, so mirrors
+        that lag each other never look like fresh publications.
+        """
+        url = f"{base}/{suffix}"
+        state = self._artifacts.setdefault(suffix, _ArtifactState())
+        copy = self._mirror_copies.setdefault((base, suffix), _MirrorCopy())
+        conditional: dict[str, str] = {}
+        if copy.payload is not None:
+            if copy.etag:
+                conditional["If-None-Match"] = copy.etag
+            if copy.last_modified:
+                conditional["If-Modified-Since"] = copy.last_modified
+        # A 304 with no copy to reuse (validators from elsewhere, a shared
+        # cache) is followed by one unconditional GET past any cache.
+        for headers in (conditional, {"Cache-Control": "no-cache"}):
+            state.requests += 1
+            async with session.get(url, headers=headers, timeout=self._client_timeout) as response:
+                if response.status == 304:
+                    if copy.payload is None:
+                        continue
+                    state.not_modified += 1
+                    state.last_bytes = 0
+                    return None, copy
+                try:
+                    response.raise_for_status()
+                except ClientResponseError as err:
+                    if err.status == 404:
+                        raise FileNotFoundError(url) from err
+                    raise
+                body = await response.read()
+                copy.etag = response.headers.get("ETag")
+                copy.last_modified = response.headers.get("Last-Modified")
+                state.last_bytes = len(body)
+                state.total_bytes += len(body)
+                fingerprint = hashlib.blake2b(body, digest_size=16).hexdigest()
+                if fingerprint == copy.fingerprint and copy.payload is not None:
+                    # Byte-identical to this mirror's copy: skip decoding altogether.
+                    state.unchanged += 1
+                    return None, copy
+                if copy.fingerprint is not None:
+                    self._record_publish(suffix, copy.last_modified)
+                copy.fingerprint = fingerprint
+                return body, copy
+        raise UpdateFailed(f"{url} answered 304 with no cached copy to reuse")
+
+    def _artifact_fingerprint(self, suffix: str, payload: Any) -> Any:
+        """Content key for ``payload``: its body hash when known, else the payload."""
+        state = self._artifacts.get(suffix)
+        if state is not None and state.payload is payload and state.fingerprint:
+            return state.fingerprint
+        return payload
+
+    def _parsed_artifact[T](self, suffix: str, payload: Any, parser: Callable[[Any], T]) -> T:
+        """Run ``parser`` on ``payload`` unless it already ran on this exact payload."""
+        state = self._artifacts.setdefault(suffix, _ArtifactState())
+        if state.parsed_source is payload and state.parsed is not None:
+            state.parse_hits += 1
+            return state.parsed
+        started = perf_counter()
+        parsed = parser(payload)
+        state.parse_seconds = perf_counter() - started
+        state.parsed = parsed
+        state.parsed_source = payload
+        return parsed
+
+    def _parsed_narration(self, suffix: str, content: str | None) -> dict[str, str] | None:
+        if content is None:
+            return None
+        return self._parsed_artifact(
+            suffix,
+            content,
+            lambda text: self._build_narration_section(suffix, text),
+        )
 
     
     async def _fetch_sahkotin_csv(
@@ -490,27 +2224,101 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "end": end.replace(microsecond=0).isoformat(),
         }
         url = f"{SAHKOTIN_BASE_URL}?{urlencode(params)}"
+
+        async def _send() -> str:
+            async with session.get(url, timeout=self._client_timeout) as response:
+                response.raise_for_status()
+                return await response.text()
+
         try:
-            async with async_timeout.timeout(20):
-                async with session.get(url) as response:
-                    try:
-                        response.raise_for_status()
-                    except ClientResponseError as err:
-                        if err.status == 404:
-                            raise UpdateFailed(f"Sähkötin returned 404 for {url}") from err
-                        raise UpdateFailed(f"Sähkötin request failed: {err}") from err
-                    return await response.text()
+            return await self._request(url, _send)
         except asyncio.TimeoutError as err:
             raise UpdateFailed(f"Timeout fetching {url}") from err
+        except ClientResponseError as err:
+            if err.status == 404:
+                raise UpdateFailed(f"Sähkötin returned 404 for {url}") from err
+            raise UpdateFailed(f"Sähkötin request failed: {err}") from err
         except ClientError as err:
             raise UpdateFailed(f"Network error fetching {url}") from err
 
+    async def _request[T](self, url: str, send: Callable[[], Awaitable[T]]) -> T:
+        """Run ``send`` behind ``url``'s host breaker, retrying transient failures.
+
+        Timeouts, connection errors, 429 and 5xx answers are retried with a
+        doubling, jittered delay; a request still failing once its retries are
+        spent counts once against the host. Any other outcome, 404 included,
+        shows the host is up.
+        """
+        host = urlsplit(url).netloc
+        breaker = self._breakers.setdefault(host, _HostBreaker())
+        attempt = 0
+        while True:
+            if breaker.state(self._current_time()) == "open":
+                breaker.short_circuits += 1
+                raise _CircuitOpen(
+                    f"{host} is failing; requests paused until {breaker.opened_until.isoformat()}"
+                )
+            breaker.requests += 1
+            try:
+                async with async_timeout.timeout(self._request_timeout):
+                    result = await send()
+            except (asyncio.TimeoutError, ClientError) as err:
+                if not self._transient_error(err):
+                    self._host_succeeded(host, breaker)
+                    raise
+                breaker.errors += 1
+                breaker.last_error = repr(err)
+                if attempt >= FETCH_RETRIES:
+                    self._host_failed(host, breaker, err)
+                    raise
+            except FileNotFoundError:
+                self._host_succeeded(host, breaker)
+                raise
+            else:
+                self._host_succeeded(host, breaker)
+                return result
+            breaker.retries += 1
+            await asyncio.sleep(FETCH_RETRY_DELAY_SECONDS * 2**attempt * (0.5 + random.random() / 2))
+            attempt += 1
+
+    def _refresh_deadline(self) -> float:
+        """Refresh budget: every attempt of one request plus the delays between them."""
+        delays = FETCH_RETRY_DELAY_SECONDS * (2**FETCH_RETRIES - 1)
+        return self._request_timeout * (FETCH_RETRIES + 1) + delays
+
+    @staticmethod
+    def _transient_error(err: BaseException) -> bool:
+        if isinstance(err, ClientResponseError):
+            return err.status >= 500 or err.status == 429
+        return True
+
+    def _host_failed(self, host: str, breaker: _HostBreaker, err: BaseException) -> None:
+        breaker.failures += 1
+        if breaker.failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        if breaker.opened_until is None:
+            _LOGGER.warning(
+                "%s failed %d times in a row (%r); pausing requests for %d s",
+                host,
+                breaker.failures,
+                err,
+                BREAKER_COOLDOWN_SECONDS,
+            )
+        breaker.opened_until = self._current_time() + timedelta(seconds=BREAKER_COOLDOWN_SECONDS)
+
+    @staticmethod
+    def _host_succeeded(host: str, breaker: _HostBreaker) -> None:
+        if breaker.opened_until is not None:
+            _LOGGER.info("%s is reachable again; resuming requests", host)
+        breaker.failures = 0
+        breaker.opened_until = None
+
     
     def _compose_url(self, suffix: str) -> str:
         return f"{self._base_url}/{suffix}"
 
     #region _parse
-    def _series_from_rows(self, rows: list[Any]) -> list[SeriesPoint]:
+    def _series_from_rows(self, rows: list[Any]) -> PriceSeries:
         series: list[SeriesPoint] = []
         for row in rows or []:
             if not isinstance(row, (list, tuple)) or len(row) < 2:
@@ -521,7 +2329,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue
             series.append(SeriesPoint(datetime=timestamp, value=value))
         series.sort(key=lambda item: item.datetime)
-        return series
+        return PriceSeries.from_points(series)
 
     @staticmethod
     
@@ -548,56 +2356,294 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _current_time() -> datetime:
         return datetime.now(timezone.utc)
 
-    #region _custom_window
-    def _rebuild_custom_window_from_cached_data(self) -> None:
-        data = self.data
-        if not isinstance(data, dict):
-            self.async_update_listeners()
-            return
-        price_section = data.get("price")
-        if not isinstance(price_section, dict):
-            self.async_update_listeners()
-            return
-        series = price_section.get("forecast")
-        if not isinstance(series, list):
-            price_section[CUSTOM_WINDOW_KEY] = self._empty_custom_window_entry()
-            self.async_update_listeners()
-            return
-        now = price_section.get("now")
-        if not isinstance(now, datetime):
-            now = self._current_time()
-        helsinki_tz = self._get_helsinki_timezone()
-        price_section[CUSTOM_WINDOW_KEY] = self._build_custom_window_entry(series, now, helsinki_tz)
+    #region _settings
+    def _schedule_settings_update(self, *rebuilds: str) -> None:
+        """Coalesce setting changes into one rebuild and one notification.
+
+        Number entities restoring at startup, or a burst of UI changes, each land
+        here; the work runs once on the next event loop iteration.
+        """
+        self._pending_rebuilds.update(rebuilds)
+        if self._settings_flush is None:
+            self._settings_flush = self.hass.async_create_task(
+                self._async_flush_settings(),
+                f"{DOMAIN}_settings_{self.entry_id}",
+                eager_start=False,
+            )
+
+    async def _async_flush_settings(self) -> None:
+        self._settings_flush = None
+        pending, self._pending_rebuilds = self._pending_rebuilds, set()
+        if pending:
+            self._rebuild_windows_from_cached_data(
+                fixed=_REBUILD_FIXED_WINDOWS in pending,
+                custom=_REBUILD_CUSTOM_WINDOW in pending,
+            )
         self.async_update_listeners()
 
-    def _rebuild_cheapest_windows_from_cached_data(self) -> None:
+    def _rebuild_windows_from_cached_data(self, *, fixed: bool = True, custom: bool = True) -> None:
+        """Re-resolve the fixed and/or custom windows in place, in a single scan."""
         data = self.data
-        if not isinstance(data, dict):
-            self.async_update_listeners()
-            return
-        price_section = data.get("price")
+        price_section = data.get("price") if isinstance(data, dict) else None
         if not isinstance(price_section, dict):
-            self.async_update_listeners()
             return
         series = price_section.get("forecast")
-        if not isinstance(series, list):
-            self.async_update_listeners()
+        if not isinstance(series, (list, PriceSeries)):
+            if custom:
+                price_section[CUSTOM_WINDOW_KEY] = self._empty_custom_window_entry()
             return
-        series_points = [point for point in series if isinstance(point, SeriesPoint)]
+        series_points = (
+            series
+            if isinstance(series, PriceSeries)
+            else [point for point in series if isinstance(point, SeriesPoint)]
+        )
         now = price_section.get("now")
         if not isinstance(now, datetime):
             now = self._current_time()
-        if not series_points:
-            price_section["cheapest_windows"] = {hours: None for hours in CHEAPEST_WINDOW_HOURS}
+        helsinki_tz = self._get_helsinki_timezone()
+        queries: dict[int | str, _WindowQuery] = {}
+        if fixed:
+            queries.update(self._cheapest_window_queries(now, helsinki_tz))
+        custom_query = self._custom_window_query(now, helsinki_tz) if custom else None
+        if custom_query is not None:
+            queries[CUSTOM_WINDOW_KEY] = custom_query
+        results = self._find_cheapest_windows(series_points, queries) if series_points else {}
+        if fixed:
+            price_section["cheapest_windows"] = {
+                hours: results.get(hours) for hours in CHEAPEST_WINDOW_HOURS
+            }
             price_section["cheapest_windows_meta"] = {
                 "lookahead_hours": self._cheapest_window_lookahead_hours,
                 "lookahead_limit": self._cheapest_window_lookahead_limit(now),
                 "start_hour": self._cheapest_window_start_hour,
                 "end_hour": self._cheapest_window_end_hour,
             }
-            self.async_update_listeners()
-            return
+        if custom:
+            price_section[CUSTOM_WINDOW_KEY] = self._custom_window_entry(
+                results.get(CUSTOM_WINDOW_KEY),
+                now,
+            )
+        custom_entry = price_section.get(CUSTOM_WINDOW_KEY)
+        price_section["window_edges"] = self._window_edge_times(
+            price_section.get("cheapest_windows") or {},
+            custom_entry.get("window") if isinstance(custom_entry, Mapping) else None,
+        )
+
+    def _daily_cheapest_windows(
+        self,
+        series: Sequence[SeriesPoint],
+        daily_averages: Sequence[DailyAverage],
+    ) -> list[PriceWindow]:
+        """Cheapest block of the calendar's daily length inside each Helsinki day."""
+        hours = self._calendar_daily_hours
+        if hours <= 0 or not series:
+            return []
+        queries = {
+            day.date: _WindowQuery(hours=hours, earliest_start=day.start, max_end=day.end)
+            for day in daily_averages
+        }
+        results = self._find_cheapest_windows(series, queries)
+        return [window for window in results.values() if window is not None]
+
+    #region _on_demand
+    def find_cheapest_window(
+        self,
+        hours: int,
+        *,
+        earliest_start: datetime | None = None,
+        deadline: datetime | None = None,
+        start_hour: int | None = None,
+        end_hour: int | None = None,
+        lookahead_hours: int | None = None,
+    ) -> PriceWindow | None:
+        """Cheapest ``hours`` window for ad-hoc constraints over the cached price series.
+
+        Nothing is fetched and no listener is notified. Results are memoized in
+        an LRU keyed by the series version and the resolved parameters; like
+        the fixed windows, the clock only enters the key as its hour anchor.
+        """
+        series = self._search_series()
+        if not series:
+            return None
+        now = self._current_time()
+        anchor = now.replace(minute=0, second=0, microsecond=0)
+        limits = [deadline] if deadline is not None else []
+        if lookahead_hours is not None:
+            limits.append(anchor + timedelta(hours=lookahead_hours))
+        max_end = min(limits) if limits else None
+        mask: tuple[int, ...] | None = None
+        if start_hour is not None or end_hour is not None:
+            mask = tuple(
+                self._mask_hours(
+                    MIN_CUSTOM_WINDOW_HOUR if start_hour is None else start_hour,
+                    MAX_CUSTOM_WINDOW_HOUR if end_hour is None else end_hour,
+                )
+            )
+        earliest = earliest_start or anchor
+        query = _WindowQuery(
+            hours=hours,
+            earliest_start=earliest,
+            min_end=now,
+            max_end=max_end,
+            window_filter=(
+                self._build_start_hour_filter(list(mask), self._get_helsinki_timezone())
+                if mask is not None
+                else None
+            ),
+        )
+        return self._memoized_search(
+            ("window", anchor, hours, earliest, max_end, mask),
+            lambda: self._find_cheapest_windows(series, {hours: query})[hours],
+        )
+
+    def find_deadline_windows(self, hours: int, deadline_time: time) -> list[DeadlineWindow]:
+        """Cheapest ``hours`` block before every daily ``deadline_time`` in the cached series."""
+        series = self._search_series()
+        if not series:
+            return []
+        now = self._current_time()
+        return self._memoized_search(
+            (
+                "deadline",
+                now.replace(minute=0, second=0, microsecond=0),
+                self._next_deadline(now, deadline_time),
+                hours,
+                deadline_time,
+            ),
+            lambda: self._resolve_deadline_windows(series, now, hours, deadline_time),
+        )
+
+    def _search_series(self) -> Sequence[SeriesPoint]:
+        """Cached merged price series for on-demand searches; bumps its version on change."""
+        price = self.data.get("price") if isinstance(self.data, Mapping) else None
+        series = price.get("forecast") if isinstance(price, Mapping) else None
+        if not isinstance(series, (list, PriceSeries)):
+            return []
+        if series is not self._find_series:
+            self._find_series = series
+            self._find_series_version += 1
+        if isinstance(series, PriceSeries):
+            return series
+        return [point for point in series if isinstance(point, SeriesPoint)]
+
+    def _memoized_search[T](self, params: tuple[Any, ...], build: Callable[[], T]) -> T:
+        key = (self._find_series_version, *params)
+        if key in self._find_cache:
+            self._find_cache.move_to_end(key)
+            return self._find_cache[key]
+        result = build()
+        self._find_cache[key] = result
+        if len(self._find_cache) > FIND_WINDOW_CACHE_SIZE:
+            self._find_cache.popitem(last=False)
+        return result
+
+    #region _deadline
+    def _next_deadline(self, now: datetime, deadline_time: time) -> datetime:
+        """First local ``deadline_time`` strictly after ``now``, in UTC."""
         helsinki_tz = self._get_helsinki_timezone()
+        local_date = now.astimezone(helsinki_tz).date()
+        for offset in range(3):
+            deadline = datetime.combine(
+                local_date + timedelta(days=offset), deadline_time, tzinfo=helsinki_tz
+            ).astimezone(timezone.utc)
+            if deadline > now:
+                return deadline
+        raise AssertionError("unreachable")
+
+    def _resolve_deadline_windows(
+        self,
+        series: Sequence[SeriesPoint],
+        now: datetime,
+        hours: int,
+        deadline_time: time,
+    ) -> list[DeadlineWindow]:
+        """One cheapest window per daily deadline across the series, in one pass.
+
+        Each deadline owns the span since the previous one, so consecutive
+        answers never overlap; the first span additionally drops windows that
+        have already ended, keeping an in-progress window selected. Deadlines
+        after the end of the series are left out rather than answered from a
+        partial day.
+        """
+        if hours <= 0 or not series:
+            return []
+        helsinki_tz = self._get_helsinki_timezone()
+        first = self._next_deadline(now, deadline_time).astimezone(helsinki_tz)
+        series_end = series[-1].datetime + timedelta(seconds=SLOT_SECONDS)
+        deadlines: list[datetime] = []
+        bounds: list[tuple[float, float]] = []
+        # Converted straight away: a local time in a DST gap never compares
+        # equal or ordered against an instant in another zone.
+        previous = datetime.combine(
+            first.date() - timedelta(days=1), deadline_time, tzinfo=helsinki_tz
+        ).astimezone(timezone.utc)
+        day = first.date()
+        while True:
+            deadline = datetime.combine(day, deadline_time, tzinfo=helsinki_tz).astimezone(timezone.utc)
+            if deadline > series_end:
+                break
+            deadlines.append(deadline)
+            bounds.append((previous.timestamp(), deadline.timestamp()))
+            previous = deadline
+            day += timedelta(days=1)
+        if not deadlines:
+            return []
+        index = self._window_search_index(series)
+        starts = self._scan_deadline_starts(index, hours, bounds, now.timestamp())
+        return [
+            DeadlineWindow(
+                deadline=deadline,
+                window=self._price_window_at(index, start, hours) if start is not None else None,
+            )
+            for deadline, start in zip(deadlines, starts)
+        ]
+
+    def _hold_started_deadline_window(
+        self, resolved: list[DeadlineWindow], now: datetime
+    ) -> list[DeadlineWindow]:
+        """Keep the next deadline's window fixed once it has started.
+
+        Later searches only see what is left of the span before the deadline,
+        so they could move to a block overlapping the one already under way.
+        """
+        if not resolved:
+            return resolved
+        first = resolved[0]
+        held = self._held_deadline_window
+        if (
+            held is not None
+            and held.deadline == first.deadline
+            and held.window is not None
+            and held.window.duration_hours == self._deadline_hours
+        ):
+            return resolved if first == held else [held, *resolved[1:]]
+        if first.window is not None and first.window.start <= now:
+            self._held_deadline_window = first
+        return resolved
+
+    #region _custom_window
+    def _resolve_windows(
+        self,
+        series: Sequence[SeriesPoint],
+        now: datetime,
+        helsinki_tz: tzinfo,
+    ) -> tuple[dict[int, PriceWindow | None], PriceWindow | None]:
+        """Resolve the fixed windows and the custom window in a single scan."""
+        queries: dict[int | str, _WindowQuery] = dict(
+            self._cheapest_window_queries(now, helsinki_tz)
+        )
+        custom_query = self._custom_window_query(now, helsinki_tz)
+        if custom_query is not None:
+            queries[CUSTOM_WINDOW_KEY] = custom_query
+        results = self._find_cheapest_windows(series, queries)
+        custom_window = results.pop(CUSTOM_WINDOW_KEY, None)
+        return results, custom_window
+
+    def _cheapest_window_queries(
+        self,
+        now: datetime,
+        helsinki_tz: tzinfo,
+    ) -> dict[int, _WindowQuery]:
         mask_hours = self._mask_hours(
             self._cheapest_window_start_hour,
             self._cheapest_window_end_hour,
@@ -605,42 +2651,48 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         window_filter = self._build_start_hour_filter(mask_hours, helsinki_tz)
         current_hour_anchor = now.replace(minute=0, second=0, microsecond=0)
         lookahead_limit = self._cheapest_window_lookahead_limit(now)
-        rebuilt: dict[int, PriceWindow | None] = {}
-        for hours in CHEAPEST_WINDOW_HOURS:
-            earliest_start = current_hour_anchor - timedelta(hours=hours - 1)
-            window = self._find_cheapest_window(
-                series_points,
-                hours,
-                earliest_start=earliest_start,
+        return {
+            hours: _WindowQuery(
+                hours=hours,
+                earliest_start=current_hour_anchor - timedelta(hours=hours - 1),
                 min_end=now,
                 max_end=lookahead_limit,
                 window_filter=window_filter,
+                fallback_without_min_end=True,
             )
-            if window is None:
-                window = self._find_cheapest_window(
-                    series_points,
-                    hours,
-                    earliest_start=earliest_start,
-                    max_end=lookahead_limit,
-                    window_filter=window_filter,
-                )
-            rebuilt[hours] = window
-        price_section["cheapest_windows"] = rebuilt
-        price_section["cheapest_windows_meta"] = {
-            "lookahead_hours": self._cheapest_window_lookahead_hours,
-            "lookahead_limit": lookahead_limit,
-            "start_hour": self._cheapest_window_start_hour,
-            "end_hour": self._cheapest_window_end_hour,
+            for hours in CHEAPEST_WINDOW_HOURS
         }
-        self.async_update_listeners()
+
+    def _custom_window_query(self, now: datetime, helsinki_tz: tzinfo) -> _WindowQuery | None:
+        hours = self._custom_window_hours
+        if hours <= 0:
+            return None
+        mask_hours = self._mask_hours(self._custom_window_start_hour, self._custom_window_end_hour)
+        if not mask_hours:
+            return None
+        window_filter = self._build_start_hour_filter(mask_hours, helsinki_tz)
+        if window_filter is None:
+            return None
+        current_hour_anchor = now.replace(minute=0, second=0, microsecond=0)
+        return _WindowQuery(
+            hours=hours,
+            earliest_start=current_hour_anchor - timedelta(hours=hours - 1),
+            min_end=now,
+            max_end=self._custom_window_lookahead_limit(now),
+            window_filter=window_filter,
+            fallback_without_min_end=True,
+        )
 
     def _build_custom_window_entry(
         self,
-        series: list[SeriesPoint],
+        series: Sequence[SeriesPoint],
         now: datetime,
         helsinki_tz: tzinfo,
     ) -> dict[str, Any]:
         window = self._find_custom_window(series, now, helsinki_tz)
+        return self._custom_window_entry(window, now)
+
+    def _custom_window_entry(self, window: PriceWindow | None, now: datetime) -> dict[str, Any]:
         return {
             "window": window,
             "hours": self._custom_window_hours,
@@ -652,54 +2704,23 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _find_custom_window(
         self,
-        series: list[SeriesPoint],
+        series: Sequence[SeriesPoint],
         now: datetime,
         helsinki_tz: tzinfo,
     ) -> PriceWindow | None:
-        hours = self._custom_window_hours
-        if hours <= 0:
-            return None
-        mask_hours = self._mask_hours(self._custom_window_start_hour, self._custom_window_end_hour)
-        if not mask_hours:
-            return None
-        window_filter = self._build_start_hour_filter(mask_hours, helsinki_tz)
-        if window_filter is None:
+        query = self._custom_window_query(now, helsinki_tz)
+        if query is None:
             return None
-        current_hour_anchor = now.replace(minute=0, second=0, microsecond=0)
-        earliest_start = current_hour_anchor - timedelta(hours=hours - 1)
-        lookahead_limit = self._custom_window_lookahead_limit(now)
-
-        window = self._find_cheapest_window(
-            series,
-            hours,
-            earliest_start=earliest_start,
-            min_end=now,
-            max_end=lookahead_limit,
-            window_filter=window_filter,
-        )
-        if window is None:
-            window = self._find_cheapest_window(
-                series,
-                hours,
-                earliest_start=earliest_start,
-                max_end=lookahead_limit,
-                window_filter=window_filter,
-            )
-        return window
+        return self._find_cheapest_windows(series, {CUSTOM_WINDOW_KEY: query})[CUSTOM_WINDOW_KEY]
 
     def _build_start_hour_filter(
         self,
         mask_hours: list[int],
         helsinki_tz: tzinfo,
-    ) -> Callable[[list[SeriesPoint]], bool] | None:
-        mask_set = set(mask_hours)
-        if not mask_set:
+    ) -> _StartHourMask | None:
+        if not mask_hours:
             return None
-
-        def _filter(window_points: list[SeriesPoint]) -> bool:
-            return self._window_start_within_mask(window_points, helsinki_tz, mask_set)
-
-        return _filter
+        return _StartHourMask(frozenset(mask_hours), helsinki_tz)
 
     def _mask_hours(self, start_hour: int, end_hour: int) -> list[int]:
         start = self._normalize_hour(
@@ -720,17 +2741,6 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         backward = list(range(0, end + 1))
         return [*forward, *backward]
 
-    @staticmethod
-    def _window_start_within_mask(
-        window_points: list[SeriesPoint],
-        helsinki_tz: tzinfo,
-        mask_hours: set[int],
-    ) -> bool:
-        if not window_points:
-            return False
-        start_hour = window_points[0].datetime.astimezone(helsinki_tz).hour
-        return start_hour in mask_hours
-
     def _normalize_hour(
         self,
         value: int | float | None,
@@ -799,41 +2809,235 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     #region _windows
     def _find_cheapest_window(
         self,
-        series: list[SeriesPoint],
+        series: Sequence[SeriesPoint],
         hours: int,
         earliest_start: datetime | None = None,
         min_end: datetime | None = None,
         max_end: datetime | None = None,
         window_filter: Callable[[list[SeriesPoint]], bool] | None = None,
     ) -> PriceWindow | None:
-        if hours <= 0 or len(series) < hours:
-            return None
+        """Return the cheapest contiguous ``hours``-long window in ``series``.
 
-        best_window: PriceWindow | None = None
-        for index in range(len(series) - hours + 1):
-            window_points = series[index : index + hours]
-            if not self._is_hourly_sequence(window_points):
-                continue
-            if window_filter and not window_filter(window_points):
-                continue
-            start_time = window_points[0].datetime
-            if earliest_start and start_time < earliest_start:
-                continue
-            end_time = window_points[-1].datetime + timedelta(hours=1)
-            if min_end and end_time <= min_end:
+        Ties resolve to the earliest start. ``window_filter`` is only consulted
+        for candidates that would beat the current best, so it runs a handful of
+        times per search instead of once per start index.
+        """
+        query = _WindowQuery(
+            hours=hours,
+            earliest_start=earliest_start,
+            min_end=min_end,
+            max_end=max_end,
+            window_filter=window_filter,
+        )
+        return self._find_cheapest_windows(series, {hours: query})[hours]
+
+    def _find_cheapest_windows[K](
+        self,
+        series: Sequence[SeriesPoint],
+        queries: dict[K, _WindowQuery],
+    ) -> dict[K, PriceWindow | None]:
+        """Resolve several window queries with one pass over ``series``.
+
+        All queries share the same prefix sums and contiguity index.
+        """
+        results: dict[K, PriceWindow | None] = {key: None for key in queries}
+        runnable = {
+            key: query
+            for key, query in queries.items()
+            if 0 < query.hours <= len(series)
+        }
+        if not runnable:
+            return results
+        index = self._window_search_index(series)
+        starts = self._scan_cheapest_starts(index, list(runnable.values()))
+        for key, query, start in zip(runnable, runnable.values(), starts):
+            if start is not None:
+                results[key] = self._price_window_at(index, start, query.hours)
+        return results
+
+    def _window_search_index(self, series: Sequence[SeriesPoint]) -> _WindowSearchIndex:
+        cached = self._window_index
+        if cached is not None and cached.series is series and cached.length == len(series):
+            return cached
+        index = self._build_window_search_index(series)
+        self._window_index = index
+        return index
+
+    @staticmethod
+    def _build_window_search_index(series: Sequence[SeriesPoint]) -> _WindowSearchIndex:
+        length = len(series)
+        if isinstance(series, PriceSeries):
+            values = series.values.tolist()
+            starts = [epoch / 1_000_000 for epoch in series.epochs]
+        else:
+            values = [point.value for point in series]
+            starts = [point.datetime.timestamp() for point in series]
+        run_start: list[int] = [0] * length
+        prefix: list[float] = [0.0] * (length + 1)
+        running = 0.0
+        magnitude = 0.0
+        for position, value in enumerate(values):
+            running += value
+            prefix[position + 1] = running
+            magnitude += abs(value)
+            if position and starts[position] - starts[position - 1] == SLOT_SECONDS:
+                run_start[position] = run_start[position - 1]
+            else:
+                run_start[position] = position
+        return _WindowSearchIndex(
+            series=series,
+            length=length,
+            values=values,
+            prefix=prefix,
+            starts=starts,
+            run_start=run_start,
+            tolerance=_PREFIX_SUM_SLACK * (length + 1) * (magnitude + 1.0),
+        )
+
+    @staticmethod
+    def _start_mask_bitmap(index: _WindowSearchIndex, mask: _StartHourMask) -> bytes:
+        """Compile ``mask`` into one eligibility byte per series index."""
+        if index.local_hours is None or index.local_tz is not mask.tz:
+            index.local_hours = array(
+                "b",
+                (datetime.fromtimestamp(start, mask.tz).hour for start in index.starts),
+            )
+            index.local_tz = mask.tz
+            index.start_masks.clear()
+        bitmap = index.start_masks.get(mask.hours)
+        if bitmap is None:
+            lookup = bytes(hour in mask.hours for hour in range(24))
+            bitmap = bytes(lookup[hour] for hour in index.local_hours)
+            index.start_masks[mask.hours] = bitmap
+        return bitmap
+
+    @classmethod
+    def _scan_cheapest_starts(
+        cls,
+        index: _WindowSearchIndex,
+        queries: list[_WindowQuery],
+    ) -> list[int | None]:
+        prefix = index.prefix
+        starts = index.starts
+        run_start = index.run_start
+        values = index.values
+        tolerance = index.tolerance
+        length = index.length
+
+        plans = []
+        for query in queries:
+            window_filter = query.window_filter
+            eligible: bytes | None = None
+            if isinstance(window_filter, _StartHourMask):
+                eligible = cls._start_mask_bitmap(index, window_filter)
+                window_filter = None
+            plans.append(
+                (
+                    query.hours,
+                    query.hours * SLOT_SECONDS,
+                    query.earliest_start.timestamp() if query.earliest_start else None,
+                    query.min_end.timestamp() if query.min_end else None,
+                    query.max_end.timestamp() if query.max_end else None,
+                    eligible,
+                    window_filter,
+                    _BestStart(),
+                    _BestStart() if query.fallback_without_min_end and query.min_end else None,
+                )
+            )
+        for start in range(length):
+            start_ts = starts[start]
+            for (
+                hours,
+                span,
+                earliest,
+                min_end,
+                max_end,
+                eligible,
+                window_filter,
+                best,
+                fallback,
+            ) in plans:
+                if eligible is not None and not eligible[start]:
+                    continue
+                last = start + hours - 1
+                if last >= length or run_start[last] > start:
+                    continue
+                if earliest is not None and start_ts < earliest:
+                    continue
+                end_ts = start_ts + span
+                if max_end is not None and end_ts > max_end:
+                    continue
+                total = prefix[last + 1] - prefix[start]
+                take_best = (min_end is None or end_ts > min_end) and best.could_take(
+                    total, tolerance
+                )
+                take_fallback = fallback is not None and fallback.could_take(total, tolerance)
+                if not take_best and not take_fallback:
+                    continue
+                if window_filter and not window_filter(index.series[start : last + 1]):
+                    continue
+                if take_best:
+                    best.offer(start, total, hours, values, tolerance)
+                if take_fallback:
+                    fallback.offer(start, total, hours, values, tolerance)
+
+        resolved: list[int | None] = []
+        for *_, best, fallback in plans:
+            if best.start is None and fallback is not None:
+                resolved.append(fallback.start)
+            else:
+                resolved.append(best.start)
+        return resolved
+
+    @staticmethod
+    def _scan_deadline_starts(
+        index: _WindowSearchIndex,
+        hours: int,
+        bounds: list[tuple[float, float]],
+        min_end: float,
+    ) -> list[int | None]:
+        """Cheapest start inside each ``(after, deadline)`` span, in one pass.
+
+        Spans are consecutive, so the span owning a start only ever moves
+        forward and each start is checked against a single span.
+        """
+        prefix = index.prefix
+        starts = index.starts
+        run_start = index.run_start
+        tolerance = index.tolerance
+        length = index.length
+        span = hours * SLOT_SECONDS
+        bests = [_BestStart() for _ in bounds]
+        current = 0
+        for start in range(length):
+            start_ts = starts[start]
+            while current < len(bounds) and start_ts >= bounds[current][1]:
+                current += 1
+            if current == len(bounds):
+                break
+            after, deadline = bounds[current]
+            last = start + hours - 1
+            if start_ts < after or last >= length or run_start[last] > start:
                 continue
-            if max_end and end_time > max_end:
+            end_ts = start_ts + span
+            if end_ts > deadline or (current == 0 and end_ts <= min_end):
                 continue
-            average = sum(point.value for point in window_points) / hours
-            if best_window is None or average < best_window.average:
-                best_window = PriceWindow(
-                    duration_hours=hours,
-                    start=start_time,
-                    end=end_time,
-                    average=average,
-                    points=window_points,
-                )
-        return best_window
+            total = prefix[last + 1] - prefix[start]
+            best = bests[current]
+            if best.could_take(total, tolerance):
+                best.offer(start, total, hours, index.values, tolerance)
+        return [best.start for best in bests]
+
+    @staticmethod
+    def _price_window_at(index: _WindowSearchIndex, start: int, hours: int) -> PriceWindow:
+        points = index.series[start : start + hours]
+        return PriceWindow(
+            duration_hours=hours,
+            start=points[0].datetime,
+            end=points[-1].datetime + timedelta(hours=1),
+            average=sum(index.values[start : start + hours]) / hours,
+            points=points,
+        )
 
     def _custom_window_lookahead_limit(self, now: datetime) -> datetime:
         helsinki_tz = self._get_helsinki_timezone()
@@ -847,31 +3051,18 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     @staticmethod
     
-    def _is_hourly_sequence(window_points: list[SeriesPoint]) -> bool:
-        if len(window_points) <= 1:
-            return True
-        expected_delta = timedelta(hours=1)
-        previous = window_points[0].datetime
-        for current in window_points[1:]:
-            if current.datetime - previous != expected_delta:
-                return False
-            previous = current.datetime
-        return True
-
-    @staticmethod
-    
     def _forecast_start_from_segments(
-        realized_series: list[SeriesPoint],
-        forecast_series: list[SeriesPoint],
+        realized_series: Sequence[SeriesPoint],
+        forecast_series: Sequence[SeriesPoint],
     ) -> datetime | None:
         if not forecast_series:
             return None
         if not realized_series:
             return forecast_series[0].datetime
         last_realized = realized_series[-1].datetime
-        for point in forecast_series:
-            if point.datetime > last_realized:
-                return point.datetime
+        index = NordpoolPredictCoordinator._bisect_after(forecast_series, last_realized)
+        if index < len(forecast_series):
+            return forecast_series[index].datetime
         return None
 
     #region _narration
@@ -946,35 +3137,57 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     #region _merge
     def _merge_price_series(
         self,
-        realized_series: list[SeriesPoint],
-        forecast_series: list[SeriesPoint],
-    ) -> list[SeriesPoint]:
+        realized_series: Sequence[SeriesPoint],
+        forecast_series: Sequence[SeriesPoint],
+    ) -> PriceSeries:
         if not realized_series:
-            return list(forecast_series)
-        merged = list(realized_series)
-        last_realized = merged[-1].datetime
-        for point in forecast_series:
-            if point.datetime <= last_realized:
-                continue
-            merged.append(point)
-        return merged
+            return PriceSeries.concat(forecast_series)
+        last_realized = realized_series[-1].datetime
+        forecast_after = forecast_series[self._bisect_after(forecast_series, last_realized) :]
+        return PriceSeries.concat(realized_series, forecast_after)
+
+    @staticmethod
+    def _bisect_after(series: Sequence[SeriesPoint], moment: datetime) -> int:
+        """Index of the first point strictly after ``moment`` in a sorted series."""
+        if isinstance(series, PriceSeries):
+            return series.bisect_right(moment)
+        return bisect.bisect_right(series, moment, key=lambda point: point.datetime)
+
+    @staticmethod
+    def _points_since(series: Sequence[SeriesPoint], moment: datetime) -> Sequence[SeriesPoint]:
+        """Points at or after ``moment``; a view when ``series`` is a PriceSeries."""
+        if isinstance(series, PriceSeries):
+            return series[series.bisect_left(moment) :]
+        return [point for point in series if point.datetime >= moment]
+
+    @classmethod
+    def _point_at_or_before(
+        cls,
+        series: Sequence[SeriesPoint],
+        moment: datetime,
+    ) -> SeriesPoint | None:
+        index = cls._bisect_after(series, moment)
+        return series[index - 1] if index else None
 
     def _calculate_daily_averages(
         self,
-        series: list[SeriesPoint],
+        series: Sequence[SeriesPoint],
         helsinki_tz: tzinfo,
     ) -> list[DailyAverage]:
         if not series:
             return []
 
-        buckets: dict[date, list[SeriesPoint]] = {}
-        for point in series:
-            local_dt = point.datetime.astimezone(helsinki_tz)
-            buckets.setdefault(local_dt.date(), []).append(point)
-
+        # The series is time-sorted, so each Helsinki day is one contiguous
+        # index range and its points can be a slice (a view for PriceSeries).
+        local_dates = [point.datetime.astimezone(helsinki_tz).date() for point in series]
         daily: list[DailyAverage] = []
-        for local_date in sorted(buckets):
-            points = sorted(buckets[local_date], key=lambda item: item.datetime)
+        day_start = 0
+        for position in range(1, len(series) + 1):
+            if position < len(series) and local_dates[position] == local_dates[day_start]:
+                continue
+            local_date = local_dates[day_start]
+            points = series[day_start:position]
+            day_start = position
             if not self._is_full_helsinki_day(points, helsinki_tz, local_date):
                 continue
             average = sum(point.value for point in points) / len(points)
@@ -993,7 +3206,7 @@ class NordpoolPredictCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _is_full_helsinki_day(
         self,
-        points: list[SeriesPoint],
+        points: Sequence[SeriesPoint],
         helsinki_tz: tzinfo,
         local_date: date,
     ) -> bool:
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+#region device_trigger
+
+from collections import Counter
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import InvalidDeviceAutomationConfig
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_LEAD_MINUTES,
+    DATA_COORDINATOR,
+    DATA_WINDOW_LEADS,
+    DOMAIN,
+    EVENT_WINDOW,
+    MAX_LEAD_MINUTES,
+    TRIGGER_WINDOW_END,
+    TRIGGER_WINDOW_START,
+    WINDOW_EDGE_END,
+    WINDOW_EDGE_START,
+    WINDOW_EVENT_IDS,
+)
+
+CONF_SUBTYPE = "subtype"
+
+_TRIGGER_EDGES = {
+    TRIGGER_WINDOW_START: WINDOW_EDGE_START,
+    TRIGGER_WINDOW_END: WINDOW_EDGE_END,
+}
+
+_LEAD_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_LEAD_MINUTES))
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(_TRIGGER_EDGES),
+        vol.Required(CONF_SUBTYPE): vol.In(WINDOW_EVENT_IDS),
+        vol.Optional(CONF_LEAD_MINUTES, default=0): _LEAD_SCHEMA,
+    }
+)
+
+
+#region _triggers
+async def async_get_triggers(hass: HomeAssistant, device_id: str) -> list[dict[str, Any]]:
+    if _entry_id_for_device(hass, device_id) is None:
+        return []
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+            CONF_SUBTYPE: window_id,
+        }
+        for window_id in WINDOW_EVENT_IDS
+        for trigger_type in _TRIGGER_EDGES
+    ]
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    return {"extra_fields": vol.Schema({vol.Optional(CONF_LEAD_MINUTES, default=0): _LEAD_SCHEMA})}
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    entry_id = _entry_id_for_device(hass, config[CONF_DEVICE_ID])
+    if entry_id is None:
+        raise InvalidDeviceAutomationConfig(f"Unknown device {config[CONF_DEVICE_ID]}")
+    lead = config[CONF_LEAD_MINUTES]
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            event_trigger.CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: EVENT_WINDOW,
+            event_trigger.CONF_EVENT_DATA: {
+                "entry_id": entry_id,
+                "window": config[CONF_SUBTYPE],
+                "edge": _TRIGGER_EDGES[config[CONF_TYPE]],
+                "lead_minutes": lead,
+            },
+        }
+    )
+    remove_listener = await event_trigger.async_attach_trigger(
+        hass, event_config, action, trigger_info, platform_type="device"
+    )
+    if not lead:
+        return remove_listener
+
+    # Lead times live outside the coordinator so they survive entry reloads.
+    leads: Counter[int] = hass.data.setdefault(DATA_WINDOW_LEADS, {}).setdefault(entry_id, Counter())
+    leads[lead] += 1
+    _leads_changed(hass, entry_id)
+
+    @callback
+    def _detach() -> None:
+        remove_listener()
+        leads[lead] -= 1
+        if leads[lead] <= 0:
+            del leads[lead]
+        _leads_changed(hass, entry_id)
+
+    return _detach
+
+
+#region _helpers
+def _entry_id_for_device(hass: HomeAssistant, device_id: str) -> str | None:
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    return next(
+        (identifier for domain, identifier in device.identifiers if domain == DOMAIN),
+        None,
+    )
+
+
+@callback
+def _leads_changed(hass: HomeAssistant, entry_id: str) -> None:
+    stored = hass.data.get(DOMAIN, {}).get(entry_id)
+    if stored and (coordinator := stored.get(DATA_COORDINATOR)):
+        coordinator.async_window_leads_changed()
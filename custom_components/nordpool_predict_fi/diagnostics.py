@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+#region diagnostics
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_COORDINATOR, DOMAIN
+from .coordinator import NordpoolPredictCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    coordinator: NordpoolPredictCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    return {
+        "base_url": coordinator.base_url,
+        "update_interval": str(coordinator.update_interval),
+        "last_update_success": coordinator.last_update_success,
+        "artifacts": coordinator.artifact_diagnostics(),
+        "polling": coordinator.polling_diagnostics(),
+        "freshness": coordinator.freshness_diagnostics(),
+        "hosts": coordinator.host_diagnostics(),
+        "mirrors": coordinator.mirror_diagnostics(),
+    }
@@ -10,7 +10,7 @@ from homeassistant.components.number import (
     RestoreNumber,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -47,6 +47,9 @@ from .const import (
     MIN_CUSTOM_WINDOW_LOOKAHEAD_HOURS,
     MAX_EXTRA_FEES_CENTS,
     MIN_EXTRA_FEES_CENTS,
+    SECTION_FEES,
+    SECTION_SETTINGS,
+    SECTION_STATUS,
 )
 from .coordinator import NordpoolPredictCoordinator
 
@@ -88,6 +91,7 @@ class NordpoolExtraFeesNumber(CoordinatorEntity[NordpoolPredictCoordinator], Res
         super().__init__(coordinator)
         self._entry = entry
         self._value = DEFAULT_EXTRA_FEES_CENTS
+        self._seen_versions: tuple[int, ...] | None = None
         self._attr_unique_id = f"{entry.entry_id}_extra_fees"
         self._attr_name = "Extra Fees"
         self._attr_device_info = DeviceInfo(
@@ -117,7 +121,12 @@ class NordpoolExtraFeesNumber(CoordinatorEntity[NordpoolPredictCoordinator], Res
         if self.entity_id and self.platform:
             self.async_write_ha_state()
 
+    @callback
     def _handle_coordinator_update(self) -> None:
+        versions = self.coordinator.section_versions((SECTION_STATUS, SECTION_FEES))
+        if versions == self._seen_versions:
+            return
+        self._seen_versions = versions
         self._value = self._clamp(self.coordinator.extra_fees_cents)
         if self.entity_id and self.platform:
             super()._handle_coordinator_update()
@@ -145,6 +154,7 @@ class _NordpoolWindowBaseNumber(CoordinatorEntity[NordpoolPredictCoordinator], R
         super().__init__(coordinator)
         self._entry = entry
         self._value: int = 0
+        self._seen_versions: tuple[int, ...] | None = None
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             name="Nordpool Predict FI",
@@ -173,7 +183,12 @@ class _NordpoolWindowBaseNumber(CoordinatorEntity[NordpoolPredictCoordinator], R
         if self.entity_id and self.platform:
             self.async_write_ha_state()
 
+    @callback
     def _handle_coordinator_update(self) -> None:
+        versions = self.coordinator.section_versions((SECTION_STATUS, SECTION_SETTINGS))
+        if versions == self._seen_versions:
+            return
+        self._seen_versions = versions
         self._value = self._restore_value(self._read_from_coordinator())
         if self.entity_id and self.platform:
             super()._handle_coordinator_update()
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 #region sensor
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -19,6 +19,9 @@ from .const import (
     ATTR_CUSTOM_WINDOW_LOOKAHEAD_HOURS,
     ATTR_CUSTOM_WINDOW_LOOKAHEAD_LIMIT,
     ATTR_CUSTOM_WINDOW_START_HOUR,
+    ATTR_DATA_AGE,
+    ATTR_DEADLINE,
+    ATTR_DEADLINE_WINDOWS,
     ATTR_DAILY_AVERAGE_SPAN_END,
     ATTR_DAILY_AVERAGE_SPAN_START,
     ATTR_FORECAST,
@@ -29,7 +32,9 @@ from .const import (
     ATTR_NARRATION_CONTENT,
     ATTR_NARRATION_SUMMARY,
     ATTR_RAW_SOURCE,
+    ATTR_SNAPSHOT_AGE,
     ATTR_SOURCE_URL,
+    ATTR_STALE,
     ATTR_TIMESTAMP,
     ATTR_WIND_FORECAST,
     ATTR_WINDOW_DURATION,
@@ -47,12 +52,29 @@ from .const import (
     NARRATION_LANGUAGES,
     NARRATION_LANGUAGE_NAMES,
     NEXT_HOURS,
+    SECTION_CHEAPEST_WINDOWS,
+    SECTION_CLOCK,
+    SECTION_CUSTOM_WINDOW,
+    SECTION_DAILY_AVERAGES,
+    SECTION_DEADLINE,
+    SECTION_FEES,
+    SECTION_NARRATION,
+    SECTION_PRICE,
+    SECTION_SETTINGS,
+    SECTION_STATUS,
+    SECTION_TIMESTAMPS,
+    SECTION_WINDPOWER,
+    WINDOW_EDGE_END,
+    WINDOW_EDGE_START,
+    WINDOW_EVENT_IDS,
 )
 from .coordinator import (
     DailyAverage,
+    DeadlineWindow,
     NordpoolPredictCoordinator,
     PriceWindow,
     SeriesPoint,
+    SeriesTimeIndex,
 )
 
 
@@ -85,6 +107,19 @@ async def async_setup_entry(
             NordpoolCheapestCustomWindowActiveSensor(coordinator, entry),
         )
     )
+    entities.extend(
+        NordpoolWindowTimestampSensor(coordinator, entry, window_id, edge)
+        for window_id in WINDOW_EVENT_IDS
+        for edge in (WINDOW_EDGE_START, WINDOW_EDGE_END)
+    )
+    if coordinator.deadline_hours:
+        entities.extend(
+            (
+                NordpoolDeadlineWindowSensor(coordinator, entry),
+                NordpoolDeadlineWindowActiveSensor(coordinator, entry),
+            )
+        )
+    entities.append(NordpoolNextDayBoundarySensor(coordinator, entry))
     entities.extend(
         (
             NordpoolWindpowerSensor(coordinator, entry),
@@ -105,6 +140,8 @@ async def async_setup_entry(
 class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Coordinator sections this sensor reads; updates touching none of them are ignored.
+    _sections: tuple[str, ...] = (SECTION_PRICE, SECTION_CLOCK, SECTION_FEES)
 
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
@@ -114,20 +151,51 @@ class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEn
             name="Nordpool Predict FI",
             manufacturer="Nordpool Predict",
         )
+        self._seen_versions: tuple[int, ...] | None = None
+        self._rendered: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        versions = self.coordinator.section_versions((SECTION_STATUS, *self._sections))
+        if versions == self._seen_versions:
+            return
+        self._seen_versions = versions
+        # data_age ticks on every refresh; it is refreshed whenever the state is
+        # written but does not force a write on its own.
+        rendered = (
+            self.available,
+            self.native_value,
+            self._sensor_attributes,
+            self.coordinator.stale,
+        )
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        attributes = self._sensor_attributes
+        if attributes is None:
+            return None
+        return {
+            **attributes,
+            ATTR_DATA_AGE: self.coordinator.data_age(),
+            ATTR_STALE: self.coordinator.stale,
+        }
+
+    @property
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
+        """Attributes specific to this sensor; freshness is added on top."""
+        return None
 
     def _build_forecast_attributes(
         self,
-        series: list[SeriesPoint],
+        series: Sequence[SeriesPoint],
         decimals: int | None = None,
         offset: float = 0.0,
-    ) -> list[Mapping[str, Any]]:
-        return [
-            {
-                "timestamp": point.datetime.isoformat(),
-                "value": self._rounded_value(point.value + offset, decimals),
-            }
-            for point in series
-        ]
+    ) -> list[Mapping[str, Any]] | Mapping[str, Any]:
+        return self.coordinator.serialized_points(series, decimals=decimals, offset=offset)
 
     def _price_section(self) -> Mapping[str, Any] | None:
         data = self.coordinator.data or {}
@@ -148,14 +216,14 @@ class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEn
             return window
         return None
 
-    def _price_series(self) -> list[SeriesPoint]:
-        section = self._price_section()
-        if not section:
-            return []
-        series = section.get("forecast")
-        if not isinstance(series, list):
-            return []
-        return [point for point in series if isinstance(point, SeriesPoint)]
+    def _price_series(self) -> Sequence[SeriesPoint]:
+        return self._price_index().series
+
+    def _price_index(self) -> SeriesTimeIndex:
+        return self.coordinator.time_index("price")
+
+    def _now(self) -> datetime:
+        return getattr(self.coordinator, "current_time", None) or datetime.now(timezone.utc)
 
     def _daily_averages(self) -> list[DailyAverage]:
         section = self._price_section()
@@ -167,18 +235,9 @@ class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEn
         return [item for item in daily if isinstance(item, DailyAverage)]
 
     def _future_point(self, hours_ahead: int) -> SeriesPoint | None:
-        series = self._price_series()
-        if not series:
-            return None
-        now = getattr(self.coordinator, "current_time", None)
-        if now is None:
-            now = datetime.now(timezone.utc)
-        target_time = now + timedelta(hours=hours_ahead)
         # Find the point closest to target_time but >= target_time
-        for point in series:
-            if point.datetime >= target_time:
-                return point
-        return None
+        target_time = self._now() + timedelta(hours=hours_ahead)
+        return self._price_index().at_or_after(target_time)
 
     def _average_next_hours(self, hours: int) -> tuple[float | None, datetime | None]:
         """Average price over the next X hours starting at next full hour (T+1).
@@ -186,42 +245,15 @@ class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEn
         Returns (average_price, start_timestamp). If any contiguous hour from
         T+1..T+X is missing, returns (None, None).
         """
-        series = self._price_series()
-        if not series:
-            return None, None
-
-        now = getattr(self.coordinator, "current_time", None) or datetime.now(timezone.utc)
+        now = self._now()
         start_anchor = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
-        # Find index of the first point exactly at the next full hour
-        try:
-            start_idx = next(i for i, p in enumerate(series) if p.datetime == start_anchor)
-        except StopIteration:
+        # Require 'hours' contiguous hourly points starting exactly at start_anchor
+        average = self._price_index().hourly_average(start_anchor, hours)
+        if average is None:
             return None, None
-
-        # Verify we have 'hours' contiguous hourly points starting at start_anchor
-        points: list[SeriesPoint] = []
-        for i in range(hours):
-            idx = start_idx + i
-            if idx >= len(series):
-                return None, None
-            point = series[idx]
-            if point.datetime != start_anchor + timedelta(hours=i):
-                return None, None
-            points.append(point)
-
-        average = sum(p.value for p in points) / hours
         return average, start_anchor
 
-    @staticmethod
-    def _rounded_value(value: float, decimals: int | None) -> float | int:
-        if decimals is None:
-            return value
-        rounded = round(value, decimals)
-        if decimals == 0:
-            return int(rounded)
-        return rounded
-
     def _extra_fees_cents(self) -> float:
         return getattr(self.coordinator, "extra_fees_cents", 0.0)
 
@@ -234,6 +266,7 @@ class NordpoolBaseSensor(CoordinatorEntity[NordpoolPredictCoordinator], SensorEn
 #region _price
 class NordpoolPriceSensor(NordpoolBaseSensor):
     _attr_translation_key = "price"
+    _unrecorded_attributes = frozenset({ATTR_FORECAST})
     _attr_icon = "mdi:chart-line"
     _attr_native_unit_of_measurement = "c/kWh"
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -250,7 +283,7 @@ class NordpoolPriceSensor(NordpoolBaseSensor):
         return round(adjusted, 1) if adjusted is not None else None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         data = self._price_section()
         if not data:
             return None
@@ -270,9 +303,18 @@ class NordpoolPriceSensor(NordpoolBaseSensor):
             ATTR_FORECAST_START: forecast_start_iso,
             ATTR_RAW_SOURCE: self.coordinator.base_url,
             ATTR_EXTRA_FEES: self._extra_fees_cents(),
+            ATTR_SNAPSHOT_AGE: self._snapshot_age(),
         }
         return result
 
+    def _snapshot_age(self) -> int | None:
+        """Seconds since the restored snapshot was saved; None for live data."""
+        meta = (self.coordinator.data or {}).get("meta")
+        saved_at = meta.get("snapshot_saved_at") if isinstance(meta, Mapping) else None
+        if not isinstance(saved_at, datetime):
+            return None
+        return max(int((self._now() - saved_at).total_seconds()), 0)
+
     def _series_point(self, key: str) -> SeriesPoint | None:
         section = self._price_section()
         if not section:
@@ -302,7 +344,7 @@ class NordpoolPriceNowSensor(NordpoolBaseSensor):
         return round(adjusted, 1) if adjusted is not None else None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         point = self._latest_point()
         return {
             ATTR_TIMESTAMP: point.datetime.isoformat() if point else None,
@@ -311,25 +353,14 @@ class NordpoolPriceNowSensor(NordpoolBaseSensor):
         }
 
     def _latest_point(self) -> SeriesPoint | None:
-        series = self._price_series()
-        if not series:
-            return None
-        # Use coordinator's current_time if available, otherwise fallback to datetime.now(timezone.utc)
-        now = getattr(self.coordinator, "current_time", None)
-        if now is None:
-            now = datetime.now(timezone.utc)
-        latest: SeriesPoint | None = None
-        for point in series:
-            if point.datetime <= now:
-                latest = point
-            else:
-                break
-        return latest
+        return self._price_index().at_or_before(self._now())
 
 
 #region _price_daily
 class NordpoolPriceDailyAverageSensor(NordpoolBaseSensor):
     _attr_translation_key = "price_daily_average"
+    _sections = (SECTION_DAILY_AVERAGES, SECTION_CLOCK, SECTION_FEES)
+    _unrecorded_attributes = frozenset({ATTR_DAILY_AVERAGES})
     _attr_icon = "mdi:calendar-clock"
     _attr_native_unit_of_measurement = "c/kWh"
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -349,7 +380,7 @@ class NordpoolPriceDailyAverageSensor(NordpoolBaseSensor):
         return round(adjusted, 1) if adjusted is not None else None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         daily_list = self._daily_averages()
         span_start = None
         span_end = None
@@ -420,7 +451,7 @@ class NordpoolPriceNextHoursSensor(NordpoolBaseSensor):
         return round(adjusted, 1) if adjusted is not None else None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         _, start_time = self._average_next_hours(self._hours)
         return {
             ATTR_TIMESTAMP: start_time.isoformat() if start_time else None,
@@ -431,6 +462,9 @@ class NordpoolPriceNextHoursSensor(NordpoolBaseSensor):
 
 #region _windows
 class _NordpoolCheapestWindowBaseSensor(NordpoolBaseSensor):
+    _unrecorded_attributes = frozenset({ATTR_WINDOW_POINTS})
+    _sections = (SECTION_CHEAPEST_WINDOWS, SECTION_SETTINGS, SECTION_FEES)
+
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry, hours: int) -> None:
         super().__init__(coordinator, entry)
         self._hours = hours
@@ -510,13 +544,14 @@ class NordpoolCheapestWindowSensor(_NordpoolCheapestWindowBaseSensor):
         return round(adjusted, 1)
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         window = self._window()
         return self._window_attributes(window)
 
 
 class NordpoolCheapestWindowActiveSensor(_NordpoolCheapestWindowBaseSensor):
     _attr_icon = "mdi:clock-start"
+    _sections = (SECTION_CHEAPEST_WINDOWS, SECTION_SETTINGS, SECTION_FEES, SECTION_CLOCK)
 
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry, hours: int) -> None:
         super().__init__(coordinator, entry, hours)
@@ -533,12 +568,15 @@ class NordpoolCheapestWindowActiveSensor(_NordpoolCheapestWindowBaseSensor):
         return window.start <= now < window.end
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         window = self._window()
         return self._window_attributes(window)
 
 #region _windows_custom
 class _NordpoolCheapestCustomWindowBaseSensor(NordpoolBaseSensor):
+    _unrecorded_attributes = frozenset({ATTR_WINDOW_POINTS})
+    _sections = (SECTION_CUSTOM_WINDOW, SECTION_SETTINGS, SECTION_FEES)
+
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
 
@@ -641,7 +679,7 @@ class NordpoolCheapestCustomWindowSensor(_NordpoolCheapestCustomWindowBaseSensor
         return round(adjusted, 1)
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         window = self._window()
         return self._window_attributes(window)
 
@@ -649,6 +687,7 @@ class NordpoolCheapestCustomWindowSensor(_NordpoolCheapestCustomWindowBaseSensor
 class NordpoolCheapestCustomWindowActiveSensor(_NordpoolCheapestCustomWindowBaseSensor):
     _attr_icon = "mdi:clock-start"
     _attr_translation_key = "cheapest_custom_active"
+    _sections = (SECTION_CUSTOM_WINDOW, SECTION_SETTINGS, SECTION_FEES, SECTION_CLOCK)
 
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator, entry)
@@ -664,14 +703,160 @@ class NordpoolCheapestCustomWindowActiveSensor(_NordpoolCheapestCustomWindowBase
         return window.start <= now < window.end
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         window = self._window()
         return self._window_attributes(window)
 
 
+#region _windows_deadline
+class _NordpoolDeadlineWindowBaseSensor(NordpoolBaseSensor):
+    _unrecorded_attributes = frozenset({ATTR_WINDOW_POINTS, ATTR_DEADLINE_WINDOWS})
+    _sections = (SECTION_DEADLINE, SECTION_FEES)
+
+    def _deadline_windows(self) -> list[DeadlineWindow]:
+        section = self._price_section()
+        entries = section.get("deadline_windows") if section else None
+        if not isinstance(entries, list):
+            return []
+        return [entry for entry in entries if isinstance(entry, DeadlineWindow)]
+
+    def _next_entry(self) -> DeadlineWindow | None:
+        """The earliest deadline that still has a window to offer."""
+        return next((entry for entry in self._deadline_windows() if entry.window), None)
+
+    def _window_attributes(self) -> dict[str, Any]:
+        helsinki_tz = self.coordinator.helsinki_timezone
+        fees = self._extra_fees_cents()
+        entry = self._next_entry()
+        window = entry.window if entry else None
+        attributes: dict[str, Any] = {
+            ATTR_RAW_SOURCE: self.coordinator.base_url,
+            ATTR_WINDOW_DURATION: self.coordinator.deadline_hours,
+            ATTR_EXTRA_FEES: fees,
+            ATTR_DEADLINE: entry.deadline.astimezone(helsinki_tz).isoformat() if entry else None,
+            ATTR_WINDOW_START: window.start.astimezone(helsinki_tz).isoformat() if window else None,
+            ATTR_WINDOW_END: window.end.astimezone(helsinki_tz).isoformat() if window else None,
+            ATTR_WINDOW_POINTS: (
+                self._build_forecast_attributes(window.points, decimals=1, offset=fees)
+                if window
+                else []
+            ),
+        }
+        attributes[ATTR_DEADLINE_WINDOWS] = [
+            {
+                "deadline": item.deadline.astimezone(helsinki_tz).isoformat(),
+                "start": item.window.start.astimezone(helsinki_tz).isoformat() if item.window else None,
+                "end": item.window.end.astimezone(helsinki_tz).isoformat() if item.window else None,
+                "average": round(item.window.average + fees, 1) if item.window else None,
+            }
+            for item in self._deadline_windows()
+        ]
+        return attributes
+
+    @property
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
+        return self._window_attributes()
+
+
+class NordpoolDeadlineWindowSensor(_NordpoolDeadlineWindowBaseSensor):
+    """Cheapest window finishing by the next daily deadline; every later day in attributes."""
+
+    _attr_icon = "mdi:clock-check-outline"
+    _attr_native_unit_of_measurement = "c/kWh"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_translation_key = "cheapest_deadline"
+
+    def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_cheapest_deadline"
+        self._attr_name = "Cheapest Window Before Deadline"
+
+    @property
+    def native_value(self) -> float | None:
+        entry = self._next_entry()
+        if not entry or not entry.window:
+            return None
+        return round(self._apply_extra_fees(entry.window.average), 1)
+
+
+class NordpoolDeadlineWindowActiveSensor(_NordpoolDeadlineWindowBaseSensor):
+    _attr_icon = "mdi:clock-start"
+    _attr_translation_key = "cheapest_deadline_active"
+    _sections = (SECTION_DEADLINE, SECTION_FEES, SECTION_CLOCK)
+
+    def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_cheapest_deadline_active"
+        self._attr_name = "Cheapest Window Before Deadline Active"
+
+    @property
+    def native_value(self) -> bool:
+        entry = self._next_entry()
+        if not entry or not entry.window:
+            return False
+        return entry.window.start <= self._now() < entry.window.end
+
+
+#region _timestamps
+class NordpoolWindowTimestampSensor(NordpoolBaseSensor):
+    """Start or end of a chosen window, for native relative-time rendering."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _sections = (SECTION_TIMESTAMPS,)
+
+    def __init__(
+        self,
+        coordinator: NordpoolPredictCoordinator,
+        entry: ConfigEntry,
+        window_id: str,
+        edge: str,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._window_id = window_id
+        self._edge = edge
+        label = "Custom" if window_id == CUSTOM_WINDOW_KEY else window_id
+        self._attr_translation_key = f"cheapest_{window_id}_{edge}"
+        self._attr_unique_id = f"{entry.entry_id}_cheapest_{window_id}_{edge}"
+        self._attr_name = f"Cheapest {label} Window {edge.capitalize()}"
+        self._attr_icon = "mdi:clock-start" if edge == WINDOW_EDGE_START else "mdi:clock-end"
+
+    @property
+    def native_value(self) -> datetime | None:
+        section = self._price_section()
+        edges = section.get("window_edges") if section else None
+        if not isinstance(edges, Mapping):
+            return None
+        window_edges = edges.get(self._window_id)
+        if not isinstance(window_edges, Mapping):
+            return None
+        return window_edges.get(self._edge)
+
+
+class NordpoolNextDayBoundarySensor(NordpoolBaseSensor):
+    """Next Helsinki midnight, when daily figures roll over."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:calendar-arrow-right"
+    _attr_translation_key = "next_day_boundary"
+    _sections = (SECTION_TIMESTAMPS,)
+
+    def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_next_day_boundary"
+        self._attr_name = "Next Day Boundary"
+
+    @property
+    def native_value(self) -> datetime | None:
+        section = self._price_section()
+        boundary = section.get("next_day_boundary") if section else None
+        return boundary if isinstance(boundary, datetime) else None
+
+
 #region _windpower
 class NordpoolWindpowerSensor(NordpoolBaseSensor):
     _attr_translation_key = "windpower"
+    _unrecorded_attributes = frozenset({ATTR_WIND_FORECAST})
+    _sections = (SECTION_WINDPOWER,)
     _attr_icon = "mdi:weather-windy"
     _attr_native_unit_of_measurement = "MW"
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -691,14 +876,11 @@ class NordpoolWindpowerSensor(NordpoolBaseSensor):
         return None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         section = self._section()
         if not section:
             return None
-        series: list[SeriesPoint] = section.get("series", [])
-        forecast_series = [
-            point for point in series if isinstance(point, SeriesPoint)
-        ]
+        forecast_series = self.coordinator.time_index("windpower").series
         return {
             ATTR_WIND_FORECAST: self._build_forecast_attributes(forecast_series, decimals=0),
             ATTR_RAW_SOURCE: self.coordinator.base_url,
@@ -711,6 +893,7 @@ class NordpoolWindpowerSensor(NordpoolBaseSensor):
 #region _windpower_now
 class NordpoolWindpowerNowSensor(NordpoolBaseSensor):
     _attr_translation_key = "windpower_now"
+    _sections = (SECTION_WINDPOWER, SECTION_CLOCK)
     _attr_icon = "mdi:weather-windy"
     _attr_native_unit_of_measurement = "MW"
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -729,7 +912,7 @@ class NordpoolWindpowerNowSensor(NordpoolBaseSensor):
         return int(round(point.value))
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         point = self._current_point()
         return {
             ATTR_TIMESTAMP: point.datetime.isoformat() if point else None,
@@ -743,27 +926,14 @@ class NordpoolWindpowerNowSensor(NordpoolBaseSensor):
         current = section.get("current")
         if isinstance(current, SeriesPoint):
             return current
-        series = section.get("series")
-        if isinstance(series, list):
-            now = getattr(self.coordinator, "current_time", None)
-            if now is None:
-                now = datetime.now(timezone.utc)
-            latest: SeriesPoint | None = None
-            for point in series:
-                if not isinstance(point, SeriesPoint):
-                    continue
-                if point.datetime <= now:
-                    latest = point
-                else:
-                    break
-            if latest:
-                return latest
-        return None
+        return self.coordinator.time_index("windpower").at_or_before(self._now())
 
 
 #region _narration
 class NordpoolNarrationSensor(NordpoolBaseSensor):
     _attr_icon = "mdi:file-document-edit-outline"
+    _unrecorded_attributes = frozenset({ATTR_NARRATION_CONTENT})
+    _sections = (SECTION_NARRATION,)
 
     def __init__(self, coordinator: NordpoolPredictCoordinator, entry: ConfigEntry, language: str) -> None:
         super().__init__(coordinator, entry)
@@ -784,7 +954,7 @@ class NordpoolNarrationSensor(NordpoolBaseSensor):
         return None
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+    def _sensor_attributes(self) -> Mapping[str, Any] | None:
         section = self._section()
         attributes: dict[str, Any] = {
             ATTR_LANGUAGE: self._language,
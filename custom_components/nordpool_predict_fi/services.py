@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+#region services
+
+from collections.abc import Mapping
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DEADLINE,
+    ATTR_DEADLINE_TIME,
+    ATTR_DURATION,
+    ATTR_EARLIEST_START,
+    ATTR_END_HOUR,
+    ATTR_LOOKAHEAD_HOURS,
+    ATTR_START_HOUR,
+    DATA_COORDINATOR,
+    DOMAIN,
+    MAX_CHEAPEST_WINDOW_LOOKAHEAD_HOURS,
+    MAX_CUSTOM_WINDOW_HOUR,
+    MAX_DEADLINE_HOURS,
+    MIN_CUSTOM_WINDOW_HOUR,
+    SERVICE_FIND_CHEAPEST_WINDOW,
+    SERVICE_FIND_DEADLINE_WINDOWS,
+)
+from .coordinator import NordpoolPredictCoordinator, PriceWindow
+
+_HOUR = vol.All(vol.Coerce(int), vol.Range(min=MIN_CUSTOM_WINDOW_HOUR, max=MAX_CUSTOM_WINDOW_HOUR))
+_HOURS = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CHEAPEST_WINDOW_LOOKAHEAD_HOURS))
+
+FIND_CHEAPEST_WINDOW_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DURATION): _HOURS,
+        vol.Optional(ATTR_EARLIEST_START): cv.datetime,
+        vol.Optional(ATTR_DEADLINE): cv.datetime,
+        vol.Optional(ATTR_START_HOUR): _HOUR,
+        vol.Optional(ATTR_END_HOUR): _HOUR,
+        vol.Optional(ATTR_LOOKAHEAD_HOURS): _HOURS,
+    }
+)
+
+FIND_DEADLINE_WINDOWS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_DEADLINE_HOURS)
+        ),
+        vol.Optional(ATTR_DEADLINE_TIME): cv.time,
+    }
+)
+
+
+#region _setup
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services; they resolve their entry per call."""
+
+    async def _find_cheapest_window(call: ServiceCall) -> ServiceResponse:
+        coordinator = _coordinator_for_call(hass, call)
+        earliest_start = call.data.get(ATTR_EARLIEST_START)
+        deadline = call.data.get(ATTR_DEADLINE)
+        window = coordinator.find_cheapest_window(
+            call.data[ATTR_DURATION],
+            earliest_start=dt_util.as_utc(earliest_start) if earliest_start else None,
+            deadline=dt_util.as_utc(deadline) if deadline else None,
+            start_hour=call.data.get(ATTR_START_HOUR),
+            end_hour=call.data.get(ATTR_END_HOUR),
+            lookahead_hours=call.data.get(ATTR_LOOKAHEAD_HOURS),
+        )
+        return {"window": _window_response(window, coordinator.extra_fees_cents)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_CHEAPEST_WINDOW,
+        _find_cheapest_window,
+        schema=FIND_CHEAPEST_WINDOW_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _find_deadline_windows(call: ServiceCall) -> ServiceResponse:
+        coordinator = _coordinator_for_call(hass, call)
+        entries = coordinator.find_deadline_windows(
+            call.data[ATTR_DURATION],
+            call.data.get(ATTR_DEADLINE_TIME) or coordinator.deadline_time,
+        )
+        fees = coordinator.extra_fees_cents
+        return {
+            "windows": [
+                {
+                    "deadline": entry.deadline.isoformat(),
+                    "window": _window_response(entry.window, fees),
+                }
+                for entry in entries
+            ]
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_DEADLINE_WINDOWS,
+        _find_deadline_windows,
+        schema=FIND_DEADLINE_WINDOWS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+#region _helpers
+def _coordinator_for_call(hass: HomeAssistant, call: ServiceCall) -> NordpoolPredictCoordinator:
+    loaded = {
+        entry_id: stored[DATA_COORDINATOR]
+        for entry_id, stored in hass.data.get(DOMAIN, {}).items()
+        if isinstance(stored, Mapping) and DATA_COORDINATOR in stored
+    }
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        if entry_id not in loaded:
+            raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+        return loaded[entry_id]
+    if len(loaded) != 1:
+        raise ServiceValidationError(
+            f"Expected one loaded {DOMAIN} entry, found {len(loaded)}; pass {ATTR_CONFIG_ENTRY_ID}"
+        )
+    return next(iter(loaded.values()))
+
+
+def _window_response(window: PriceWindow | None, fees: float) -> dict[str, Any] | None:
+    if window is None:
+        return None
+    return {
+        "start": window.start.isoformat(),
+        "end": window.end.isoformat(),
+        "duration_hours": window.duration_hours,
+        "average": round(window.average + fees, 3),
+        "points": [
+            {"timestamp": point.datetime.isoformat(), "value": round(point.value + fees, 3)}
+            for point in window.points
+        ],
+    }
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.nordpool_predict_fi import calendar
+from custom_components.nordpool_predict_fi.const import (
+    CALENDAR_DAILY_KEY,
+    CUSTOM_WINDOW_KEY,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+from custom_components.nordpool_predict_fi.coordinator import (
+    NordpoolPredictCoordinator,
+    PriceWindow,
+    SeriesPoint,
+    WindowIntervalIndex,
+)
+
+BASE = datetime(2024, 3, 1, 22, 0, tzinfo=timezone.utc)  # Helsinki midnight
+
+
+def _window(start_hour: int, hours: int, average: float = 1.0) -> PriceWindow:
+    start = BASE + timedelta(hours=start_hour)
+    return PriceWindow(
+        duration_hours=hours,
+        start=start,
+        end=start + timedelta(hours=hours),
+        average=average,
+        points=[],
+    )
+
+
+def test_window_interval_index_matches_linear_scan() -> None:
+    rng = random.Random(23)
+    entries = [
+        (str(position), _window(rng.randrange(0, 96), rng.randrange(1, 13)))
+        for position in range(60)
+    ]
+    index = WindowIntervalIndex(None, entries)
+    assert len(index) == len(entries)
+    for _ in range(200):
+        start = BASE + timedelta(minutes=rng.randrange(-600, 120 * 60))
+        end = start + timedelta(minutes=rng.randrange(1, 24 * 60))
+        expected = sorted(
+            (entry for entry in entries if entry[1].start < end and entry[1].end > start),
+            key=lambda entry: (entry[1].start, entry[1].end),
+        )
+        assert index.overlapping(start, end) == expected
+        upcoming = min(
+            (entry for entry in entries if entry[1].end > start),
+            key=lambda entry: (entry[1].start, entry[1].end),
+            default=None,
+        )
+        assert index.current_or_next(start) == upcoming
+
+
+def test_daily_cheapest_windows_pick_one_block_per_helsinki_day(hass, enable_custom_integrations) -> None:
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=None,
+        calendar_daily_hours=2,
+    )
+    values = [10.0] * 48
+    values[3:5] = [1.0, 1.0]  # 03-05 on day one
+    values[23:25] = [0.0, 0.0]  # straddles midnight; never a daily block
+    values[40:42] = [2.0, 2.0]  # 16-18 on day two
+    series = [SeriesPoint(BASE + timedelta(hours=hour), value) for hour, value in enumerate(values)]
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    days = coordinator._calculate_daily_averages(series, helsinki_tz)
+
+    blocks = coordinator._daily_cheapest_windows(series, days)
+
+    assert [(block.start, block.end) for block in blocks] == [
+        (BASE + timedelta(hours=3), BASE + timedelta(hours=5)),
+        (BASE + timedelta(hours=40), BASE + timedelta(hours=42)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calendar_lists_windows_and_daily_blocks(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, unique_id=DOMAIN, title="Nordpool Predict FI", data={})
+    entry.add_to_hass(hass)
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id=entry.entry_id,
+        base_url="https://example.com/deploy",
+        update_interval=None,
+        extra_fees_cents=0.5,
+    )
+    three = _window(3, 3, average=2.0)
+    custom = _window(10, 4, average=3.0)
+    daily = [_window(4, 2), _window(28, 2)]
+    coordinator.async_set_updated_data(
+        {
+            "price": {
+                "cheapest_windows": {3: three, 6: None, 12: None},
+                CUSTOM_WINDOW_KEY: {"window": custom},
+                "daily_cheapest": daily,
+            }
+        }
+    )
+    monkeypatch.setattr(coordinator, "_current_time", lambda: BASE + timedelta(hours=5))
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_COORDINATOR: coordinator}
+
+    added: list[calendar.NordpoolCheapestWindowsCalendar] = []
+    await calendar.async_setup_entry(hass, entry, added.extend)
+    assert len(added) == 1
+    entity = added[0]
+
+    events = await entity.async_get_events(hass, BASE, BASE + timedelta(days=1))
+    assert [(event.summary, event.start) for event in events] == [
+        ("Cheapest 3h window", three.start),
+        ("Cheapest 2h block of the day", daily[0].start),
+        ("Cheapest custom window", custom.start),
+    ]
+    assert events[0].description == "Average 2.5 c/kWh"
+    assert entity.event is not None
+    assert entity.event.start == three.start
+
+    index = coordinator.calendar_index()
+    assert coordinator.calendar_index() is index
+    later = await entity.async_get_events(hass, BASE + timedelta(days=1), BASE + timedelta(days=2))
+    assert [event.start for event in later] == [daily[1].start]
+    assert index.current_or_next(BASE + timedelta(hours=29)) == (CALENDAR_DAILY_KEY, daily[1])
+    assert index.current_or_next(BASE + timedelta(hours=30)) is None
@@ -9,6 +9,8 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.nordpool_predict_fi.const import (
     CONF_BASE_URL,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_MIRROR_URLS,
     CONF_UPDATE_INTERVAL,
     DEFAULT_BASE_URL,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
@@ -74,6 +76,7 @@ async def test_options_flow(hass: HomeAssistant, enable_custom_integrations, mon
     updated = {
         CONF_BASE_URL: f"{DEFAULT_BASE_URL}/alt",
         CONF_UPDATE_INTERVAL: 45,
+        CONF_COMPACT_ATTRIBUTES: True,
     }
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
@@ -83,6 +86,7 @@ async def test_options_flow(hass: HomeAssistant, enable_custom_integrations, mon
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert entry.options[CONF_BASE_URL] == f"{DEFAULT_BASE_URL}/alt"
     assert entry.options[CONF_UPDATE_INTERVAL] == 45
+    assert entry.options[CONF_COMPACT_ATTRIBUTES] is True
 
 
 async def test_user_flow_invalid_url(hass: HomeAssistant, enable_custom_integrations) -> None:
@@ -104,6 +108,18 @@ async def test_user_flow_invalid_url(hass: HomeAssistant, enable_custom_integrat
     assert invalid["type"] == FlowResultType.FORM
     assert invalid["errors"] == {CONF_BASE_URL: "invalid_url"}
 
+    invalid_mirror = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_BASE_URL: DEFAULT_BASE_URL,
+            CONF_MIRROR_URLS: "https://mirror.example/deploy, not a url",
+            CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL_MINUTES,
+        },
+    )
+
+    assert invalid_mirror["type"] == FlowResultType.FORM
+    assert invalid_mirror["errors"] == {CONF_MIRROR_URLS: "invalid_mirror_url"}
+
 
 async def test_options_flow_invalid_url(hass: HomeAssistant, enable_custom_integrations, monkeypatch) -> None:
     """Options flow should surface validation errors."""
@@ -212,6 +228,7 @@ async def test_reconfigure_flow_updates_entry(hass: HomeAssistant, enable_custom
         flow["flow_id"],
         user_input={
             CONF_BASE_URL: f"{DEFAULT_BASE_URL}/custom/",
+            CONF_MIRROR_URLS: " https://mirror.example/deploy/ ,, http://192.168.1.5/npf ",
             CONF_UPDATE_INTERVAL: 120,
         },
     )
@@ -220,3 +237,6 @@ async def test_reconfigure_flow_updates_entry(hass: HomeAssistant, enable_custom
     assert result["title"] == entry.title
     assert result["data"][CONF_BASE_URL] == f"{DEFAULT_BASE_URL}/custom"
     assert result["data"][CONF_UPDATE_INTERVAL] == 120
+    assert result["data"][CONF_MIRROR_URLS] == (
+        "https://mirror.example/deploy, http://192.168.1.5/npf"
+    )
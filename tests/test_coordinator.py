@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import json
+import random
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Callable
 
 import pytest
 from aiohttp import ClientError
@@ -12,21 +14,32 @@ from zoneinfo import ZoneInfo
 from custom_components.nordpool_predict_fi.const import (
     CHEAPEST_WINDOW_HOURS,
     CUSTOM_WINDOW_KEY,
+    DATA_WINDOW_LEADS,
     DEFAULT_CUSTOM_WINDOW_END_HOUR,
     DEFAULT_CUSTOM_WINDOW_HOURS,
     DEFAULT_CUSTOM_WINDOW_START_HOUR,
+    EVENT_WINDOW,
+    PUBLISH_HISTORY_SIZE,
 )
 from custom_components.nordpool_predict_fi.coordinator import (
     NordpoolPredictCoordinator,
+    PriceSeries,
     PriceWindow,
     SeriesPoint,
+    SeriesTimeIndex,
 )
 
 
 class _MockResponse:
-    def __init__(self, payload: Any, status: int = 200) -> None:
+    def __init__(
+        self,
+        payload: Any,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self._payload = payload
         self.status = status
+        self.headers = headers or {}
 
     async def __aenter__(self) -> "_MockResponse":
         return self
@@ -46,12 +59,17 @@ class _MockResponse:
             return self._payload
         raise AssertionError("Unexpected text() call for non-string payload")
 
+    async def read(self) -> bytes:
+        if isinstance(self._payload, str):
+            return self._payload.encode("utf-8")
+        return json.dumps(self._payload).encode("utf-8")
+
 
 class _MockSession:
     def __init__(self, payloads: dict[str, Any]) -> None:
         self._payloads = payloads
 
-    def get(self, url: str) -> _MockResponse:
+    def get(self, url: str, **kwargs: Any) -> _MockResponse:
         if url in self._payloads:
             return _MockResponse(self._payloads[url])
         if url.startswith("https://sahkotin.fi/prices.csv"):
@@ -229,33 +247,634 @@ async def test_coordinator_merges_realized_and_forecast(
     )
 
     monkeypatch.setattr(
-        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
-        lambda hass: session,
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+    )
+    monkeypatch.setattr(coordinator, "_current_time", lambda: now)
+
+    data = await coordinator._async_update_data()
+
+    price_section = data["price"]
+    # Merged series starts from today midnight and uses realized data
+    assert price_section["forecast"][0].datetime == datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    assert price_section["forecast"][0].value == pytest.approx(10.0)  # Realized price
+    assert price_section["forecast"][4].datetime == datetime(2024, 1, 1, 4, 0, tzinfo=timezone.utc)
+    assert price_section["forecast"][4].value == pytest.approx(14.0)  # Last realized
+    assert price_section["forecast"][5].datetime == datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
+    assert price_section["forecast"][5].value == pytest.approx(5.0)  # Forecast starts
+    assert price_section["forecast_start"] == datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
+    assert price_section["forecast"][-1].datetime == datetime(2024, 1, 4, 23, 0, tzinfo=timezone.utc)
+    # Current point is at or before now (15:00 Helsinki = 13:00 UTC) from merged series
+    # At 13:00 UTC, the forecast value is 13.0
+    assert price_section["current"].value == pytest.approx(13.0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_listeners_when_content_unchanged(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset % 9)]
+        for offset in range(96)
+    ]
+    session = _MockSession(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": [],
+            f"{base_url}/narration.md": "Example",
+            f"{base_url}/narration_en.md": "Example EN",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+    )
+    clock = {"now": datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    updates = 0
+
+    def _listener() -> None:
+        nonlocal updates
+        updates += 1
+
+    unsub = coordinator.async_add_listener(_listener)
+    try:
+        await coordinator.async_refresh()
+        first = coordinator.data
+        assert updates == 1
+
+        clock["now"] = datetime(2024, 1, 1, 10, 35, tzinfo=timezone.utc)
+        await coordinator.async_refresh()
+        assert coordinator.data is first
+        assert first["price"]["now"] == clock["now"]
+        assert updates == 1
+        stats = coordinator.artifact_diagnostics()["prediction.json"]
+        assert stats["unchanged"] == 1
+
+        clock["now"] = datetime(2024, 1, 1, 11, 5, tzinfo=timezone.utc)
+        await coordinator.async_refresh()
+        assert coordinator.data is not first
+        assert coordinator.data["price"]["forecast"] is first["price"]["forecast"]
+        assert coordinator.data["price"]["current"].datetime == datetime(
+            2024, 1, 1, 11, 0, tzinfo=timezone.utc
+        )
+        assert updates == 2
+    finally:
+        unsub()
+
+
+@pytest.mark.asyncio
+async def test_failed_sources_serve_stale_data_until_max_staleness(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset)]
+        for offset in range(96)
+    ]
+    failing: set[str] = set()
+
+    class _FlakySession(_MockSession):
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            if any(url.startswith(prefix) for prefix in failing):
+                raise ClientError("upstream down")
+            return super().get(url, **kwargs)
+
+    session = _FlakySession(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": [],
+            f"{base_url}/narration.md": "Example",
+            f"{base_url}/narration_en.md": "Example EN",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(minutes=30),
+        max_staleness=timedelta(hours=6),
+    )
+    clock = {"now": datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.stale is False
+    assert coordinator.data_age() == 0
+
+    failing.update({f"{base_url}/prediction.json", "https://sahkotin.fi"})
+    clock["now"] = datetime(2024, 1, 1, 12, 5, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.stale is True
+    assert coordinator.data["meta"]["stale"] is True
+    assert coordinator.data_age() == 2 * 3600
+    assert coordinator.data["price"]["current"].value == 12.0
+    assert coordinator._poll_failures == 1
+    assert coordinator.freshness_diagnostics()["fetched_at"]["prediction.json"] == (
+        "2024-01-01T10:05:00+00:00"
+    )
+
+    failing.clear()
+    clock["now"] = datetime(2024, 1, 1, 12, 35, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+    assert coordinator.stale is False
+    assert coordinator.data["meta"]["stale"] is False
+    assert coordinator._poll_failures == 0
+
+    failing.add(f"{base_url}/prediction.json")
+    clock["now"] = datetime(2024, 1, 1, 18, 36, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_forecast_does_not_cancel_realized_prices(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset)]
+        for offset in range(96)
+    ]
+    prediction_down = False
+
+    class _SlowResponse(_MockResponse):
+        async def __aenter__(self) -> "_MockResponse":
+            await asyncio.sleep(0.05)
+            return self
+
+    class _Session(_MockSession):
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            if prediction_down and url == f"{base_url}/prediction.json":
+                raise ClientError("upstream down")
+            if url.startswith("https://sahkotin.fi/prices.csv"):
+                return _SlowResponse(self._payloads["sahkotin"])
+            return super().get(url, **kwargs)
+
+    payloads = {
+        f"{base_url}/prediction.json": forecast,
+        f"{base_url}/windpower.json": [],
+        f"{base_url}/narration.md": "Example",
+        f"{base_url}/narration_en.md": "Example EN",
+        "sahkotin": "timestamp,price\n",
+    }
+    session = _Session(payloads)
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(minutes=30),
+    )
+    clock = {"now": datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    await coordinator.async_refresh()
+    assert coordinator.data["price"]["current"].value == 10.0
+
+    prediction_down = True
+    payloads["sahkotin"] = "timestamp,price\n2024-01-01T12:00:00Z,99.0\n"
+    clock["now"] = datetime(2024, 1, 1, 12, 5, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.stale is True
+    assert coordinator.data["price"]["current"].value == 99.0
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_artifacts_serve_last_good_copy_until_max_staleness(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset)]
+        for offset in range(96)
+    ]
+    wind = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, 3000.0 + offset]
+        for offset in range(96)
+    ]
+    down: set[str] = set()
+
+    class _Session(_MockSession):
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            if url.rsplit("/", 1)[-1] in down:
+                raise ClientError("upstream down")
+            return super().get(url, **kwargs)
+
+    session = _Session(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": wind,
+            f"{base_url}/narration.md": "Tiivistelmä.",
+            f"{base_url}/narration_en.md": "Summary.",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(minutes=30),
+        max_staleness=timedelta(hours=6),
+    )
+    clock = {"now": datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    await coordinator.async_refresh()
+    wind_data = coordinator.data["windpower"]
+    narration = coordinator.data["narration"]
+    assert wind_data is not None
+    assert narration["fi"] is not None and narration["en"] is not None
+
+    down.update({"windpower.json", "narration.md", "narration_en.md"})
+    clock["now"] = datetime(2024, 1, 1, 12, 5, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.stale is True
+    assert coordinator.data["windpower"]["series"] == wind_data["series"]
+    assert coordinator.data["narration"] == narration
+
+    # Past the staleness limit the copies are dropped rather than served.
+    clock["now"] = datetime(2024, 1, 1, 16, 10, tzinfo=timezone.utc)
+    await coordinator.async_refresh()
+    assert coordinator.data["windpower"] is None
+    assert coordinator.data["narration"]["fi"] is None
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_without_cached_copy_refetches_in_full(
+    hass, enable_custom_integrations
+) -> None:
+    coordinator = _coordinator(hass)
+    rows = [[1704067200000, 10.0], [1704070800000, 12.5]]
+    requests: list[dict[str, str]] = []
+
+    class _CachingProxySession:
+        def get(self, requested: str, **kwargs: Any) -> _MockResponse:
+            headers = dict(kwargs.get("headers") or {})
+            requests.append(headers)
+            if headers.get("Cache-Control") != "no-cache":
+                return _MockResponse(None, status=304)
+            return _MockResponse(rows)
+
+    payload = await coordinator._fetch_json(_CachingProxySession(), "prediction.json")
+
+    assert payload == rows
+    assert requests == [{}, {"Cache-Control": "no-cache"}]
+    assert coordinator.artifact_diagnostics()["prediction.json"]["not_modified"] == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_builds_data_for_the_time_it_completes(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset)]
+        for offset in range(96)
+    ]
+    clock = {"now": datetime(2024, 1, 1, 10, 59, 59, tzinfo=timezone.utc)}
+
+    class _Session(_MockSession):
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            if url == f"{base_url}/prediction.json":
+                # The response lands after the hour boundary.
+                clock["now"] = datetime(2024, 1, 1, 11, 0, 1, tzinfo=timezone.utc)
+            return super().get(url, **kwargs)
+
+    session = _Session(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": [],
+            f"{base_url}/narration.md": "Example",
+            f"{base_url}/narration_en.md": "Example EN",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    coordinator = _coordinator(hass)
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data["price"]["now"] == clock["now"]
+    assert coordinator.data["price"]["current"].value == 11.0
+    assert coordinator.stale is False
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_clock_recomputes_time_dependent_data_without_fetching(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset)]
+        for offset in range(96)
+    ]
+    session = _MockSession(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": [],
+            f"{base_url}/narration.md": "Example",
+            f"{base_url}/narration_en.md": "Example EN",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(hours=6),
+    )
+    clock = {"now": datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    updates = 0
+
+    def _listener() -> None:
+        nonlocal updates
+        updates += 1
+
+    unsub = coordinator.async_add_listener(_listener)
+    try:
+        await coordinator.async_refresh()
+        assert updates == 1
+        assert coordinator._clock_point == datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+
+        def _no_fetch(url: str, **kwargs: Any) -> _MockResponse:
+            raise AssertionError(f"clock tick fetched {url}")
+
+        monkeypatch.setattr(session, "get", _no_fetch)
+        clock["now"] = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+        coordinator._async_clock_tick(clock["now"])
+        assert updates == 2
+        assert coordinator.data["price"]["current"].datetime == clock["now"]
+        assert coordinator.data["price"]["now"] == clock["now"]
+        assert coordinator._clock_point == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    finally:
+        unsub()
+    assert coordinator._unsub_clock is None
+
+
+def test_next_clock_boundary_includes_windows_and_midnight(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    now = datetime(2024, 1, 1, 21, 40, tzinfo=timezone.utc)  # 23:40 Helsinki
+    window = PriceWindow(
+        duration_hours=1,
+        start=datetime(2024, 1, 1, 21, 50, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 1, 22, 50, tzinfo=timezone.utc),
+        average=1.0,
+        points=[],
+    )
+    coordinator.async_set_updated_data({"price": {"cheapest_windows": {3: window}}})
+    assert coordinator._next_clock_boundary(now) == window.start
+    assert coordinator._next_clock_boundary(window.start) == datetime(2024, 1, 1, 22, 0, tzinfo=timezone.utc)
+    coordinator.async_set_updated_data({})
+    just_before = datetime(2024, 1, 1, 21, 59, 59, tzinfo=timezone.utc)
+    assert coordinator._next_clock_boundary(just_before) == datetime(2024, 1, 1, 22, 0, tzinfo=timezone.utc)
+
+
+
+def test_window_edges_fire_events_with_registered_leads(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    window = PriceWindow(
+        duration_hours=3,
+        start=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 1, 15, 0, tzinfo=timezone.utc),
+        average=1.5,
+        points=[],
+    )
+    coordinator.async_set_updated_data({"price": {"cheapest_windows": {3: window}}})
+    hass.data[DATA_WINDOW_LEADS] = {coordinator.entry_id: {30: 1}}
+    fired: list[dict[str, Any]] = []
+    hass.bus.async_listen(EVENT_WINDOW, lambda event: fired.append(dict(event.data)))
+
+    now = datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc)
+    assert coordinator._next_clock_boundary(now) == datetime(2024, 1, 1, 11, 30, tzinfo=timezone.utc)
+
+    coordinator._window_events_until = now
+    coordinator._fire_window_events(datetime(2024, 1, 1, 11, 30, tzinfo=timezone.utc))
+    coordinator._fire_window_events(window.start)
+    coordinator._fire_window_events(window.start)
+    coordinator._fire_window_events(window.end)
+    hass.data.pop(DATA_WINDOW_LEADS)
+
+    edges = [(event["window"], event["edge"], event["lead_minutes"]) for event in fired]
+    assert edges == [
+        ("3h", "start", 30),
+        ("3h", "start", 0),
+        ("3h", "end", 30),
+        ("3h", "end", 0),
+    ]
+    assert fired[1] == {
+        "entry_id": coordinator.entry_id,
+        "window": "3h",
+        "edge": "start",
+        "lead_minutes": 0,
+        "start": window.start.isoformat(),
+        "end": window.end.isoformat(),
+        "average": 1.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restores_last_good_refresh(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, float(offset % 5)]
+        for offset in range(72)
+    ]
+    wind = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, 1000.0 + offset]
+        for offset in range(72)
+    ]
+    session = _MockSession(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": wind,
+            f"{base_url}/narration.md": "Tiivistelmä.",
+            f"{base_url}/narration_en.md": "Summary.",
+            "sahkotin": "timestamp,price\n2024-01-01T00:00:00Z,42.0\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    refreshed_at = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+    live = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="snapshot",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+    )
+    monkeypatch.setattr(live, "_current_time", lambda: refreshed_at)
+    live_data = await live._async_update_data()
+    assert live_data["meta"]["snapshot_saved_at"] is None
+
+    restored = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="snapshot",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+    )
+    monkeypatch.setattr(restored, "_current_time", lambda: refreshed_at + timedelta(minutes=20))
+    assert await restored.async_restore_snapshot()
+
+    data = restored.data
+    assert data["meta"]["snapshot_saved_at"] == refreshed_at
+    assert data["price"]["forecast"] == live_data["price"]["forecast"]
+    assert data["price"]["forecast"][0].value == pytest.approx(42.0)
+    assert data["price"]["cheapest_windows"] == live_data["price"]["cheapest_windows"]
+    assert data["windpower"] == live_data["windpower"]
+    assert data["narration"] == live_data["narration"]
+
+    expired = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="snapshot",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+        max_staleness=timedelta(hours=6),
+    )
+    monkeypatch.setattr(
+        expired, "_current_time", lambda: refreshed_at + timedelta(hours=6, minutes=1)
+    )
+    assert not await expired.async_restore_snapshot()
+    assert expired.data is None
+
+    empty = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="no-snapshot",
+        base_url=base_url,
+        update_interval=timedelta(minutes=15),
+    )
+    assert not await empty.async_restore_snapshot()
+    assert empty.data is None
+
+
+@pytest.mark.asyncio
+async def test_update_fetches_artifacts_concurrently_within_deadline(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    now = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+    forecast_rows = [
+        [(now + timedelta(hours=offset)).timestamp() * 1000, float(offset % 4)]
+        for offset in range(72)
+    ]
+    started: list[str] = []
+    all_started = asyncio.Event()
+    sahkotin_ends: list[datetime] = []
+
+    def _mark(name: str) -> None:
+        started.append(name)
+        if len(started) == 5:
+            all_started.set()
+
+    async def _mock_fetch_json(self, session, suffix: str):
+        _mark(suffix)
+        await all_started.wait()
+        return forecast_rows
+
+    async def _mock_fetch_sahkotin(self, session, start, end):
+        _mark("sahkotin")
+        sahkotin_ends.append(end)
+        return []
+
+    async def _mock_fetch_text(self, session, suffix: str):
+        _mark(suffix)
+        if suffix == "narration_en.md":
+            await asyncio.Event().wait()  # never answers
+        return "Tiivistelmä."
+
+    async def _mock_fetch_artifact(self, session, suffix: str):
+        _mark(suffix)
+        return None
+
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: object(),
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
     )
-
-    coordinator = NordpoolPredictCoordinator(
-        hass=hass,
-        entry_id="test",
-        base_url=base_url,
-        update_interval=timedelta(minutes=15),
+    monkeypatch.setattr(NordpoolPredictCoordinator, "_fetch_json", _mock_fetch_json)
+    monkeypatch.setattr(
+        NordpoolPredictCoordinator, "_safe_fetch_sahkotin_series", _mock_fetch_sahkotin
     )
+    monkeypatch.setattr(NordpoolPredictCoordinator, "_safe_fetch_artifact_text", _mock_fetch_text)
+    monkeypatch.setattr(NordpoolPredictCoordinator, "_safe_fetch_artifact", _mock_fetch_artifact)
+    coordinator = _coordinator(hass)
+    # The refresh deadline leaves room for every attempt of a request.
+    assert coordinator._refresh_deadline() == 3 * 20
+    coordinator._request_timeout = 0.05
     monkeypatch.setattr(coordinator, "_current_time", lambda: now)
 
-    data = await coordinator._async_update_data()
+    data = await asyncio.wait_for(coordinator._async_update_data(), timeout=5)
 
-    price_section = data["price"]
-    # Merged series starts from today midnight and uses realized data
-    assert price_section["forecast"][0].datetime == datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
-    assert price_section["forecast"][0].value == pytest.approx(10.0)  # Realized price
-    assert price_section["forecast"][4].datetime == datetime(2024, 1, 1, 4, 0, tzinfo=timezone.utc)
-    assert price_section["forecast"][4].value == pytest.approx(14.0)  # Last realized
-    assert price_section["forecast"][5].datetime == datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
-    assert price_section["forecast"][5].value == pytest.approx(5.0)  # Forecast starts
-    assert price_section["forecast_start"] == datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
-    assert price_section["forecast"][-1].datetime == datetime(2024, 1, 4, 23, 0, tzinfo=timezone.utc)
-    # Current point is at or before now (15:00 Helsinki = 13:00 UTC) from merged series
-    # At 13:00 UTC, the forecast value is 13.0
-    assert price_section["current"].value == pytest.approx(13.0)
+    assert sorted(started[:5]) == sorted(
+        ["prediction.json", "sahkotin", "narration.md", "narration_en.md", "windpower.json"]
+    )
+    assert data["narration"]["fi"]["content"] == "Tiivistelmä."
+    assert data["narration"]["en"] is None
+    # One Sähkötin request, in the parallel batch, bounded by the day-ahead auction.
+    assert sahkotin_ends == [datetime(2024, 1, 2, 22, 0, tzinfo=timezone.utc)]
 
 
 @pytest.mark.asyncio
@@ -417,10 +1036,11 @@ async def test_fetch_json_invalid_payload_raises_update_failed(
     )
 
     class _InvalidJsonSession:
-        def get(self, url: str):
+        def get(self, url: str, **kwargs: Any):
             class _InvalidResponse:
                 def __init__(self) -> None:
                     self.status = 200
+                    self.headers: dict[str, str] = {}
 
                 async def __aenter__(self):
                     return self
@@ -434,6 +1054,9 @@ async def test_fetch_json_invalid_payload_raises_update_failed(
                 async def json(self, *args, **kwargs):
                     raise ValueError("broken")
 
+                async def read(self) -> bytes:
+                    return b"broken"
+
             return _InvalidResponse()
 
     session = _InvalidJsonSession()
@@ -442,6 +1065,340 @@ async def test_fetch_json_invalid_payload_raises_update_failed(
         await coordinator._fetch_json(session, "prediction.json")
 
 
+@pytest.mark.asyncio
+async def test_fetch_retries_and_opens_host_circuit(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    coordinator = _coordinator(hass)
+    clock = {"now": datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    rows = [[1704067200000, 10.0]]
+    outcomes: list[Any] = []
+    calls: list[str] = []
+
+    class _UnreliableSession:
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            calls.append(url)
+            assert kwargs["timeout"].connect == 10
+            outcome = outcomes.pop(0) if outcomes else rows
+            if isinstance(outcome, Exception):
+                raise outcome
+            return _MockResponse(outcome)
+
+    session = _UnreliableSession()
+
+    # Two transient failures are absorbed by the retries.
+    outcomes.extend([ClientError("reset"), asyncio.TimeoutError()])
+    assert await coordinator._fetch_json(session, "prediction.json") == rows
+    host = coordinator.host_diagnostics()["example.com"]
+    assert host["state"] == "closed"
+    assert host["retries"] == 2
+    assert host["errors"] == 2
+    assert host["consecutive_failures"] == 0
+
+    # One request exhausting its retries is a single failure for the host.
+    outcomes.extend([ClientError("down")] * 3)
+    with pytest.raises(UpdateFailed):
+        await coordinator._fetch_json(session, "windpower.json")
+    host = coordinator.host_diagnostics()["example.com"]
+    assert host["state"] == "closed"
+    assert host["consecutive_failures"] == 1
+    assert host["errors"] == 5
+
+    # Three failed requests in a row open the circuit.
+    outcomes.extend([ClientError("down")] * 6)
+    for _ in range(2):
+        with pytest.raises(UpdateFailed):
+            await coordinator._fetch_json(session, "windpower.json")
+    assert coordinator.host_diagnostics()["example.com"]["state"] == "open"
+
+    calls.clear()
+    assert await coordinator._safe_fetch_artifact_text(session, "narration.md") is None
+    assert calls == []
+    assert coordinator.host_diagnostics()["example.com"]["short_circuits"] == 1
+
+    # After the cooldown requests go through again and a success closes it.
+    clock["now"] += timedelta(minutes=6)
+    assert coordinator.host_diagnostics()["example.com"]["state"] == "half_open"
+    assert await coordinator._fetch_json(session, "windpower.json") == rows
+    assert coordinator.host_diagnostics()["example.com"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_mirrors_hedge_slow_requests_and_fail_over(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.HEDGE_DEFAULT_DELAY_SECONDS", 0.01
+    )
+    primary = "https://primary.example/deploy"
+    mirror = "https://mirror.example/deploy"
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=primary,
+        update_interval=timedelta(minutes=15),
+        mirror_urls=[mirror],
+    )
+    rows = [[1704067200000, 10.0]]
+    slow: set[str] = {primary}
+    down: set[str] = set()
+    cancelled: list[str] = []
+
+    class _DelayedResponse(_MockResponse):
+        def __init__(self, payload: Any, url: str) -> None:
+            super().__init__(payload)
+            self._url = url
+
+        async def __aenter__(self) -> "_DelayedResponse":
+            if any(self._url.startswith(base) for base in slow):
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(self._url)
+                    raise
+            return self
+
+    class _MirroredSession:
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            if any(url.startswith(base) for base in down):
+                raise ClientError("mirror down")
+            return _DelayedResponse(rows, url)
+
+    session = _MirroredSession()
+
+    # The primary stalls past its hedge delay; the mirror answers and wins.
+    assert await coordinator._fetch_json(session, "prediction.json") == rows
+    assert cancelled == [f"{primary}/prediction.json"]
+    stats = coordinator.mirror_diagnostics()
+    assert stats[mirror]["hedges"] == 1
+    assert stats[mirror]["wins"] == 1
+    assert stats[primary]["requests"] == 0
+    assert coordinator._ranked_mirrors() == [mirror, primary]
+
+    # The mirror going down fails over to the primary within the same request.
+    slow.clear()
+    down.add(mirror)
+    assert await coordinator._fetch_json(session, "windpower.json") == rows
+    mirror_host = coordinator.host_diagnostics()["mirror.example"]
+    assert mirror_host["consecutive_failures"] == 1
+    assert mirror_host["errors"] == 3
+    assert coordinator._ranked_mirrors() == [primary, mirror]
+    assert coordinator.mirror_diagnostics()[primary]["wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_reuses_parsed_artifacts_on_not_modified(
+    hass, enable_custom_integrations
+) -> None:
+    coordinator = _coordinator(hass)
+    url = coordinator._compose_url("prediction.json")
+    rows = [[1704067200000, 10.0], [1704070800000, 12.5]]
+    requests: list[dict[str, str]] = []
+
+    class _ConditionalSession:
+        def get(self, requested: str, **kwargs: Any) -> _MockResponse:
+            assert requested == url
+            headers = kwargs.get("headers") or {}
+            requests.append(dict(headers))
+            if headers.get("If-None-Match") == '"v1"':
+                return _MockResponse(None, status=304)
+            return _MockResponse(
+                rows,
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            )
+
+    session = _ConditionalSession()
+    first = await coordinator._fetch_json(session, "prediction.json")
+    first_series = coordinator._parsed_artifact(
+        "prediction.json", first, coordinator._series_from_rows
+    )
+    state = coordinator._artifacts["prediction.json"]
+    timings = (state.decode_seconds, state.parse_seconds)
+    assert all(seconds > 0 for seconds in timings)
+    second = await coordinator._fetch_json(session, "prediction.json")
+    second_series = coordinator._parsed_artifact(
+        "prediction.json", second, coordinator._series_from_rows
+    )
+
+    assert requests[0] == {}
+    assert requests[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert second is first
+    assert second_series is first_series
+    assert [point.value for point in first_series] == [10.0, 12.5]
+    # Neither a 304 nor a parse hit overwrites the timings of the real work.
+    assert (state.decode_seconds, state.parse_seconds) == timings
+
+    stats = coordinator.artifact_diagnostics()["prediction.json"]
+    assert stats["requests"] == 2
+    assert stats["not_modified"] == 1
+    assert stats["parse_hits"] == 1
+    assert stats["last_bytes"] == 0
+    assert stats["total_bytes"] == len(json.dumps(rows))
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_keep_validators_per_mirror(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.FETCH_RETRY_DELAY_SECONDS", 0
+    )
+    primary = "https://primary.example/deploy"
+    mirror = "https://mirror.example/deploy"
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=primary,
+        update_interval=timedelta(minutes=15),
+        mirror_urls=[mirror],
+    )
+    served = {
+        primary: ([[1704067200000, 20.0]], '"p2"', "Mon, 01 Jan 2024 12:00:00 GMT"),
+        mirror: ([[1704067200000, 10.0]], '"m1"', "Mon, 01 Jan 2024 06:00:00 GMT"),
+    }
+    down: set[str] = set()
+    sent: list[tuple[str, dict[str, str]]] = []
+
+    class _Session:
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            base = url.rsplit("/", 1)[0]
+            headers = dict(kwargs.get("headers") or {})
+            sent.append((base, headers))
+            if base in down:
+                raise ClientError("down")
+            rows, etag, modified = served[base]
+            if headers.get("If-None-Match") == etag:
+                return _MockResponse(None, status=304)
+            return _MockResponse(rows, headers={"ETag": etag, "Last-Modified": modified})
+
+    session = _Session()
+    assert await coordinator._fetch_json(session, "prediction.json") == served[primary][0]
+
+    # The lagging mirror is asked without the primary's validators.
+    down.add(primary)
+    sent.clear()
+    assert await coordinator._fetch_json(session, "prediction.json") == served[mirror][0]
+    assert sent[-1] == (mirror, {})
+
+    # Back on the primary, its own validators still get a 304 for its own copy.
+    down = {mirror}
+    sent.clear()
+    assert await coordinator._fetch_json(session, "prediction.json") == served[primary][0]
+    assert [headers for base, headers in sent if base == primary] == [
+        {"If-None-Match": '"p2"', "If-Modified-Since": served[primary][2]}
+    ]
+    assert coordinator.artifact_diagnostics()["prediction.json"]["not_modified"] == 1
+    assert not coordinator._publish_minutes.get("prediction.json")
+
+
+def test_positional_arguments_keep_their_meaning(hass, enable_custom_integrations) -> None:
+    coordinator = NordpoolPredictCoordinator(
+        hass, "test", "https://example.com/deploy", timedelta(minutes=30), 2.5
+    )
+    assert coordinator.extra_fees_cents == 2.5
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_adapts_to_publish_times_and_failures(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=timedelta(hours=1),
+        min_update_interval=timedelta(minutes=5),
+    )
+    clock = {"now": datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    phase = coordinator._poll_phase
+    assert timedelta(0) <= phase < timedelta(minutes=5)
+
+    # Nothing learned yet and the auction results are three hours away.
+    assert coordinator._next_poll_interval(clock["now"]) == timedelta(hours=1)
+
+    bodies = iter([[[1704067200000, 10.0]], [[1704067200000, 11.0]]])
+
+    class _PublishingSession:
+        def get(self, url: str, **kwargs: Any) -> _MockResponse:
+            return _MockResponse(
+                next(bodies), headers={"Last-Modified": "Mon, 01 Jan 2024 08:50:00 GMT"}
+            )
+
+    session = _PublishingSession()
+    await coordinator._fetch_json(session, "prediction.json")
+    assert coordinator._publish_minutes == {}
+    clock["now"] = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+    await coordinator._fetch_json(session, "prediction.json")
+    assert list(coordinator._publish_minutes["prediction.json"]) == [8 * 60 + 50]
+
+    # A single publish is not a pattern yet; the same time on later days is.
+    next_day = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert coordinator._next_poll_interval(next_day.replace(hour=8, minute=30)) == timedelta(hours=1)
+    coordinator._publish_minutes["prediction.json"].extend([8 * 60 + 50] * 2)
+    assert coordinator._next_poll_interval(next_day.replace(hour=8, minute=30)) == timedelta(minutes=5)
+    assert coordinator._next_poll_interval(next_day.replace(hour=7)) == timedelta(hours=1)
+    assert coordinator._next_poll_interval(next_day.replace(hour=7, minute=50)) == (
+        timedelta(minutes=30) + phase
+    )
+
+    # Helsinki 14:00 with tomorrow's prices still missing polls at the floor.
+    coordinator._realized_slots = {int(datetime(2024, 1, 2, 11, tzinfo=timezone.utc).timestamp()): 1.0}
+    assert coordinator._next_poll_interval(next_day.replace(hour=12)) == timedelta(minutes=5)
+
+    coordinator._poll_failures = 3
+    for _ in range(20):
+        delay = coordinator._next_poll_interval(next_day.replace(hour=7))
+        assert timedelta(minutes=20) <= delay <= timedelta(minutes=40)
+    coordinator._poll_failures = 30
+    assert coordinator._next_poll_interval(next_day) <= timedelta(hours=1)
+
+    coordinator._poll_failures = 0
+    clock["now"] = next_day.replace(hour=8, minute=30)
+    coordinator._schedule_refresh()
+    assert coordinator.update_interval == timedelta(minutes=5)
+    coordinator._unschedule_refresh()
+
+    restored = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="other",
+        base_url="https://example.com/deploy",
+        update_interval=timedelta(hours=1),
+    )
+    restored._restore_publish_minutes({"prediction.json": [530, "bad", 2000], "x": "bad"})
+    assert list(restored._publish_minutes["prediction.json"]) == [530, 560]
+    assert "x" not in restored._publish_minutes
+
+
+def test_scattered_publish_times_keep_polling_sparse(hass, enable_custom_integrations) -> None:
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=timedelta(hours=1),
+        min_update_interval=timedelta(minutes=5),
+    )
+    # Two weeks of deploys at irregular times, none repeating within the window.
+    coordinator._restore_publish_minutes(
+        {"prediction.json": [(index * 103) % 1440 for index in range(PUBLISH_HISTORY_SIZE)]}
+    )
+    day = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    # Up to an hour before the day-ahead auction results (11:00 UTC in winter).
+    for step in range(60):
+        now = day + timedelta(minutes=10 * step)
+        assert coordinator._next_poll_interval(now) == timedelta(hours=1)
+
+
 @pytest.mark.asyncio
 async def test_custom_window_respects_hour_mask(hass, enable_custom_integrations) -> None:
     coordinator = _coordinator(hass)
@@ -479,6 +1436,7 @@ async def test_custom_window_respects_hour_mask(hass, enable_custom_integrations
 
     coordinator.set_custom_window_start_hour(12)
     coordinator.set_custom_window_end_hour(14)
+    await hass.async_block_till_done()
     narrowed = coordinator.data["price"][CUSTOM_WINDOW_KEY]
     assert isinstance(narrowed["window"], PriceWindow)
     assert narrowed["hours"] == DEFAULT_CUSTOM_WINDOW_HOURS
@@ -488,6 +1446,7 @@ async def test_custom_window_respects_hour_mask(hass, enable_custom_integrations
     assert 12 <= narrowed_start_hour <= 14
 
     coordinator.set_custom_window_hours(2)
+    await hass.async_block_till_done()
     updated = coordinator.data["price"][CUSTOM_WINDOW_KEY]
     assert updated["hours"] == 2
     assert isinstance(updated["window"], PriceWindow)
@@ -623,7 +1582,8 @@ async def test_custom_window_respects_lookahead_limit(hass, enable_custom_integr
     assert expanded_window.end == base + timedelta(hours=24)
 
 
-def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrations, monkeypatch) -> None:
+@pytest.mark.asyncio
+async def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrations, monkeypatch) -> None:
     coordinator = _coordinator(hass)
     base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
     now = base
@@ -649,7 +1609,7 @@ def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrati
             "narration": {},
         }
     )
-    coordinator._rebuild_cheapest_windows_from_cached_data()
+    coordinator._rebuild_windows_from_cached_data()
 
     meta = coordinator.data["price"]["cheapest_windows_meta"]
     limit_default = coordinator._cheapest_window_lookahead_limit(now)
@@ -667,6 +1627,7 @@ def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrati
     monkeypatch.setattr(coordinator, "async_update_listeners", _capture_update)
 
     coordinator.set_cheapest_window_lookahead_hours(100)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_lookahead_hours == 100
     assert updates == 1
     limit_100 = coordinator._cheapest_window_lookahead_limit(now)
@@ -677,6 +1638,7 @@ def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrati
     assert meta_mid["end_hour"] == coordinator.cheapest_window_end_hour
 
     coordinator.set_cheapest_window_lookahead_hours(200)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_lookahead_hours == 168
     assert updates == 2
     expected_limit = coordinator._cheapest_window_lookahead_limit(now)
@@ -692,6 +1654,7 @@ def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrati
         assert window.end <= expected_limit
 
     coordinator.set_cheapest_window_lookahead_hours(0)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_lookahead_hours == 1
     assert updates == 3
     meta_min = coordinator.data["price"]["cheapest_windows_meta"]
@@ -700,28 +1663,100 @@ def test_cheapest_windows_respect_shared_lookahead(hass, enable_custom_integrati
     assert meta_min["lookahead_limit"] == min_limit
 
     coordinator.set_cheapest_window_start_hour(5)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_start_hour == 5
     meta_start = coordinator.data["price"]["cheapest_windows_meta"]
     assert meta_start["start_hour"] == 5
     assert meta_start["end_hour"] == coordinator.cheapest_window_end_hour
 
     coordinator.set_cheapest_window_end_hour(30)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_end_hour == 23
     meta_end = coordinator.data["price"]["cheapest_windows_meta"]
     assert meta_end["end_hour"] == 23
 
     coordinator.set_cheapest_window_start_hour(-4)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_start_hour == 0
     meta_clamped = coordinator.data["price"]["cheapest_windows_meta"]
     assert meta_clamped["start_hour"] == 0
 
     coordinator.set_cheapest_window_end_hour(-4)
+    await hass.async_block_till_done()
     assert coordinator.cheapest_window_end_hour == 0
     meta_clamped_end = coordinator.data["price"]["cheapest_windows_meta"]
     assert meta_clamped_end["end_hour"] == 0
 
 
 
+@pytest.mark.asyncio
+async def test_setting_bursts_coalesce_into_one_rebuild(hass, enable_custom_integrations, monkeypatch) -> None:
+    coordinator = _coordinator(hass)
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(coordinator, "_current_time", lambda: base)
+    series = PriceSeries.from_points(
+        SeriesPoint(base + timedelta(hours=offset), float(offset % 24)) for offset in range(72)
+    )
+    coordinator.async_set_updated_data(
+        {
+            "price": {
+                "forecast": series,
+                "cheapest_windows": {},
+                "cheapest_windows_meta": {},
+                CUSTOM_WINDOW_KEY: coordinator._empty_custom_window_entry(),
+                "now": base,
+            },
+        }
+    )
+    scans: list[set[int | str]] = []
+    original = coordinator._find_cheapest_windows
+
+    def _counting(points, queries):
+        scans.append(set(queries))
+        return original(points, queries)
+
+    monkeypatch.setattr(coordinator, "_find_cheapest_windows", _counting)
+    updates = 0
+
+    def _listener() -> None:
+        nonlocal updates
+        updates += 1
+
+    unsub = coordinator.async_add_listener(_listener)
+    try:
+        coordinator.set_cheapest_window_start_hour(2)
+        coordinator.set_cheapest_window_end_hour(20)
+        coordinator.set_cheapest_window_lookahead_hours(48)
+        coordinator.set_custom_window_hours(2)
+        coordinator.set_custom_window_start_hour(10)
+        coordinator.set_extra_fees_cents(1.0)
+        assert scans == []
+        assert updates == 0
+
+        await hass.async_block_till_done()
+        assert scans == [{*CHEAPEST_WINDOW_HOURS, CUSTOM_WINDOW_KEY}]
+        assert updates == 1
+        price = coordinator.data["price"]
+        assert price["cheapest_windows_meta"]["start_hour"] == 2
+        assert price["cheapest_windows_meta"]["lookahead_hours"] == 48
+        assert price[CUSTOM_WINDOW_KEY]["window"].duration_hours == 2
+
+        coordinator.set_extra_fees_cents(2.0)
+        await hass.async_block_till_done()
+        assert len(scans) == 1
+        assert updates == 2
+
+        # A flush still pending at shutdown never runs.
+        coordinator.set_cheapest_window_start_hour(4)
+        await coordinator.async_shutdown()
+        await hass.async_block_till_done()
+        assert len(scans) == 1
+        assert updates == 2
+        assert coordinator._settings_flush is None
+    finally:
+        unsub()
+
+
 def _coordinator(hass) -> NordpoolPredictCoordinator:
     return NordpoolPredictCoordinator(
         hass=hass,
@@ -743,6 +1778,498 @@ def test_find_cheapest_window_requires_hourly_sequence(hass, enable_custom_integ
     assert coordinator._find_cheapest_window(irregular_series, 3) is None
 
 
+def _reference_find_cheapest_window(
+    series: list[SeriesPoint],
+    hours: int,
+    earliest_start: datetime | None = None,
+    min_end: datetime | None = None,
+    max_end: datetime | None = None,
+    window_filter: Callable[[list[SeriesPoint]], bool] | None = None,
+) -> PriceWindow | None:
+    """Slice-per-candidate scan the prefix-sum engine replaced."""
+    if hours <= 0 or len(series) < hours:
+        return None
+    best_window: PriceWindow | None = None
+    for index in range(len(series) - hours + 1):
+        window_points = series[index : index + hours]
+        if any(
+            current.datetime - previous.datetime != timedelta(hours=1)
+            for previous, current in zip(window_points, window_points[1:])
+        ):
+            continue
+        if window_filter and not window_filter(window_points):
+            continue
+        start_time = window_points[0].datetime
+        if earliest_start and start_time < earliest_start:
+            continue
+        end_time = window_points[-1].datetime + timedelta(hours=1)
+        if min_end and end_time <= min_end:
+            continue
+        if max_end and end_time > max_end:
+            continue
+        average = sum(point.value for point in window_points) / hours
+        if best_window is None or average < best_window.average:
+            best_window = PriceWindow(
+                duration_hours=hours,
+                start=start_time,
+                end=end_time,
+                average=average,
+                points=window_points,
+            )
+    return best_window
+
+
+def _random_series(rng: random.Random, base: datetime, length: int) -> list[SeriesPoint]:
+    series: list[SeriesPoint] = []
+    cursor = base
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.03:
+            cursor += timedelta(hours=rng.choice((2, 3)))
+        elif roll < 0.04:
+            cursor += timedelta(minutes=30)
+        # Coarse values force exact ties; fine values exercise float rounding.
+        value = float(rng.randint(0, 6)) if rng.random() < 0.5 else rng.uniform(-5.0, 40.0)
+        series.append(SeriesPoint(datetime=cursor, value=round(value, rng.choice((1, 3, 7)))))
+        cursor += timedelta(hours=1)
+    return series
+
+
+@pytest.mark.parametrize(
+    "base",
+    [
+        datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc),
+        # Helsinki spring-forward (2024-03-31) and fall-back (2024-10-27) inside the span.
+        datetime(2024, 3, 28, 22, 0, tzinfo=timezone.utc),
+        datetime(2024, 10, 24, 21, 0, tzinfo=timezone.utc),
+    ],
+    ids=["winter", "spring_forward", "fall_back"],
+)
+def test_find_cheapest_window_matches_reference_scan(
+    hass, enable_custom_integrations, base
+) -> None:
+    coordinator = _coordinator(hass)
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    rng = random.Random(base.toordinal())
+
+    for _ in range(60):
+        series = _random_series(rng, base, rng.randint(0, 200))
+        now = base + timedelta(hours=rng.randint(0, 60), minutes=rng.choice((0, 17, 59)))
+        anchor = now.replace(minute=0, second=0, microsecond=0)
+        start_hour, end_hour = rng.randint(0, 23), rng.randint(0, 23)
+        window_filter = coordinator._build_start_hour_filter(
+            coordinator._mask_hours(start_hour, end_hour),
+            helsinki_tz,
+        )
+        max_end = anchor.astimezone(helsinki_tz) + timedelta(hours=rng.randint(1, 168))
+        for hours in (1, 3, 4, 6, 12, 24):
+            for kwargs in (
+                {},
+                {"earliest_start": anchor - timedelta(hours=hours - 1), "max_end": max_end},
+                {
+                    "earliest_start": anchor - timedelta(hours=hours - 1),
+                    "min_end": now,
+                    "max_end": max_end,
+                    "window_filter": window_filter,
+                },
+            ):
+                expected = _reference_find_cheapest_window(series, hours, **kwargs)
+                assert coordinator._find_cheapest_window(series, hours, **kwargs) == expected
+
+
+def _reference_window_with_fallback(
+    series: list[SeriesPoint],
+    hours: int,
+    now: datetime,
+    max_end: datetime | None,
+    window_filter: Callable[[list[SeriesPoint]], bool] | None,
+) -> PriceWindow | None:
+    earliest_start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=hours - 1)
+    window = _reference_find_cheapest_window(
+        series,
+        hours,
+        earliest_start=earliest_start,
+        min_end=now,
+        max_end=max_end,
+        window_filter=window_filter,
+    )
+    if window is None:
+        window = _reference_find_cheapest_window(
+            series,
+            hours,
+            earliest_start=earliest_start,
+            max_end=max_end,
+            window_filter=window_filter,
+        )
+    return window
+
+
+def test_resolve_windows_matches_per_duration_scans(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    base = datetime(2024, 3, 28, 22, 0, tzinfo=timezone.utc)
+    rng = random.Random(2024)
+
+    for _ in range(40):
+        series = _random_series(rng, base, rng.randint(0, 200))
+        now = base + timedelta(hours=rng.randint(0, 60), minutes=rng.choice((0, 17, 59)))
+        coordinator._cheapest_window_start_hour = rng.randint(0, 23)
+        coordinator._cheapest_window_end_hour = rng.randint(0, 23)
+        coordinator._cheapest_window_lookahead_hours = rng.randint(1, 168)
+        coordinator._custom_window_hours = rng.randint(1, 24)
+        coordinator._custom_window_start_hour = rng.randint(0, 23)
+        coordinator._custom_window_end_hour = rng.randint(0, 23)
+        coordinator._custom_window_lookahead_hours = rng.randint(1, 168)
+
+        cheapest_windows, custom_window = coordinator._resolve_windows(series, now, helsinki_tz)
+
+        cheapest_filter = coordinator._build_start_hour_filter(
+            coordinator._mask_hours(
+                coordinator._cheapest_window_start_hour,
+                coordinator._cheapest_window_end_hour,
+            ),
+            helsinki_tz,
+        )
+        for hours in CHEAPEST_WINDOW_HOURS:
+            assert cheapest_windows[hours] == _reference_window_with_fallback(
+                series,
+                hours,
+                now,
+                coordinator._cheapest_window_lookahead_limit(now),
+                cheapest_filter,
+            )
+        custom_filter = coordinator._build_start_hour_filter(
+            coordinator._mask_hours(
+                coordinator._custom_window_start_hour,
+                coordinator._custom_window_end_hour,
+            ),
+            helsinki_tz,
+        )
+        assert custom_window == _reference_window_with_fallback(
+            series,
+            coordinator._custom_window_hours,
+            now,
+            coordinator._custom_window_lookahead_limit(now),
+            custom_filter,
+        )
+        assert custom_window == coordinator._find_custom_window(series, now, helsinki_tz)
+
+
+@pytest.mark.parametrize("deadline_time", [time(7, 0), time(0, 0), time(3, 30)])
+def test_deadline_windows_match_per_deadline_scans(
+    hass, enable_custom_integrations, deadline_time
+) -> None:
+    coordinator = _coordinator(hass)
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    rng = random.Random(deadline_time.hour * 60 + deadline_time.minute)
+
+    for base in (
+        datetime(2024, 3, 28, 22, 0, tzinfo=timezone.utc),
+        datetime(2024, 10, 24, 21, 0, tzinfo=timezone.utc),
+    ):
+        for _ in range(30):
+            series = _random_series(rng, base, rng.randint(0, 200))
+            now = base + timedelta(hours=rng.randint(0, 60), minutes=rng.choice((0, 17, 59)))
+            hours = rng.choice((1, 2, 4, 8))
+
+            resolved = coordinator._resolve_deadline_windows(series, now, hours, deadline_time)
+
+            expected: list[tuple[datetime, PriceWindow | None]] = []
+            if series:
+                series_end = series[-1].datetime + timedelta(hours=1)
+                day = now.astimezone(helsinki_tz).date() - timedelta(days=1)
+                previous = None
+                while True:
+                    deadline = datetime.combine(day, deadline_time, tzinfo=helsinki_tz).astimezone(
+                        timezone.utc
+                    )
+                    day += timedelta(days=1)
+                    if deadline <= now:
+                        previous = deadline
+                        continue
+                    if deadline > series_end:
+                        break
+                    window = _reference_find_cheapest_window(
+                        series,
+                        hours,
+                        earliest_start=previous,
+                        min_end=now if not expected else None,
+                        max_end=deadline,
+                    )
+                    expected.append((deadline, window))
+                    previous = deadline
+            assert [(entry.deadline, entry.window) for entry in resolved] == expected
+            for (_, earlier), (_, later) in zip(expected, expected[1:]):
+                assert earlier is None or later is None or earlier.end <= later.start
+
+
+@pytest.mark.asyncio
+async def test_started_deadline_window_holds_until_its_deadline(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    base_url = "https://example.com/deploy"
+    forecast_start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    # 02-05 Helsinki is cheapest before 07:00; 03-06 only wins once 02-05 has ended.
+    prices = [1.0, 1.0, 1.0, 2.0, 2.0] + [10.0] * 91
+    forecast = [
+        [(forecast_start + timedelta(hours=offset)).timestamp() * 1000, price]
+        for offset, price in enumerate(prices)
+    ]
+    session = _MockSession(
+        {
+            f"{base_url}/prediction.json": forecast,
+            f"{base_url}/windpower.json": [],
+            f"{base_url}/narration.md": "Example",
+            f"{base_url}/narration_en.md": "Example EN",
+            "sahkotin": "timestamp,price\n",
+        }
+    )
+    monkeypatch.setattr(
+        "custom_components.nordpool_predict_fi.coordinator.async_get_clientsession",
+        lambda hass: session,
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url=base_url,
+        update_interval=timedelta(hours=6),
+        deadline_hours=3,
+    )
+    clock = {"now": datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc)}
+    monkeypatch.setattr(coordinator, "_current_time", lambda: clock["now"])
+    deadline = datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
+
+    await coordinator.async_refresh()
+    first = coordinator.data["price"]["deadline_windows"][0]
+    assert first.deadline == deadline
+    assert first.window.start == forecast_start
+
+    # 05:00 Helsinki: the window has ended but its deadline is still ahead.
+    for hour in (3, 4):
+        clock["now"] = datetime(2024, 1, 1, hour, 0, tzinfo=timezone.utc)
+        coordinator._async_clock_tick(clock["now"])
+        assert coordinator.data["price"]["deadline_windows"][0] == first
+
+    clock["now"] = deadline
+    coordinator._async_clock_tick(clock["now"])
+    following = coordinator.data["price"]["deadline_windows"][0]
+    assert following.deadline == deadline + timedelta(days=1)
+    assert following.window.start >= deadline
+    await coordinator.async_shutdown()
+
+
+def test_start_hour_mask_compiles_once_per_series(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    # Spans the Helsinki spring-forward night, where local 03:00 does not exist.
+    base = datetime(2024, 3, 30, 22, 0, tzinfo=timezone.utc)
+    series = [SeriesPoint(base + timedelta(hours=offset), float(offset % 7)) for offset in range(48)]
+
+    night = coordinator._build_start_hour_filter(coordinator._mask_hours(3, 3), helsinki_tz)
+    assert coordinator._find_cheapest_window(series, 1, window_filter=night) is not None
+    index = coordinator._window_index
+    local_hours = index.local_hours
+    assert list(local_hours[:6]) == [0, 1, 2, 4, 5, 6]
+
+    evening = coordinator._build_start_hour_filter(coordinator._mask_hours(18, 21), helsinki_tz)
+    window = coordinator._find_cheapest_window(series, 2, window_filter=evening)
+    assert window is not None
+    assert window.start.astimezone(helsinki_tz).hour in range(18, 22)
+    assert coordinator._window_index is index
+    assert index.local_hours is local_hours
+    assert set(index.start_masks) == {night.hours, evening.hours}
+
+
+@pytest.mark.asyncio
+async def test_realized_series_fetches_incrementally_and_persists(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    helsinki = ZoneInfo("Europe/Helsinki")
+    day_start = datetime(2024, 1, 1, 0, 0, tzinfo=helsinki).astimezone(timezone.utc)
+    end = day_start + timedelta(days=2)
+    published = [SeriesPoint(day_start + timedelta(hours=offset), 10.0 + offset) for offset in range(24)]
+    requests: list[tuple[datetime, datetime]] = []
+
+    async def _mock_fetch_sahkotin(self, session, start, end):
+        requests.append((start, end))
+        return [point for point in published if start <= point.datetime <= end]
+
+    monkeypatch.setattr(
+        NordpoolPredictCoordinator,
+        "_safe_fetch_sahkotin_series",
+        _mock_fetch_sahkotin,
+    )
+    coordinator = _coordinator(hass)
+
+    morning = datetime(2024, 1, 1, 9, 0, tzinfo=helsinki)
+    first = await coordinator._async_realized_series(None, day_start, end, morning)
+    assert requests[-1][0] == day_start
+    assert [point.value for point in first] == [point.value for point in published]
+
+    second = await coordinator._async_realized_series(None, day_start, end, morning)
+    assert requests[-1][0] == published[-1].datetime + timedelta(hours=1)
+    assert second is first
+
+    # While tomorrow's auction result is due the whole day is requested again.
+    published[3] = SeriesPoint(published[3].datetime, 99.0)
+    afternoon = datetime(2024, 1, 1, 14, 0, tzinfo=helsinki)
+    revised = await coordinator._async_realized_series(None, day_start, end, afternoon)
+    assert requests[-1][0] == day_start
+    assert revised[3].value == 99.0
+
+    restored = _coordinator(hass)
+    restored_series = await restored._async_realized_series(None, day_start, end, morning)
+    assert requests[-1][0] == published[-1].datetime + timedelta(hours=1)
+    assert restored_series == revised
+
+
+def test_price_series_slices_share_storage(hass, enable_custom_integrations) -> None:
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    points = [SeriesPoint(base + timedelta(hours=offset), offset * 1.5) for offset in range(48)]
+    series = PriceSeries.from_points(points)
+
+    assert series == points
+    assert series[-1] == points[-1]
+    assert list(series[10:14]) == points[10:14]
+    view = series[10:14]
+    assert isinstance(view, PriceSeries)
+    assert view._epochs is series._epochs
+    assert view[1:3] == points[11:13]
+    assert series.bisect_left(base + timedelta(hours=5)) == 5
+    assert series.bisect_right(base + timedelta(hours=5)) == 6
+    assert series.bisect_left(base + timedelta(hours=5, minutes=30)) == 6
+    assert view.bisect_left(base) == 0
+    assert view.bisect_left(base + timedelta(hours=12)) == 2
+    assert PriceSeries.concat(points[:2], series[2:]) == series
+
+    coordinator = _coordinator(hass)
+    window = coordinator._find_cheapest_window(series, 3)
+    assert window is not None
+    assert isinstance(window.points, PriceSeries)
+    assert window.points._values is series._values
+    assert list(window.points) == points[:3]
+
+    helsinki_tz = coordinator._get_helsinki_timezone()
+    daily = coordinator._calculate_daily_averages(series, helsinki_tz)
+    assert [item.date.isoformat() for item in daily] == ["2024-01-02"]
+    assert daily[0].points._epochs is series._epochs
+    assert daily[0].points == points[22:46]
+
+
+@pytest.mark.parametrize("columnar", [False, True], ids=["list", "price_series"])
+def test_series_time_index_queries(hass, enable_custom_integrations, columnar: bool) -> None:
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    offsets = [0, 1, 2, 3, 5, 6, 7]  # 04:00 missing
+    points = [SeriesPoint(base + timedelta(hours=offset), float(offset)) for offset in offsets]
+    index = SeriesTimeIndex(PriceSeries.from_points(points) if columnar else points)
+
+    assert index.at_or_before(base - timedelta(minutes=1)) is None
+    assert index.at_or_before(base + timedelta(hours=2, minutes=59)) == points[2]
+    assert index.at_or_before(base + timedelta(hours=4, minutes=30)) == points[3]
+    assert index.at_or_after(base + timedelta(hours=3, minutes=1)) == points[4]
+    assert index.at_or_after(base + timedelta(hours=8)) is None
+    assert list(index.contiguous_run(base + timedelta(hours=1), 3)) == points[1:4]
+    assert index.contiguous_run(base + timedelta(hours=2), 3) is None
+    assert index.contiguous_run(base + timedelta(hours=5), 4) is None
+    assert index.contiguous_run(base + timedelta(minutes=30), 1) is None
+
+    assert index.hourly_average(base + timedelta(hours=1), 3) == pytest.approx(2.0)
+    assert index.hourly_average(base + timedelta(hours=1), 3) == pytest.approx(2.0)
+    assert index.hourly_average(base + timedelta(hours=5), 3) == pytest.approx(6.0)
+    assert index.hourly_average(base + timedelta(hours=2), 3) is None
+    assert index.hourly_average(base + timedelta(hours=5), 4) is None
+    assert index.hourly_average(base + timedelta(minutes=30), 1) is None
+    for start in range(8):
+        for hours in range(1, 5):
+            run = index.contiguous_run(base + timedelta(hours=start), hours)
+            expected = sum(point.value for point in run) / hours if run is not None else None
+            assert index.hourly_average(base + timedelta(hours=start), hours) == pytest.approx(expected)
+
+
+def test_coordinator_time_index_is_shared_per_series(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    series = PriceSeries.from_points(
+        SeriesPoint(base + timedelta(hours=offset), float(offset)) for offset in range(6)
+    )
+    coordinator.async_set_updated_data({"price": {"forecast": series}})
+
+    index = coordinator.time_index("price")
+    assert coordinator.time_index("price") is index
+    assert index.series is series
+    assert len(coordinator.time_index("windpower")) == 0
+
+    replacement = series[2:]
+    coordinator.async_set_updated_data({"price": {"forecast": replacement}})
+    assert coordinator.time_index("price") is not index
+    assert coordinator.time_index("price").series is replacement
+
+
+def test_serialized_points_are_shared_and_fee_aware(hass, enable_custom_integrations) -> None:
+    coordinator = _coordinator(hass)
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    series = PriceSeries.from_points(
+        SeriesPoint(base + timedelta(hours=offset), offset + 0.26) for offset in range(4)
+    )
+    coordinator.async_set_updated_data({"price": {"forecast": series}})
+
+    rows = coordinator.serialized_points(series, decimals=1, offset=1.0)
+    assert rows == [
+        {"timestamp": (base + timedelta(hours=offset)).isoformat(), "value": round(offset + 1.26, 1)}
+        for offset in range(4)
+    ]
+    assert coordinator.serialized_points(series, decimals=1, offset=1.0) is rows
+
+    window = series[1:3]
+    window_rows = coordinator.serialized_points(window, decimals=1, offset=1.0)
+    assert window_rows == rows[1:3]
+    assert window_rows[0]["timestamp"] is rows[1]["timestamp"]
+
+    refeed = coordinator.serialized_points(series, decimals=1, offset=2.0)
+    assert refeed is not rows
+    assert [row["value"] for row in refeed] == [round(offset + 2.26, 1) for offset in range(4)]
+    assert all(new["timestamp"] is old["timestamp"] for new, old in zip(refeed, rows))
+
+    whole = coordinator.serialized_points(series, decimals=0)
+    assert [row["value"] for row in whole] == [0, 1, 2, 3]
+
+    # A clock tick replaces the data but not the series; the rows survive it.
+    coordinator.async_set_updated_data({"price": {"forecast": series, "now": base}})
+    assert coordinator.serialized_points(series, decimals=1, offset=2.0) is refeed
+
+    revised = PriceSeries.from_points(
+        SeriesPoint(base + timedelta(hours=offset), offset + 0.5) for offset in range(4)
+    )
+    coordinator.async_set_updated_data({"price": {"forecast": revised}})
+    assert coordinator.serialized_points(series, decimals=1, offset=2.0) is not refeed
+
+
+def test_serialized_points_compact_encoding(hass, enable_custom_integrations) -> None:
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=timedelta(minutes=15),
+        compact_attributes=True,
+    )
+    base = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    points = [SeriesPoint(base + timedelta(hours=offset), offset + 0.26) for offset in (0, 1, 3)]
+    coordinator.async_set_updated_data({"price": {"forecast": points}})
+
+    encoded = coordinator.serialized_points(PriceSeries.from_points(points), decimals=1, offset=1.0)
+    assert encoded == {
+        "start": int(base.timestamp()),
+        "step": 3600,
+        "values": [1.3, 2.3, None, 4.3],
+    }
+    assert coordinator.serialized_points(points, decimals=0) == {
+        "start": int(base.timestamp()),
+        "step": 3600,
+        "values": [0, 1, None, 3],
+    }
+    assert coordinator.serialized_points([], decimals=1) == {"start": None, "step": 3600, "values": []}
+
+
 def test_parse_sahkotin_csv_filters_and_normalizes(hass, enable_custom_integrations) -> None:
     coordinator = _coordinator(hass)
     earliest = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
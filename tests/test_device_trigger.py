@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.nordpool_predict_fi import device_trigger
+from custom_components.nordpool_predict_fi.const import (
+    CONF_LEAD_MINUTES,
+    DATA_COORDINATOR,
+    DATA_WINDOW_LEADS,
+    DOMAIN,
+)
+from custom_components.nordpool_predict_fi.coordinator import NordpoolPredictCoordinator, PriceWindow
+
+
+@pytest.mark.asyncio
+async def test_device_trigger_fires_on_window_edge_with_lead(hass, enable_custom_integrations) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, unique_id=DOMAIN, title="Nordpool Predict FI", data={})
+    entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+    )
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id=entry.entry_id,
+        base_url="https://example.com/deploy",
+        update_interval=None,
+    )
+    window = PriceWindow(
+        duration_hours=6,
+        start=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 1, 18, 0, tzinfo=timezone.utc),
+        average=2.0,
+        points=[],
+    )
+    coordinator.async_set_updated_data({"price": {"cheapest_windows": {6: window}}})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_COORDINATOR: coordinator}
+
+    triggers = await device_trigger.async_get_triggers(hass, device.id)
+    assert len(triggers) == 8
+    assert await device_trigger.async_get_triggers(hass, "missing") == []
+
+    config = device_trigger.TRIGGER_SCHEMA(
+        {
+            "platform": "device",
+            "domain": DOMAIN,
+            "device_id": device.id,
+            "type": "window_start",
+            "subtype": "6h",
+            CONF_LEAD_MINUTES: 15,
+        }
+    )
+    calls: list[dict] = []
+
+    @callback
+    def _action(run_variables, context=None) -> None:
+        calls.append(run_variables["trigger"]["event"].data)
+
+    detach = await device_trigger.async_attach_trigger(
+        hass,
+        config,
+        _action,
+        {"domain": DOMAIN, "name": "test", "home_assistant_start": False, "variables": {}, "trigger_data": {}},
+    )
+    assert hass.data[DATA_WINDOW_LEADS][entry.entry_id] == {15: 1}
+
+    coordinator._window_events_until = window.start - timedelta(hours=1)
+    coordinator._fire_window_events(window.end)
+    await hass.async_block_till_done()
+    assert [(call["edge"], call["lead_minutes"]) for call in calls] == [("start", 15)]
+
+    detach()
+    assert hass.data[DATA_WINDOW_LEADS][entry.entry_id] == {}
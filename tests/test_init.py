@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import time, timedelta
 from types import SimpleNamespace
 
 import pytest
@@ -8,11 +8,25 @@ import pytest
 from custom_components.nordpool_predict_fi import _runtime_entry_config
 from custom_components.nordpool_predict_fi.const import (
     CONF_BASE_URL,
+    CONF_CALENDAR_DAILY_HOURS,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEADLINE_HOURS,
+    CONF_DEADLINE_TIME,
     CONF_EXTRA_FEES,
+    CONF_MAX_STALENESS,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
     CONF_UPDATE_INTERVAL,
     DEFAULT_BASE_URL,
+    DEFAULT_CALENDAR_DAILY_HOURS,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_DEADLINE_HOURS,
     DEFAULT_EXTRA_FEES_CENTS,
+    DEFAULT_MAX_STALENESS_HOURS,
+    DEFAULT_MIN_UPDATE_INTERVAL_MINUTES,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
+    MAX_CALENDAR_DAILY_HOURS,
+    MAX_DEADLINE_HOURS,
 )
 
 
@@ -44,6 +58,12 @@ def test_runtime_entry_config_prefers_options_over_data() -> None:
         },
         {
             CONF_UPDATE_INTERVAL: 10,
+            CONF_MIN_UPDATE_INTERVAL: timedelta(minutes=2),
+            CONF_MAX_STALENESS: 0,
+            CONF_REQUEST_TIMEOUT: 45,
+            CONF_CALENDAR_DAILY_HOURS: 99,
+            CONF_DEADLINE_HOURS: 99,
+            CONF_DEADLINE_TIME: "06:30",
         },
     )
 
@@ -51,6 +71,13 @@ def test_runtime_entry_config_prefers_options_over_data() -> None:
 
     assert result[CONF_BASE_URL] == "https://example.com/deploy"
     assert result[CONF_UPDATE_INTERVAL] == timedelta(minutes=10)
+    assert result[CONF_MIN_UPDATE_INTERVAL] == timedelta(minutes=2)
+    assert result[CONF_MAX_STALENESS] == timedelta(hours=1)
+    assert result[CONF_REQUEST_TIMEOUT] == timedelta(seconds=45)
+    assert result[CONF_CONNECT_TIMEOUT] == timedelta(seconds=DEFAULT_CONNECT_TIMEOUT_SECONDS)
+    assert result[CONF_CALENDAR_DAILY_HOURS] == MAX_CALENDAR_DAILY_HOURS
+    assert result[CONF_DEADLINE_HOURS] == MAX_DEADLINE_HOURS
+    assert result[CONF_DEADLINE_TIME] == time(6, 30)
     assert result[CONF_EXTRA_FEES] == DEFAULT_EXTRA_FEES_CENTS
 
 
@@ -68,6 +95,10 @@ def test_runtime_entry_config_handles_defaults(raw_base: str) -> None:
     expected_base = DEFAULT_BASE_URL if not raw_base.strip() else raw_base.strip().rstrip("/")
     assert result[CONF_BASE_URL] == expected_base
     assert result[CONF_UPDATE_INTERVAL] == timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+    assert result[CONF_MIN_UPDATE_INTERVAL] == timedelta(minutes=DEFAULT_MIN_UPDATE_INTERVAL_MINUTES)
+    assert result[CONF_CALENDAR_DAILY_HOURS] == DEFAULT_CALENDAR_DAILY_HOURS
+    assert result[CONF_DEADLINE_HOURS] == DEFAULT_DEADLINE_HOURS
+    assert result[CONF_DEADLINE_TIME] == time(7, 0)
     assert result[CONF_EXTRA_FEES] == DEFAULT_EXTRA_FEES_CENTS
 
 
@@ -82,3 +113,11 @@ def test_runtime_entry_config_parses_extra_fees() -> None:
     result = _runtime_entry_config(entry)
 
     assert result[CONF_EXTRA_FEES] == pytest.approx(5.5)
+
+
+def test_runtime_entry_config_falls_back_on_invalid_max_staleness() -> None:
+    entry = _entry({}, {CONF_MAX_STALENESS: "a day"})
+
+    result = _runtime_entry_config(entry)
+
+    assert result[CONF_MAX_STALENESS] == timedelta(hours=DEFAULT_MAX_STALENESS_HOURS)
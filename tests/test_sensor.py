@@ -6,6 +6,7 @@ from typing import Any
 from zoneinfo import ZoneInfo
 
 import pytest
+from homeassistant.components.sensor import SensorDeviceClass
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.nordpool_predict_fi import sensor
@@ -15,6 +16,9 @@ from custom_components.nordpool_predict_fi.const import (
     ATTR_CUSTOM_WINDOW_LOOKAHEAD_HOURS,
     ATTR_CUSTOM_WINDOW_LOOKAHEAD_LIMIT,
     ATTR_CUSTOM_WINDOW_START_HOUR,
+    ATTR_DATA_AGE,
+    ATTR_DEADLINE,
+    ATTR_DEADLINE_WINDOWS,
     ATTR_DAILY_AVERAGE_SPAN_END,
     ATTR_DAILY_AVERAGE_SPAN_START,
     ATTR_DAILY_AVERAGES,
@@ -26,7 +30,9 @@ from custom_components.nordpool_predict_fi.const import (
     ATTR_NARRATION_SUMMARY,
     ATTR_NEXT_VALID_FROM,
     ATTR_RAW_SOURCE,
+    ATTR_SNAPSHOT_AGE,
     ATTR_SOURCE_URL,
+    ATTR_STALE,
     ATTR_TIMESTAMP,
     ATTR_WIND_FORECAST,
     ATTR_WINDOW_DURATION,
@@ -46,6 +52,7 @@ from custom_components.nordpool_predict_fi.const import (
 )
 from custom_components.nordpool_predict_fi.coordinator import (
     DailyAverage,
+    DeadlineWindow,
     NordpoolPredictCoordinator,
     PriceWindow,
     SeriesPoint,
@@ -113,6 +120,7 @@ async def _setup_window_scenario(
     if custom_lookahead is not None:
         coordinator.set_custom_window_lookahead_hours(custom_lookahead)
     coordinator.set_custom_window_hours(custom_hours)
+    await hass.async_block_till_done()
 
     points = [
         SeriesPoint(datetime=local_dt.astimezone(timezone.utc), value=value)
@@ -296,6 +304,8 @@ async def test_async_setup_entry_registers_entities(hass, enable_custom_integrat
                 "forecast_start": forecast_start,
                 "now": now,
                 "daily_averages": [daily_average],
+                "window_edges": coordinator._window_edge_times(cheapest_windows, custom_window),
+                "next_day_boundary": coordinator._next_helsinki_midnight(now),
             },
             "windpower": {
                 "series": [
@@ -324,6 +334,8 @@ async def test_async_setup_entry_registers_entities(hass, enable_custom_integrat
         + 2  # NordpoolWindpowerSensor and NordpoolWindpowerNowSensor
         + 2 * len(CHEAPEST_WINDOW_HOURS)  # Cheapest window value + active sensors
         + 2  # Custom window value + active sensors
+        + 2 * (len(CHEAPEST_WINDOW_HOURS) + 1)  # Window start/end timestamp sensors
+        + 1  # Next day boundary sensor
         + len(NARRATION_LANGUAGES)  # Narration sensors
     )
     assert len(added) == expected_entity_count
@@ -349,11 +361,27 @@ async def test_async_setup_entry_registers_entities(hass, enable_custom_integrat
         sensor.NordpoolCheapestWindowActiveSensor,
         sensor.NordpoolCheapestCustomWindowSensor,
         sensor.NordpoolCheapestCustomWindowActiveSensor,
+        sensor.NordpoolWindowTimestampSensor,
+        sensor.NordpoolNextDayBoundarySensor,
         sensor.NordpoolNarrationSensor,
     )
     assert all(isinstance(entity, allowed_types) for entity in added)
     helsinki_tz = coordinator._get_helsinki_timezone()
 
+    timestamps = {
+        entity.unique_id.removeprefix(f"{entry.entry_id}_"): entity
+        for entity in added
+        if isinstance(entity, (sensor.NordpoolWindowTimestampSensor, sensor.NordpoolNextDayBoundarySensor))
+    }
+    assert timestamps["cheapest_3h_start"].native_value == cheapest_windows[3].start
+    assert timestamps["cheapest_12h_end"].native_value == cheapest_windows[12].end
+    assert timestamps["cheapest_custom_start"].native_value == custom_window.start
+    assert timestamps["cheapest_3h_start"].device_class == SensorDeviceClass.TIMESTAMP
+    assert timestamps["cheapest_3h_start"].extra_state_attributes is None
+    boundary = timestamps["next_day_boundary"].native_value
+    assert boundary > now
+    assert boundary.astimezone(helsinki_tz).hour == 0
+
     price = next(entity for entity in added if isinstance(entity, sensor.NordpoolPriceSensor))
     attrs = price.extra_state_attributes
     assert price.native_value == pytest.approx(round(current_point.value, 1))
@@ -361,7 +389,10 @@ async def test_async_setup_entry_registers_entities(hass, enable_custom_integrat
     assert attrs[ATTR_FORECAST_START] == forecast_start.isoformat()
     assert attrs[ATTR_RAW_SOURCE] == "https://example.com/deploy"
     assert attrs[ATTR_EXTRA_FEES] == pytest.approx(0.0)
+    assert attrs[ATTR_SNAPSHOT_AGE] is None
     assert ATTR_NEXT_VALID_FROM not in attrs
+    assert attrs[ATTR_STALE] is False
+    assert attrs[ATTR_DATA_AGE] is None
 
     price_now = next(entity for entity in added if isinstance(entity, sensor.NordpoolPriceNowSensor))
     price_now_attrs = price_now.extra_state_attributes
@@ -686,6 +717,44 @@ async def test_window_attributes_use_helsinki_offsets(
         assert attrs[ATTR_CUSTOM_WINDOW_LOOKAHEAD_LIMIT].endswith(expected_offset)
 
 
+@pytest.mark.asyncio
+async def test_sensors_write_state_only_when_their_inputs_change(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    now_utc = _helsinki_time(2024, 3, 1, 1, 30).astimezone(timezone.utc)
+    local_series = [(_helsinki_time(2024, 3, 1, hour), float(hour)) for hour in range(24)]
+    sensors = await _setup_window_scenario(hass, "sections", now_utc, local_series)
+    coordinator = sensors["coordinator"]
+    writes = {"shared": 0, "custom": 0}
+    for name in writes:
+        monkeypatch.setattr(
+            sensors[name],
+            "async_write_ha_state",
+            lambda name=name: writes.__setitem__(name, writes[name] + 1),
+        )
+
+    def notify() -> None:
+        for name in writes:
+            sensors[name]._handle_coordinator_update()
+
+    notify()
+    assert writes == {"shared": 1, "custom": 1}
+    coordinator.async_update_listeners()
+    notify()
+    assert writes == {"shared": 1, "custom": 1}
+
+    # Moving the custom mask re-renders the custom window only.
+    coordinator.set_custom_window_start_hour(12)
+    await hass.async_block_till_done()
+    notify()
+    assert writes == {"shared": 1, "custom": 2}
+
+    coordinator.set_extra_fees_cents(1.5)
+    await hass.async_block_till_done()
+    notify()
+    assert writes == {"shared": 2, "custom": 3}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("window_kind", ("shared", "custom"))
 async def test_window_active_handles_fallback_duplicate_hour(
@@ -1169,6 +1238,8 @@ async def test_async_setup_entry_handles_missing_wind_data(hass, enable_custom_i
         + 2  # wind sensors still registered
         + 2 * len(CHEAPEST_WINDOW_HOURS)
         + 2  # custom window value + active sensors
+        + 2 * (len(CHEAPEST_WINDOW_HOURS) + 1)  # window start/end timestamp sensors
+        + 1  # next day boundary sensor
         + len(NARRATION_LANGUAGES)
     )
 
@@ -1335,6 +1406,57 @@ async def test_async_setup_entry_handles_missing_wind_data(hass, enable_custom_i
         sensor.NordpoolCheapestWindowActiveSensor,
         sensor.NordpoolCheapestCustomWindowSensor,
         sensor.NordpoolCheapestCustomWindowActiveSensor,
+        sensor.NordpoolWindowTimestampSensor,
+        sensor.NordpoolNextDayBoundarySensor,
         sensor.NordpoolNarrationSensor,
     )
     assert all(isinstance(entity, allowed_types) for entity in added)
+
+
+@pytest.mark.asyncio
+async def test_deadline_window_sensors_follow_next_deadline(hass, enable_custom_integrations) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, unique_id=DOMAIN, title="Nordpool Predict FI", data={})
+    entry.add_to_hass(hass)
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id=entry.entry_id,
+        base_url="https://example.com/deploy",
+        update_interval=timedelta(minutes=15),
+        extra_fees_cents=0.5,
+        deadline_hours=2,
+    )
+    base = _helsinki_time(2024, 3, 2, 0).astimezone(timezone.utc)
+    now = base + timedelta(hours=4)
+    coordinator._current_time = lambda: now
+
+    def _window(start_hour: int, average: float) -> PriceWindow:
+        points = [_series_point(start_hour + offset, average, base) for offset in range(2)]
+        return PriceWindow(2, points[0].datetime, points[0].datetime + timedelta(hours=2), average, points)
+
+    deadline_windows = [
+        DeadlineWindow(deadline=base + timedelta(hours=7), window=None),
+        DeadlineWindow(deadline=base + timedelta(hours=31), window=_window(26, 2.0)),
+    ]
+    coordinator.async_set_updated_data({"price": {"deadline_windows": deadline_windows}})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {DATA_COORDINATOR: coordinator}
+
+    added: list = []
+    await sensor.async_setup_entry(hass, entry, added.extend)
+    value = next(entity for entity in added if isinstance(entity, sensor.NordpoolDeadlineWindowSensor))
+    active = next(entity for entity in added if isinstance(entity, sensor.NordpoolDeadlineWindowActiveSensor))
+
+    assert value.native_value == pytest.approx(2.5)
+    attrs = value.extra_state_attributes
+    assert attrs[ATTR_DEADLINE] == _helsinki_time(2024, 3, 3, 7).isoformat()
+    assert attrs[ATTR_WINDOW_START] == _helsinki_time(2024, 3, 3, 2).isoformat()
+    assert attrs[ATTR_WINDOW_DURATION] == 2
+    assert [item["average"] for item in attrs[ATTR_DEADLINE_WINDOWS]] == [None, 2.5]
+    assert active.native_value is False
+
+    coordinator._current_time = lambda: base + timedelta(hours=27)
+    assert active.native_value is True
+
+    coordinator._deadline_hours = 0
+    added.clear()
+    await sensor.async_setup_entry(hass, entry, added.extend)
+    assert not any(isinstance(entity, sensor.NordpoolDeadlineWindowSensor) for entity in added)
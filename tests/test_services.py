@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+
+from custom_components.nordpool_predict_fi.const import (
+    DATA_COORDINATOR,
+    DOMAIN,
+    SERVICE_FIND_CHEAPEST_WINDOW,
+    SERVICE_FIND_DEADLINE_WINDOWS,
+)
+from custom_components.nordpool_predict_fi.coordinator import NordpoolPredictCoordinator, SeriesPoint
+
+BASE = datetime(2024, 3, 1, 22, 0, tzinfo=timezone.utc)  # Helsinki midnight
+
+
+def _series(values: list[float]) -> list[SeriesPoint]:
+    return [SeriesPoint(BASE + timedelta(hours=hour), value) for hour, value in enumerate(values)]
+
+
+@pytest.mark.asyncio
+async def test_find_cheapest_window_service_returns_memoized_windows(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    assert await async_setup_component(hass, DOMAIN, {})
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_FIND_CHEAPEST_WINDOW, {"duration": 2}, blocking=True, return_response=True
+        )
+
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=None,
+        extra_fees_cents=1.0,
+    )
+    values = [10.0] * 48
+    values[3:5] = [1.0, 1.0]  # 03-05 Helsinki, the overall cheapest
+    values[14:16] = [2.0, 3.0]  # 14-16 Helsinki, cheapest starting 12-18
+    values[30:32] = [0.5, 0.5]  # next day 06-08
+    coordinator.async_set_updated_data({"price": {"forecast": _series(values)}})
+    monkeypatch.setattr(coordinator, "_current_time", lambda: BASE + timedelta(minutes=30))
+    hass.data[DOMAIN]["test"] = {DATA_COORDINATOR: coordinator}
+
+    searches = 0
+    original = coordinator._find_cheapest_windows
+
+    def _counting(series, queries):
+        nonlocal searches
+        searches += 1
+        return original(series, queries)
+
+    monkeypatch.setattr(coordinator, "_find_cheapest_windows", _counting)
+
+    async def _find(**data):
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_FIND_CHEAPEST_WINDOW, data, blocking=True, return_response=True
+        )
+        return response["window"]
+
+    window = await _find(duration=2, lookahead_hours=24)
+    assert window["start"] == (BASE + timedelta(hours=3)).isoformat()
+    assert window["average"] == pytest.approx(2.0)
+    assert [point["value"] for point in window["points"]] == [2.0, 2.0]
+
+    masked = await _find(duration=2, start_hour=12, end_hour=18, lookahead_hours=24)
+    assert masked["start"] == (BASE + timedelta(hours=14)).isoformat()
+    assert masked["end"] == (BASE + timedelta(hours=16)).isoformat()
+
+    assert (await _find(duration=2))["start"] == (BASE + timedelta(hours=30)).isoformat()
+    assert (await _find(duration=2, deadline=BASE + timedelta(hours=1))) is None
+    later = await _find(duration=2, earliest_start=BASE + timedelta(hours=5), lookahead_hours=24)
+    assert later["start"] == (BASE + timedelta(hours=14)).isoformat()
+    assert searches == 5
+
+    await _find(duration=2, start_hour=12, end_hour=18, lookahead_hours=24)
+    assert searches == 5
+
+    coordinator.async_set_updated_data({"price": {"forecast": _series([5.0] * 48)}})
+    refreshed = await _find(duration=2, start_hour=12, end_hour=18, lookahead_hours=24)
+    assert refreshed["average"] == pytest.approx(6.0)
+    assert searches == 6
+
+
+@pytest.mark.asyncio
+async def test_find_deadline_windows_service_returns_one_window_per_deadline(
+    hass, enable_custom_integrations, monkeypatch
+) -> None:
+    assert await async_setup_component(hass, DOMAIN, {})
+    coordinator = NordpoolPredictCoordinator(
+        hass=hass,
+        entry_id="test",
+        base_url="https://example.com/deploy",
+        update_interval=None,
+        extra_fees_cents=1.0,
+    )
+    values = [10.0] * 48
+    values[3:5] = [1.0, 1.0]  # 03-05 Helsinki, before the first 07:00
+    values[20:22] = [2.0, 2.0]  # 20-22 Helsinki, before the second 07:00
+    values[30:32] = [0.5, 0.5]  # ends 08:00, past the second deadline
+    coordinator.async_set_updated_data({"price": {"forecast": _series(values)}})
+    monkeypatch.setattr(coordinator, "_current_time", lambda: BASE + timedelta(minutes=30))
+    hass.data[DOMAIN]["test"] = {DATA_COORDINATOR: coordinator}
+
+    resolves = 0
+    original = coordinator._resolve_deadline_windows
+
+    def _counting(*args):
+        nonlocal resolves
+        resolves += 1
+        return original(*args)
+
+    monkeypatch.setattr(coordinator, "_resolve_deadline_windows", _counting)
+
+    async def _find(**data):
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_FIND_DEADLINE_WINDOWS, data, blocking=True, return_response=True
+        )
+        return response["windows"]
+
+    windows = await _find(duration=2)
+    assert [entry["deadline"] for entry in windows] == [
+        (BASE + timedelta(hours=7)).isoformat(),
+        (BASE + timedelta(hours=31)).isoformat(),
+    ]
+    assert [entry["window"]["start"] for entry in windows] == [
+        (BASE + timedelta(hours=3)).isoformat(),
+        (BASE + timedelta(hours=20)).isoformat(),
+    ]
+    assert windows[1]["window"]["average"] == pytest.approx(3.0)
+
+    early = await _find(duration=2, deadline_time="04:00")
+    assert early[0]["window"]["start"] == (BASE + timedelta(hours=2)).isoformat()
+    assert early[0]["window"]["average"] == pytest.approx(6.5)
+    assert early[1]["window"]["start"] == (BASE + timedelta(hours=20)).isoformat()
+    assert resolves == 2
+
+    await _find(duration=2)
+    assert resolves == 2